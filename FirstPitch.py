@@ -12,10 +12,11 @@ st.markdown("---")
 
 # Checkbox to include/exclude "ball" in success criteria
 include_ball = st.checkbox("Include 'Ball' as a Successful First Pitch?", value=True)
+leadoff_only = st.checkbox("Inning leadoff PAs only", value=False)
 
 # Refresh hot hitters
 if st.button("Refresh Hot Hitters"):
-    st.session_state.hot_hitters = get_hot_hitters(include_ball=include_ball)
+    st.session_state.hot_hitters = get_hot_hitters(include_ball=include_ball, leadoff=leadoff_only)
 
 # Display hot hitters if available
 if "hot_hitters" in st.session_state:
@@ -48,11 +49,11 @@ if os.path.exists(csv_path):
 else:
     st.caption("⚠️ No data file found yet.")
 
-# Button to run update_stats.py
-if st.button("🔁 Update All Stats (Run update_stats.py)"):
-    with st.spinner("Running update_stats.py..."):
-        exit_code = os.system("python update_stats.py")
+# Button to rebuild every stale data file (see build.py)
+if st.button("🔁 Update All Stats (Run build.py)"):
+    with st.spinner("Running build.py..."):
+        exit_code = os.system("python build.py")
         if exit_code == 0:
             st.success("✅ All stats updated successfully. You can now refresh Hot Hitters.")
         else:
-            st.error("❌ Failed to run update_stats.py. Make sure the file exists.")
+            st.error("❌ Failed to run build.py. Check the console for the failing step.")
@@ -1,26 +1,38 @@
 # active_pitchers.py
 
-from pybaseball import statcast, playerid_reverse_lookup
+from pybaseball import statcast
 from datetime import date
+import os
 import pandas as pd
+from pitch_store import list_partitions
+from stream_aggregates import stream_aggregate
+from player_registry import lookup_players
+from dataset_store import write_csv
 
-print("📊 Loading 2025 Statcast data (this may take a minute)...")
-start = "2025-03-20"
-end = date.today().strftime("%Y-%m-%d")
-df = statcast(start, end)
+partitions = list_partitions()
+if partitions:
+    # Every pitcher who faced a batter threw that batter a first pitch
+    print(f"📦 Streaming {len(partitions)} pitch store partitions...")
+    _, pitcher_sums = stream_aggregate(partitions, workers=os.cpu_count())
+    pitcher_ids = pitcher_sums.index.dropna().unique()
+else:
+    print("📊 Loading 2025 Statcast data (this may take a minute)...")
+    start = "2025-03-20"
+    end = date.today().strftime("%Y-%m-%d")
+    df = statcast(start, end)
 
-# Only keep rows where a pitch was thrown (to get pitchers)
-df = df[df["pitch_number"].notna()]
-pitcher_ids = df["pitcher"].dropna().unique()
+    # Only keep rows where a pitch was thrown (to get pitchers)
+    df = df[df["pitch_number"].notna()]
+    pitcher_ids = df["pitcher"].dropna().unique()
 
 print(f"👥 Found {len(pitcher_ids)} unique pitcher IDs")
 
 # Lookup names for those pitchers
 print("🔍 Looking up pitcher names...")
-id_map = playerid_reverse_lookup(pitcher_ids, key_type='mlbam')
+id_map = lookup_players(pitcher_ids)
 id_map["name"] = (id_map["name_first"] + " " + id_map["name_last"]).str.lower().str.strip()
 
 # Save to CSV
 pitcher_names = id_map[["key_mlbam", "name"]].drop_duplicates()
-pitcher_names.to_csv("active_pitchers_2025.csv", index=False)
+write_csv(pitcher_names, "active_pitchers_2025.csv")
 print("✅ Saved to active_pitchers_2025.csv")
@@ -0,0 +1,272 @@
+import os
+import sys
+import json
+import time
+import operator
+import numpy as np
+import pandas as pd
+from unidecode import unidecode
+from shared_data import shared_dataset
+
+RULES_FILE = "data/alert_rules.json"
+MATCHUP_FILE = "ai_targets.csv"
+PITCHER_FILE = "first_pitch_data_2025_cleaned.csv"
+STARTERS_FILE = "starting_pitchers.csv"
+
+# What a rule can test on each leadoff candidate (one per live game and side).
+# hot_tier: 0 not hot, 1 on the with-ball hot list, 2 on the stricter no-ball list.
+# pitcher_strike_pct is the opposing pitcher's first-pitch strike %, in percent.
+# score_margin is from the batting team's side.
+FIELDS = {
+    "target": "bool",
+    "locked": "bool",
+    "hot_tier": "number",
+    "hit_prob": "number",
+    "in_play_prob": "number",
+    "pitcher_strike_pct": "number",
+    "inning": "number",
+    "score_margin": "number",
+    "batter_hand": "text",
+}
+
+OPS = {
+    "==": operator.eq, "!=": operator.ne,
+    ">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le,
+    "in": None, "not in": None,
+}
+
+# Today's behavior: a target hitter is locked in to lead off the next inning
+DEFAULT_RULES = [
+    {
+        "name": "Target leading off",
+        "conditions": [
+            {"field": "target", "op": "==", "value": True},
+            {"field": "locked", "op": "==", "value": True},
+        ],
+    },
+]
+
+
+def load_rules(path=RULES_FILE):
+    if not os.path.exists(path):
+        return DEFAULT_RULES
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_rules(rules, path=RULES_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(rules, f, indent=2)
+    os.replace(tmp, path)
+
+
+# ---------- COMPILE ----------
+BOOL_STRINGS = {"true": True, "yes": True, "1": True, "false": False, "no": False, "0": False}
+
+
+def _bool(value):
+    # JSON edited by hand often says "false"; bool("false") would be True
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in BOOL_STRINGS:
+        return BOOL_STRINGS[value.strip().lower()]
+    raise ValueError(f"'{value}' is not true/false")
+
+
+def _condition(cond):
+    if not isinstance(cond, dict):
+        raise ValueError(f"condition must be an object, got {type(cond).__name__}")
+    field, op, value = cond.get("field"), cond.get("op", "=="), cond.get("value")
+    if field not in FIELDS:
+        raise ValueError(f"unknown field '{field}' (one of {', '.join(FIELDS)})")
+    if op not in OPS:
+        raise ValueError(f"unknown op '{op}' (one of {', '.join(OPS)})")
+
+    cast = {"number": float, "bool": _bool, "text": str}[FIELDS[field]]
+    if op in ("in", "not in"):
+        value = np.array([cast(v) for v in (value if isinstance(value, list) else [value])])
+    else:
+        value = cast(value)
+    return field, op, value
+
+
+def compile_rules(rules):
+    # Conditions from every rule are grouped by (field, op) so each group is one
+    # broadcast compare per cycle; `members` maps a group's rows back onto rules.
+    # Disabled rules are dropped, bad ones raise ValueError.
+    if not isinstance(rules, list):
+        raise ValueError(f"rules must be a list of rule objects, got {type(rules).__name__}")
+    names, needed = [], []
+    comparisons, memberships = {}, []
+    for i, rule in enumerate(rules):
+        if not isinstance(rule, dict):
+            raise ValueError(f"rule {i + 1} must be an object, got {type(rule).__name__}")
+        if not rule.get("enabled", True):
+            continue
+        name = rule.get("name") or f"rule {i + 1}"
+        try:
+            conditions = rule.get("conditions", [])
+            if not isinstance(conditions, list):
+                raise ValueError("conditions must be a list")
+            conditions = [_condition(c) for c in conditions]
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"{name}: {e}")
+
+        r = len(names)
+        names.append(name)
+        needed.append(len(conditions))
+        for field, op, value in conditions:
+            if op in ("in", "not in"):
+                memberships.append((field, op == "not in", r, value))
+            else:
+                comparisons.setdefault((field, op), []).append((r, value))
+
+    groups = []
+    for (field, op), entries in comparisons.items():
+        members = np.zeros((len(names), len(entries)), dtype=np.float32)
+        members[[r for r, _ in entries], np.arange(len(entries))] = 1
+        groups.append((field, OPS[op], np.array([v for _, v in entries]), members))
+    return {"names": names, "needed": np.array(needed), "groups": groups, "memberships": memberships}
+
+
+# ---------- EVALUATE ----------
+def candidate_columns(candidates):
+    # One array per field across every candidate; missing numbers are NaN and never match
+    columns = {}
+    for field, kind in FIELDS.items():
+        values = [c.get(field) for c in candidates]
+        if kind == "number":
+            columns[field] = np.array([np.nan if v is None else v for v in values], dtype=float)
+        elif kind == "bool":
+            columns[field] = np.array([bool(v) for v in values], dtype=bool)
+        else:
+            columns[field] = np.array(["" if v is None else str(v) for v in values], dtype=str)
+    return columns
+
+
+def evaluate_rules(compiled, candidates):
+    # Names of the rules that fired for each candidate, in rule order. A rule
+    # fires when every one of its conditions holds; one with none always fires.
+    names = compiled["names"]
+    if not candidates or not names:
+        return [[] for _ in candidates]
+
+    columns = candidate_columns(candidates)
+    satisfied = np.zeros((len(names), len(candidates)), dtype=np.float32)
+    for field, op, values, members in compiled["groups"]:
+        satisfied += members @ op(columns[field][None, :], values[:, None])
+    for field, negate, r, values in compiled["memberships"]:
+        column = columns[field]
+        hit = (column[:, None] == values[None, :]).any(axis=1) != negate
+        if FIELDS[field] == "number":
+            hit &= ~np.isnan(column)
+        satisfied[r] += hit
+
+    fired = satisfied >= compiled["needed"][:, None]
+    return [[names[i] for i in np.flatnonzero(fired[:, j])] for j in range(len(candidates))]
+
+
+def compiled_rules(path=RULES_FILE):
+    # Compiled once per version of the rules file and shared by every session
+    return shared_dataset(f"alert_rules:{path}", [path], lambda: compile_rules(load_rules(path)))
+
+
+# ---------- CONTEXT ----------
+def _normalize(name):
+    return unidecode(str(name)).lower().strip().replace("\xa0", " ")
+
+
+def matchup_scores(path=MATCHUP_FILE):
+    # {normalized player: (Hit_Prob, InPlay_Prob, BatterHand)} from today's slate scoring
+    def load():
+        df = pd.read_csv(path)
+        if "Hit_Prob" not in df.columns:
+            return {}
+        hands = df["BatterHand"] if "BatterHand" in df.columns else pd.Series("", index=df.index)
+        return {
+            _normalize(player): (hit, in_play, hand if isinstance(hand, str) else None)
+            for player, hit, in_play, hand in zip(df["Player"], df["Hit_Prob"], df["InPlay_Prob"], hands)
+        }
+    return shared_dataset(f"matchup_scores:{path}", [path], load)
+
+
+def pitcher_strike_pcts(pitcher_file=PITCHER_FILE, starters_file=STARTERS_FILE):
+    # First-pitch strike % (in percent) by MLBAM id from the season table, and by
+    # normalized name from the probable starters sheet for pitchers it lacks
+    def load():
+        by_id, by_name = {}, {}
+        if os.path.exists(starters_file):
+            df = pd.read_csv(starters_file).dropna(subset=["FStrike%"])
+            by_name = dict(zip(df["Pitcher"].map(_normalize), df["FStrike%"].astype(float)))
+        if os.path.exists(pitcher_file):
+            df = pd.read_csv(pitcher_file, usecols=["player_id", "player_name", "First Pitch Strike %"]).dropna()
+            by_id = dict(zip(df["player_id"].astype(int), df["First Pitch Strike %"] * 100))
+            by_name.update(zip(df["player_name"].map(_normalize), df["First Pitch Strike %"] * 100))
+        return {"ids": by_id, "names": by_name}
+    return shared_dataset("pitcher_strike_pcts", [pitcher_file, starters_file], load)
+
+
+def pitcher_strike_pct(pcts, pitcher_id=None, pitcher_name=None):
+    if pitcher_id in pcts["ids"]:
+        return pcts["ids"][pitcher_id]
+    return pcts["names"].get(_normalize(pitcher_name)) if pitcher_name else None
+
+
+# ---------- BENCHMARK ----------
+def _random_rules(rng, n):
+    templates = [
+        ("hot_tier", ">=", lambda: int(rng.integers(1, 3))),
+        ("hit_prob", ">=", lambda: round(float(rng.uniform(0.03, 0.08)), 3)),
+        ("pitcher_strike_pct", "<=", lambda: round(float(rng.uniform(50, 65)), 1)),
+        ("inning", "in", lambda: sorted(rng.choice(range(1, 10), 3, replace=False).tolist())),
+        ("score_margin", ">=", lambda: int(rng.integers(-3, 1))),
+        ("batter_hand", "==", lambda: str(rng.choice(["L", "R"]))),
+        ("locked", "==", lambda: True),
+    ]
+    rules = []
+    for i in range(n):
+        picks = rng.choice(len(templates), 3, replace=False)
+        rules.append({"name": f"rule {i}", "conditions": [
+            {"field": templates[k][0], "op": templates[k][1], "value": templates[k][2]()} for k in picks
+        ]})
+    return rules
+
+
+def _random_candidates(rng, n):
+    return [{
+        "target": bool(rng.random() < 0.2), "locked": bool(rng.random() < 0.5),
+        "hot_tier": int(rng.integers(0, 3)), "hit_prob": float(rng.uniform(0.02, 0.1)),
+        "in_play_prob": float(rng.uniform(0.05, 0.2)), "pitcher_strike_pct": float(rng.uniform(45, 70)),
+        "inning": int(rng.integers(2, 10)), "score_margin": int(rng.integers(-5, 6)),
+        "batter_hand": str(rng.choice(["L", "R", "S"])),
+    } for _ in range(n)]
+
+
+def benchmark(rules=48, games=15, repeats=2000):
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    compiled = compile_rules(_random_rules(rng, rules))
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    # Two candidates per game: one for each side's next leadoff
+    candidates = _random_candidates(rng, games * 2)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fired = evaluate_rules(compiled, candidates)
+    eval_ms = (time.perf_counter() - start) * 1000 / repeats
+    return compile_ms, eval_ms, sum(len(f) for f in fired)
+
+
+if __name__ == "__main__":
+    # python alert_rules.py [rules] [games]: time a batch evaluation; writes the default rules file if there is none
+    if not os.path.exists(RULES_FILE):
+        save_rules(DEFAULT_RULES)
+        print(f"✅ Wrote default rules to {RULES_FILE}")
+    rules = int(sys.argv[1]) if len(sys.argv) > 1 else 48
+    games = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    compile_ms, eval_ms, hits = benchmark(rules, games)
+    print(f"⏱️ {rules} rules x {games} games: compile {compile_ms:.2f}ms, evaluate {eval_ms:.3f}ms per cycle ({hits} rule hits)")
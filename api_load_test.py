@@ -0,0 +1,67 @@
+import sys
+import time
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from api_server import make_server, ENDPOINTS, HOST
+
+REQUESTS_PER_ROUTE = 2000
+CLIENTS = 8
+P99_BUDGET_MS = 10.0
+
+
+def _client_run(port, route, count, use_etag):
+    # One keep-alive connection per client, like a script polling the API
+    conn = http.client.HTTPConnection(HOST, port, timeout=5)
+    latencies = []
+    etag = None
+    for _ in range(count):
+        headers = {"If-None-Match": etag} if use_etag and etag else {}
+        start = time.perf_counter()
+        conn.request("GET", route, headers=headers)
+        resp = conn.getresponse()
+        resp.read()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if resp.status not in (200, 304):
+            raise RuntimeError(f"{route} returned {resp.status}")
+        etag = resp.getheader("ETag")
+    conn.close()
+    return latencies
+
+
+def load_test(port, routes, requests_per_route=REQUESTS_PER_ROUTE, clients=CLIENTS):
+    rows = []
+    for route in routes:
+        for use_etag in (False, True):
+            per_client = max(requests_per_route // clients, 1)
+            with ThreadPoolExecutor(max_workers=clients) as pool:
+                runs = pool.map(lambda _: _client_run(port, route, per_client, use_etag), range(clients))
+                latencies = np.concatenate([np.array(r) for r in runs])
+            rows.append({
+                "route": route,
+                "etag": use_etag,
+                "requests": len(latencies),
+                "p50_ms": np.percentile(latencies, 50),
+                "p95_ms": np.percentile(latencies, 95),
+                "p99_ms": np.percentile(latencies, 99),
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    # python api_load_test.py [port]; without a port an in-process server is started
+    if len(sys.argv) > 1:
+        port = int(sys.argv[1])
+    else:
+        server = make_server(port=0)
+        port = server.server_address[1]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(f"⏳ {REQUESTS_PER_ROUTE} requests per route from {CLIENTS} clients against port {port}...")
+    results = load_test(port, sorted(ENDPOINTS))
+
+    for r in results:
+        flag = "✅" if r["p99_ms"] <= P99_BUDGET_MS else "⚠️"
+        print(f"{flag} {r['route']:<24} etag={str(r['etag']):<5} "
+              f"p50 {r['p50_ms']:.2f}ms  p95 {r['p95_ms']:.2f}ms  p99 {r['p99_ms']:.2f}ms")
@@ -0,0 +1,116 @@
+import sys
+import json
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+import pandas as pd
+from data_cache import file_version
+from live_state import LIVE_STATE_FILE, load_live_state
+from slate_scoring import OUTPUT_FILE as MATCHUPS_FILE
+
+HOST = "127.0.0.1"
+PORT = 8502
+
+# Read-only JSON over the files the dashboard already produces. Each response
+# body is serialized once per file version and served from memory afterwards.
+
+
+def _read_table(path):
+    return json.loads(pd.read_csv(path).to_json(orient="records"))
+
+
+ENDPOINTS = {
+    "/hot-hitters/no-ball": ("data/hot_hitters_no_ball.csv", _read_table),
+    "/hot-hitters/with-ball": ("data/hot_hitters_with_ball.csv", _read_table),
+    "/hot-hitters/leadoff/no-ball": ("data/hot_hitters_leadoff_no_ball.csv", _read_table),
+    "/hot-hitters/leadoff/with-ball": ("data/hot_hitters_leadoff_with_ball.csv", _read_table),
+    "/pitchers": ("first_pitch_data_2025_cleaned.csv", _read_table),
+    "/matchups": (MATCHUPS_FILE, _read_table),
+    "/leadoff": (LIVE_STATE_FILE, load_live_state),
+}
+
+
+class ResponseCache:
+    def __init__(self, endpoints):
+        self.endpoints = endpoints
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def get(self, route):
+        # (body, etag) for a route, rebuilt only when its source file changes
+        path, loader = self.endpoints[route]
+        version = file_version(path)
+        entry = self.entries.get(route)
+        if entry and entry[0] == version:
+            return entry[1], entry[2]
+
+        with self.lock:
+            entry = self.entries.get(route)
+            if not entry or entry[0] != version:
+                payload = loader(path) if version[1] is not None else None
+                body = json.dumps({"source": path, "data": payload}).encode()
+                etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                entry = (version, body, etag)
+                self.entries[route] = entry
+        return entry[1], entry[2]
+
+
+def make_handler(cache):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out as separate writes; Nagle would hold the body for the client's delayed ACK
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            route = urlsplit(self.path).path.rstrip("/") or "/"
+            if route == "/":
+                return self._send(200, json.dumps({"endpoints": sorted(cache.endpoints)}).encode())
+            if route not in cache.endpoints:
+                return self._send(404, b'{"error": "not found"}')
+
+            try:
+                body, etag = cache.get(route)
+            except Exception as e:
+                return self._send(500, json.dumps({"error": str(e)}).encode())
+
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, b"", etag)
+            self._send(200, body, etag)
+
+        def _send(self, status, body, etag=None):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if etag:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def make_server(host=HOST, port=PORT, endpoints=ENDPOINTS):
+    cache = ResponseCache(endpoints)
+    # Warm every route so the first request doesn't pay for a CSV parse
+    for route in endpoints:
+        try:
+            cache.get(route)
+        except Exception as e:
+            print(f"⚠️ Could not load {route}: {e}")
+    return ThreadingHTTPServer((host, port), make_handler(cache))
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else PORT
+    server = make_server(port=port)
+    print(f"🌐 Serving {len(ENDPOINTS)} endpoints on http://{HOST}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
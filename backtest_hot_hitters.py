@@ -0,0 +1,164 @@
+import os
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from mlb_first_pitch import first_pitch_success
+from dataset_store import write_csv
+
+INPUT_FILE = "first_pitch_hitters_2025.csv"
+OUTPUT_FILE = "data/backtest_hot_hitters.csv"
+
+# Keys pack (batter, day) into one sortable int so every lookup is a searchsorted
+DAY_SPAN = 1 << 20
+
+DEFAULT_WINDOWS = range(5, 16)
+DEFAULT_LOOKBACKS = [7, 10, 14, 21, 30]
+
+# Rules currently in use by get_hot_hitters and refresh_hot_hitters.py
+NAMED_RULES = {
+    "get_hot_hitters (10 PAs, 8+ with ball)": dict(window=10, lookback_days=14, include_ball=True, min_pa=10, min_successes=8),
+    "get_hot_hitters (10 PAs, 4+ no ball)": dict(window=10, lookback_days=14, include_ball=False, min_pa=10, min_successes=4),
+    "refresh_hot_hitters (5 PAs, 3+ with ball)": dict(window=10, lookback_days=14, include_ball=True, min_pa=5, min_successes=3),
+    "refresh_hot_hitters (5 PAs, 3+ no ball)": dict(window=10, lookback_days=14, include_ball=False, min_pa=5, min_successes=3),
+}
+
+_state = {}
+
+
+# ---------- PREP ----------
+def prepare(df):
+    df = df[df["pitch_number"] == 1].copy()
+    df["game_date"] = pd.to_datetime(df["game_date"], errors="coerce")
+    df = df.dropna(subset=["game_date", "batter"])
+
+    no_ball, with_ball = first_pitch_success(df)
+    batter_codes, batters = pd.factorize(df["batter"])
+    day = df["game_date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+    day0 = day.min()
+    day = day - day0
+
+    order = np.lexsort((day, batter_codes))
+    keys = batter_codes[order].astype(np.int64) * DAY_SPAN + day[order]
+
+    return {
+        "keys": keys,
+        "cs_no_ball": np.concatenate([[0], np.cumsum(no_ball.to_numpy()[order], dtype=np.int64)]),
+        "cs_with_ball": np.concatenate([[0], np.cumsum(with_ball.to_numpy()[order], dtype=np.int64)]),
+        "n_batters": len(batters),
+        "days": np.unique(day),
+    }
+
+
+def _init_worker(state):
+    _state.update(state)
+
+
+def _grid_positions(state):
+    # One entry per (batter, scored day): index bounds into the sorted PA arrays
+    scored_days = state["days"][1:]
+    b = np.repeat(np.arange(state["n_batters"], dtype=np.int64), len(scored_days))
+    d = np.tile(scored_days, state["n_batters"])
+    base = b * DAY_SPAN
+    end = np.searchsorted(state["keys"], base + d, "left")
+    today_end = np.searchsorted(state["keys"], base + d, "right")
+    day_idx = np.tile(np.arange(len(scored_days)), state["n_batters"])
+    return base, d, end, today_end, day_idx, len(scored_days)
+
+
+# ---------- EVALUATION ----------
+def evaluate_group(window, lookback_days, include_ball, thresholds):
+    state = _state
+    base, d, end, today_end, day_idx, n_days = _grid_positions(state)
+    cs = state["cs_with_ball"] if include_ball else state["cs_no_ball"]
+    cs_in_play = state["cs_no_ball"]
+
+    # Last `window` first-pitch PAs inside the lookback, as of that morning. The
+    # refresh keeps game_date >= now - lookback_days; game dates are midnight and
+    # it runs after midnight, so day d - lookback_days itself is already out and
+    # the window is the lookback_days - 1 days before d
+    start = np.searchsorted(state["keys"], base + d - lookback_days + 1, "left")
+    total_pa = np.minimum(end - start, window)
+    successes = cs[end] - cs[end - total_pa]
+
+    # Same-day outcomes, scored with the rule's own success definition
+    n_today = today_end - end
+    s_today = cs[today_end] - cs[end]
+    ip_today = cs_in_play[today_end] - cs_in_play[end]
+    played = n_today > 0
+    baseline = s_today.sum() / max(n_today.sum(), 1)
+
+    rows = []
+    for min_pa, min_successes in thresholds:
+        hot = (total_pa >= min_pa) & (successes >= min_successes)
+        picked = hot & played
+        pa = n_today[picked].sum()
+        hit_rate = s_today[picked].sum() / pa if pa else np.nan
+        day_picks = np.bincount(day_idx[picked], minlength=n_days)
+        rows.append({
+            "window": window,
+            "lookback_days": lookback_days,
+            "include_ball": include_ball,
+            "min_pa": min_pa,
+            "min_successes": min_successes,
+            "hit_rate": hit_rate,
+            "in_play_rate": ip_today[picked].sum() / pa if pa else np.nan,
+            "baseline": baseline,
+            "lift": hit_rate / baseline if pa and baseline else np.nan,
+            "picks": int(picked.sum()),
+            "pitches_scored": int(pa),
+            "avg_list_size": hot.sum() / n_days,
+            "coverage": (day_picks > 0).mean(),
+        })
+    return rows
+
+
+def parameter_groups(windows=DEFAULT_WINDOWS, lookbacks=DEFAULT_LOOKBACKS, include_ball=(True, False)):
+    groups = []
+    for window, lookback, ball in itertools.product(windows, lookbacks, include_ball):
+        thresholds = [
+            (min_pa, k)
+            for min_pa in range(1, window + 1)
+            for k in range(1, min_pa + 1)
+        ]
+        groups.append((window, lookback, ball, thresholds))
+    return groups
+
+
+def run_backtest(df, groups=None, workers=None):
+    state = prepare(df)
+    groups = groups or parameter_groups()
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        _init_worker(state)
+        results = [evaluate_group(*g) for g in groups]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(state,)) as pool:
+            results = list(pool.map(evaluate_group, *zip(*groups)))
+
+    table = pd.DataFrame([row for rows in results for row in rows])
+    return table.sort_values(["lift", "picks"], ascending=False).reset_index(drop=True)
+
+
+def named_rule_rows(table):
+    rows = []
+    for name, rule in NAMED_RULES.items():
+        mask = np.logical_and.reduce([table[k] == v for k, v in rule.items()])
+        rows.append(table[mask].assign(rule=name))
+    return pd.concat(rows)
+
+
+if __name__ == "__main__":
+    print("⏳ Backtesting hot-hitter criteria...")
+    df = pd.read_csv(INPUT_FILE)
+    table = run_backtest(df)
+
+    os.makedirs("data", exist_ok=True)
+    write_csv(table, OUTPUT_FILE)
+    print(f"✅ Evaluated {len(table)} parameter combinations → {OUTPUT_FILE}")
+
+    print("\n📊 Current rules:")
+    print(named_rule_rows(table)[["rule", "hit_rate", "lift", "picks", "coverage", "avg_list_size"]].to_string(index=False))
+    print("\n🔝 Top 10 by lift (20+ picks):")
+    print(table[table["picks"] >= 20].head(10).to_string(index=False))
@@ -0,0 +1,173 @@
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+from datetime import datetime
+import pandas as pd
+from synthetic_data import generate_pitches, generate_fp_logs, generate_name_lookup
+from leadoff_dataset import leadoff_pas, LEADOFF_HITTERS_FILE
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_FILE = os.path.join(REPO_DIR, "data", "benchmark_results.csv")
+DEFAULT_SCALES = [1, 10]
+
+# Flag a hot path when it runs this much slower than its previous result
+REGRESSION_THRESHOLD = 1.2
+
+# Pitch-level frames beyond this scale don't fit in memory; first pitches only
+FULL_PITCH_MAX_SCALE = 10
+
+
+def measure(fn):
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+
+    # Second run under tracemalloc so tracing overhead doesn't skew the timing
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1024 ** 2
+
+
+# ---------- BENCHMARKS ----------
+def bench_get_hot_hitters():
+    from mlb_first_pitch import get_hot_hitters
+    get_hot_hitters(include_ball=True)
+    get_hot_hitters(include_ball=False)
+
+
+def bench_refresh_hot_hitters():
+    from refresh_hot_hitters import refresh_hot_hitters
+    refresh_hot_hitters()
+    refresh_hot_hitters(leadoff=True)
+
+
+def bench_fetch_and_process_statcast(pitches):
+    import update_stats
+
+    def fetch():
+        # Fetch is stubbed so only the processing is timed
+        real_statcast = update_stats.statcast
+        update_stats.statcast = lambda start_dt=None, end_dt=None: pitches
+        try:
+            update_stats.fetch_and_process_statcast("2025-03-20", "2025-09-30")
+        finally:
+            update_stats.statcast = real_statcast
+    return fetch
+
+
+def bench_last_5_game_stats():
+    from generate_last5_fp_stats import calculate_last_5_game_stats
+    calculate_last_5_game_stats()
+
+
+def bench_trend_explorer(first_pitches, id_to_name):
+    from stream_aggregates import aggregate_first_pitches, batter_table, pitcher_table
+
+    def aggregate():
+        batter_sums, pitcher_sums = aggregate_first_pitches(first_pitches)
+        batter_table(batter_sums, id_to_name)
+        pitcher_table(pitcher_sums)
+    return aggregate
+
+
+def check_stream_matches(pitches):
+    # The streaming path (partitioned CSVs, chunked, two workers) must give the
+    # same frames as the in-memory aggregation of the same pitches
+    from pitch_store import save_pitch_partitions, list_partitions
+    from stream_aggregates import aggregate_first_pitches, stream_aggregate
+
+    # Its own store, so the timed steps don't start reading these partitions
+    with tempfile.TemporaryDirectory() as store:
+        partitions = save_pitch_partitions(pitches, store)
+        streamed = stream_aggregate(list_partitions(store), memory_limit_mb=1, workers=2)
+    in_memory = aggregate_first_pitches(pitches)
+    for label, got, expected in zip(("batter", "pitcher"), streamed, in_memory):
+        pd.testing.assert_frame_equal(got.sort_index(), expected.sort_index(), check_dtype=False, obj=f"{label} sums")
+    print(f"✅ stream_aggregate matches the in-memory path ({len(partitions)} partitions)")
+
+
+def registry_seed(pitches):
+    # Names match player_name_lookup.csv's "batter <id>" so both sources agree
+    frames = [
+        pd.DataFrame({"key_mlbam": pd.unique(pitches[role].dropna().astype("int64")), "name_first": role})
+        for role in ("batter", "pitcher")
+    ]
+    seed = pd.concat(frames).drop_duplicates("key_mlbam")
+    seed["name_last"] = seed["key_mlbam"].astype(str)
+    return seed
+
+
+def run_scale(scale):
+    pitches = generate_pitches(scale, first_pitch_only=scale > FULL_PITCH_MAX_SCALE)
+    first_pitches = pitches[pitches["pitch_number"] == 1]
+    lookup = generate_name_lookup()
+    id_to_name = dict(zip(lookup["key_mlbam"], lookup["full_name"]))
+
+    benches = [
+        ("get_hot_hitters", len(first_pitches), bench_get_hot_hitters),
+        ("refresh_hot_hitters", len(first_pitches), bench_refresh_hot_hitters),
+        ("fetch_and_process_statcast", len(pitches), bench_fetch_and_process_statcast(pitches)),
+        ("calculate_last_5_game_stats", None, bench_last_5_game_stats),
+        ("trend_explorer_aggregations", len(first_pitches), bench_trend_explorer(first_pitches, id_to_name)),
+    ]
+
+    rows = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            os.makedirs("data", exist_ok=True)
+            first_pitches.to_csv("first_pitch_hitters_2025.csv", index=False)
+            leadoff_pas(first_pitches).to_csv(LEADOFF_HITTERS_FILE, index=False)
+            lookup.to_csv("player_name_lookup.csv", index=False)
+            # Every synthetic id already registered, so no step times a Chadwick download
+            registry_seed(pitches).to_csv("data/player_registry.csv", index=False)
+            logs = generate_fp_logs(scale)
+            logs.to_csv("mlb_fp_logs.csv", index=False)
+            check_stream_matches(pitches)
+
+            for name, n_rows, fn in benches:
+                seconds, peak_mb = measure(fn)
+                rows.append({
+                    "Timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "Benchmark": name,
+                    "Scale": scale,
+                    "Rows": n_rows if n_rows is not None else len(logs),
+                    "Seconds": round(seconds, 4),
+                    "PeakMB": round(peak_mb, 1),
+                })
+                print(f"⏱️ {name} @ {scale}x: {seconds:.3f}s, peak {peak_mb:.1f} MB")
+        finally:
+            os.chdir(cwd)
+    return rows
+
+
+def report_regressions(previous, current):
+    if previous.empty:
+        return
+    last = previous.groupby(["Benchmark", "Scale"])["Seconds"].last()
+    for _, row in current.iterrows():
+        before = last.get((row["Benchmark"], row["Scale"]))
+        if before and row["Seconds"] > before * REGRESSION_THRESHOLD:
+            print(f"⚠️ Regression: {row['Benchmark']} @ {row['Scale']}x took {row['Seconds']:.3f}s (was {before:.3f}s)")
+
+
+def main(scales=DEFAULT_SCALES):
+    sys.path.insert(0, REPO_DIR)
+    current = pd.DataFrame([row for scale in scales for row in run_scale(scale)])
+
+    previous = pd.read_csv(RESULTS_FILE) if os.path.exists(RESULTS_FILE) else pd.DataFrame()
+    report_regressions(previous, current)
+
+    os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+    pd.concat([previous, current]).to_csv(RESULTS_FILE, index=False)
+    print(f"✅ Saved benchmark results to {RESULTS_FILE}")
+
+
+if __name__ == "__main__":
+    # e.g. python benchmark_hot_paths.py 1 10 100
+    main([float(s) for s in sys.argv[1:]] or DEFAULT_SCALES)
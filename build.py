@@ -0,0 +1,206 @@
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import date
+from data_cache import content_hash
+from pitch_store import PITCH_STORE_DIR
+from dataset_store import atomic_write
+
+BUILD_STATE_FILE = "data/build_state.json"
+
+# Every derived file, the script that writes it and what it reads. A step reruns
+# when the content hash of its scripts, inputs or params changes, or an output
+# is missing. The one Statcast pull lands in the pitch store and every other
+# step reads from there or from files derived from it.
+STEPS = {
+    "fetch": {
+        "run": ["pitch_store.py"],
+        "inputs": [],
+        "outputs": [os.path.join(PITCH_STORE_DIR, "pitches_*.csv")],
+        # Pulls through today, so it goes stale once a day
+        "params": lambda: {"end": date.today().isoformat()},
+    },
+    "stats": {
+        # filter_hitters rewrites first_pitch_data_2025.csv in place, so it
+        # belongs to the step that produces the file
+        "run": ["update_stats.py", "filter_hitters.py"],
+        "inputs": [os.path.join(PITCH_STORE_DIR, "pitches_*.csv")],
+        "outputs": [
+            "first_pitch_data_2025.csv", "first_pitch_hitters_2025.csv", "mlb_fp_stats.csv",
+            "data/pa_table_2025.csv", "data/pitcher_location_profiles.npz", "data/trend_series_2025.npz",
+            "data/first_pitch_split_cube.npz", "first_pitch_leadoff_2025.csv", "first_pitch_leadoff_cleaned.csv",
+            "data/count_transitions_2025.npz",
+        ],
+    },
+    "lookup": {
+        "run": ["playerlookup.py"],
+        "inputs": ["first_pitch_data_2025.csv"],
+        "outputs": ["player_name_lookup.csv"],
+    },
+    "pitchers": {
+        "run": ["clean_pitcher_data.py"],
+        "inputs": [os.path.join(PITCH_STORE_DIR, "pitches_*.csv")],
+        "outputs": ["first_pitch_data_2025_cleaned.csv"],
+    },
+    "active_pitchers": {
+        "run": ["active_pitchers.py"],
+        "inputs": [os.path.join(PITCH_STORE_DIR, "pitches_*.csv")],
+        "outputs": ["active_pitchers_2025.csv"],
+    },
+    "hot_hitters": {
+        "run": ["refresh_hot_hitters.py"],
+        "inputs": ["first_pitch_hitters_2025.csv", "first_pitch_leadoff_2025.csv", "player_name_lookup.csv"],
+        "outputs": [
+            "data/hot_hitters_with_ball.csv", "data/hot_hitters_no_ball.csv",
+            "data/hot_hitters_leadoff_with_ball.csv", "data/hot_hitters_leadoff_no_ball.csv",
+        ],
+    },
+    "last5": {
+        "run": ["generate_last5_fp_stats.py"],
+        "inputs": ["mlb_fp_logs.csv"],
+        "outputs": ["last_5_fp_stats.csv"],
+    },
+    "targets": {
+        "run": ["slate_scoring.py"],
+        "inputs": [
+            "first_pitch_hitters_2025.csv", "first_pitch_data_2025_cleaned.csv",
+            "first_pitch_leadoff_2025.csv", "first_pitch_leadoff_cleaned.csv",
+            "player_name_lookup.csv", "games_today.csv",
+        ],
+        "outputs": ["ai_targets.csv", "ai_targets_leadoff.csv"],
+    },
+}
+
+
+# ---------- GRAPH ----------
+def _expand(patterns):
+    return sorted(p for pattern in patterns for p in (glob.glob(pattern) if "*" in pattern else [pattern]))
+
+
+def dependencies(steps):
+    # A step depends on every step that declares one of its inputs as an output
+    producers = {out: name for name, step in steps.items() for out in step["outputs"]}
+    return {
+        name: {producers[i] for i in step["inputs"] if i in producers and producers[i] != name}
+        for name, step in steps.items()
+    }
+
+
+def upstream_closure(targets, deps):
+    wanted, stack = set(), list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in wanted:
+            wanted.add(name)
+            stack.extend(deps[name])
+    return wanted
+
+
+def step_hash(step):
+    params = step.get("params", lambda: {})()
+    return content_hash(*step["run"], *_expand(step["inputs"])) + json.dumps(params, sort_keys=True)
+
+
+def is_stale(name, step, state):
+    outputs_present = all(_expand([o]) for o in step["outputs"])
+    return not outputs_present or state.get(name) != step_hash(step)
+
+
+# ---------- RUNNER ----------
+def load_state(path=BUILD_STATE_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_state(state, path=BUILD_STATE_FILE):
+    def write(tmp):
+        with open(tmp, "w") as f:
+            json.dump(state, f, indent=2)
+    atomic_write(path, write)
+
+
+def run_step(name, step):
+    start = time.perf_counter()
+    for script in step["run"]:
+        result = subprocess.run([sys.executable, script], capture_output=True, text=True)
+        if result.returncode != 0:
+            return name, False, time.perf_counter() - start, result.stdout + result.stderr
+    return name, True, time.perf_counter() - start, ""
+
+
+def build(targets=None, force=False, dry_run=False, workers=None, steps=STEPS):
+    deps = dependencies(steps)
+    wanted = upstream_closure(targets or list(steps), deps)
+    state = load_state()
+
+    pending = set(wanted)
+    done, failed, rebuilt = set(), set(), set()
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        while pending or running:
+            # Start every step whose upstream steps have all finished
+            for name in sorted(pending):
+                if not deps[name] <= done | failed:
+                    continue
+                pending.discard(name)
+                if deps[name] & failed:
+                    print(f"⏭️ {name}: skipped, upstream failed")
+                    failed.add(name)
+                elif not force and not (deps[name] & rebuilt and dry_run) and not is_stale(name, steps[name], state):
+                    print(f"✅ {name}: up to date")
+                    done.add(name)
+                elif dry_run:
+                    print(f"🔨 {name}: would rebuild")
+                    done.add(name)
+                    rebuilt.add(name)
+                else:
+                    print(f"🔨 {name}: rebuilding ({' → '.join(steps[name]['run'])})")
+                    running[pool.submit(run_step, name, steps[name])] = name
+
+            if not running:
+                if pending and not any(deps[n] <= done | failed for n in pending):
+                    raise RuntimeError(f"Dependency cycle between steps: {', '.join(sorted(pending))}")
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                del running[future]
+                name, ok, seconds, output = future.result()
+                if ok:
+                    # Hash after the run so outputs that are also inputs are settled
+                    state[name] = step_hash(steps[name])
+                    save_state(state)
+                    done.add(name)
+                    rebuilt.add(name)
+                    print(f"✅ {name}: built in {seconds:.1f}s")
+                else:
+                    failed.add(name)
+                    print(f"❌ {name}: failed after {seconds:.1f}s\n{output.strip()}")
+
+    return rebuilt, failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild stale FirstPitch data files")
+    parser.add_argument("targets", nargs="*", help=f"steps to build (default: all of {', '.join(STEPS)})")
+    parser.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    parser.add_argument("--dry-run", action="store_true", help="only report what is stale")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    unknown = set(args.targets) - set(STEPS)
+    if unknown:
+        parser.error(f"unknown steps: {', '.join(sorted(unknown))}")
+
+    rebuilt, failed = build(args.targets, force=args.force, dry_run=args.dry_run, workers=args.workers)
+    verb = "Would rebuild" if args.dry_run else "Rebuilt"
+    print(f"🏁 {verb} {len(rebuilt)} steps, {len(failed)} failed")
+    sys.exit(1 if failed else 0)
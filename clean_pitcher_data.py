@@ -1,28 +1,52 @@
-import pandas as pd
 import os
+from datetime import date
+from pitch_store import list_partitions
+from stream_aggregates import aggregate_first_pitches, stream_aggregate, pitcher_table
+from player_registry import lookup_players
+from live_ingest import list_provisional
+from leadoff_dataset import LEADOFF_PITCHERS_FILE
+from dataset_store import write_csv
 
-# Load the full 2025 raw data file
-RAW_FILE = "first_pitch_data_2025.csv"
 CLEANED_FILE = "first_pitch_data_2025_cleaned.csv"
 
-if not os.path.exists(RAW_FILE):
-    raise FileNotFoundError(f"{RAW_FILE} not found. Make sure the raw file exists.")
 
-# Load CSV
-df = pd.read_csv(RAW_FILE)
+def build_cleaned_pitchers(output_file=CLEANED_FILE):
+    # Per-pitcher first-pitch table read by the Trend Explorer and slate scoring
+    from pybaseball import statcast
 
-# Ensure essential columns exist
-required_cols = {"pitcher", "player_name", "events", "description", "stand", "p_throws", "game_date"}
-if not required_cols.issubset(df.columns):
-    raise ValueError("Missing expected columns in the raw dataset.")
+    partitions = list_partitions()
+    if partitions:
+        # Today's live-feed first pitches stream alongside the Statcast partitions
+        _, pitcher_sums = stream_aggregate(partitions + list_provisional(), workers=os.cpu_count())
+    else:
+        pitcher_data = statcast("2025-03-27", date.today().strftime("%Y-%m-%d"))
+        _, pitcher_sums = aggregate_first_pitches(pitcher_data)
 
-# Clean up: remove null pitchers, drop unnecessary columns if needed
-pitcher_df = df.dropna(subset=["pitcher", "player_name"])
-pitcher_df = pitcher_df[pitcher_df["pitcher"].notnull()]
+    merged = with_pitcher_names(pitcher_table(pitcher_sums))
+    write_csv(merged, output_file)
+    return merged
 
-# Optionally remove duplicate pitcher appearances on first pitches
-pitcher_df = pitcher_df.drop_duplicates(subset=["pitcher", "game_date"])
 
-# Save cleaned file
-pitcher_df.to_csv(CLEANED_FILE, index=False)
-print(f"✅ Saved cleaned pitcher data to {CLEANED_FILE}")
+def build_leadoff_pitchers(leadoff, output_file=LEADOFF_PITCHERS_FILE):
+    # Same table over inning leadoff PAs only (rows from leadoff_dataset.leadoff_pas)
+    _, pitcher_sums = aggregate_first_pitches(leadoff)
+    merged = with_pitcher_names(pitcher_table(pitcher_sums))
+    write_csv(merged, output_file)
+    return merged
+
+
+def with_pitcher_names(grouped):
+    name_map = lookup_players(grouped["player_id"])
+    name_map["player_name"] = name_map["name_first"] + " " + name_map["name_last"]
+
+    return grouped.merge(
+        name_map[["key_mlbam", "player_name"]],
+        left_on="player_id",
+        right_on="key_mlbam",
+        how="left"
+    )
+
+
+if __name__ == "__main__":
+    merged = build_cleaned_pitchers()
+    print(f"✅ Saved first-pitch stats for {len(merged)} pitchers to {CLEANED_FILE}")
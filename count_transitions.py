@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+from dataset_store import write_npz
+
+TRANSITIONS_FILE = "data/count_transitions_2025.npz"
+ROLES = ["batter", "pitcher"]
+
+# Every pitch is one (count -> outcome) step. Counts are indexed balls * 3 + strikes.
+COUNTS = [f"{b}-{s}" for b in range(4) for s in range(3)]
+OUTCOMES = ["ball", "called_strike", "swinging_strike", "foul", "in_play", "hit_by_pitch"]
+OUTCOME_DESCRIPTIONS = {
+    "ball": ["ball", "blocked_ball", "intent_ball", "pitchout"],
+    "called_strike": ["called_strike"],
+    "swinging_strike": ["swinging_strike", "swinging_strike_blocked", "foul_tip", "missed_bunt"],
+    "foul": ["foul", "foul_bunt", "foul_pitchout"],
+    "in_play": ["hit_into_play", "hit_into_play_no_out", "hit_into_play_score"],
+    "hit_by_pitch": ["hit_by_pitch"],
+}
+
+
+def _outcome_codes(description):
+    lookup = {desc: i for i, outcome in enumerate(OUTCOMES) for desc in OUTCOME_DESCRIPTIONS[outcome]}
+    return description.map(lookup).fillna(-1).astype(np.int64).to_numpy()
+
+
+def _compact(counts):
+    # uint16 keeps the npz small; a cell past 65535 (multi-season input) would wrap, so widen instead
+    return counts.astype(np.uint16 if counts.max(initial=0) <= np.iinfo(np.uint16).max else np.uint32)
+
+
+def build_count_transitions(df):
+    # Per-player (count x outcome) pitch counts over full pitch-level data
+    balls = pd.to_numeric(df["balls"], errors="coerce").to_numpy()
+    strikes = pd.to_numeric(df["strikes"], errors="coerce").to_numpy()
+    outcome = _outcome_codes(df["description"])
+    keep = (outcome >= 0) & (balls >= 0) & (balls <= 3) & (strikes >= 0) & (strikes <= 2)
+
+    count = (np.nan_to_num(balls) * 3 + np.nan_to_num(strikes)).astype(np.int64)[keep]
+    outcome = outcome[keep]
+    n_c, n_o = len(COUNTS), len(OUTCOMES)
+
+    matrices = {
+        "counts": np.array(COUNTS),
+        "outcomes": np.array(OUTCOMES),
+        "league": np.bincount(count * n_o + outcome, minlength=n_c * n_o).reshape(n_c, n_o).astype(np.uint32),
+    }
+    for role in ROLES:
+        players = pd.to_numeric(df[role], errors="coerce").to_numpy()[keep]
+        located = ~np.isnan(players)
+        ids, p = np.unique(players[located].astype(np.int64), return_inverse=True)
+        cell = (p * n_c + count[located]) * n_o + outcome[located]
+        counts = np.bincount(cell, minlength=len(ids) * n_c * n_o).reshape(len(ids), n_c, n_o)
+        matrices[f"{role}_ids"] = ids
+        matrices[f"{role}_matrix"] = _compact(counts)
+    return matrices
+
+
+def merge_count_transitions(parts):
+    # Sum matrices built over separate chunks (e.g. pitch store partitions);
+    # no parts (an empty store) gives all-zero matrices with no players
+    parts = list(parts)
+    n_c, n_o = len(COUNTS), len(OUTCOMES)
+    league = np.zeros((n_c, n_o), dtype=np.int64)
+    for p in parts:
+        league += p["league"]
+    merged = {
+        "counts": np.array(COUNTS),
+        "outcomes": np.array(OUTCOMES),
+        "league": league.astype(np.uint32),
+    }
+    for role in ROLES:
+        ids = np.unique(np.concatenate([np.empty(0, dtype=np.int64)] + [p[f"{role}_ids"] for p in parts]))
+        total = np.zeros((len(ids), n_c, n_o), dtype=np.int64)
+        for p in parts:
+            total[np.searchsorted(ids, p[f"{role}_ids"])] += p[f"{role}_matrix"]
+        merged[f"{role}_ids"] = ids
+        merged[f"{role}_matrix"] = _compact(total)
+    return merged
+
+
+def save_count_transitions(matrices, path=TRANSITIONS_FILE):
+    write_npz(path, matrices)
+
+
+def load_count_transitions(path=TRANSITIONS_FILE):
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
+
+
+# ---------- QUERIES ----------
+def _tendency_table(matrix, counts):
+    rows = [COUNTS.index(c) for c in counts]
+    table = pd.DataFrame(matrix[rows].astype(np.int64), index=pd.Index(counts, name="count"), columns=OUTCOMES)
+    pitches = table.sum(axis=1)
+    rates = table.div(pitches.where(pitches > 0), axis=0).round(3).add_suffix("_pct")
+    return pd.concat([pitches.rename("pitches"), rates], axis=1)
+
+
+def count_tendencies(matrices, role, player_ids, counts=("0-0", "1-0", "0-1")):
+    # Outcome rates from each count for one or more ids (summed), or None if unseen
+    ids = matrices[f"{role}_ids"]
+    if len(ids) == 0:
+        return None
+    rows = np.searchsorted(ids, np.asarray(player_ids, dtype=np.int64))
+    rows = rows[(rows < len(ids)) & (ids[np.minimum(rows, len(ids) - 1)] == np.asarray(player_ids))]
+    if not len(rows):
+        return None
+    return _tendency_table(matrices[f"{role}_matrix"][rows].sum(axis=0), list(counts))
+
+
+def league_tendencies(matrices, counts=("0-0", "1-0", "0-1")):
+    return _tendency_table(matrices["league"], list(counts))
+
+
+if __name__ == "__main__":
+    from pitch_store import iter_pitch_store
+
+    matrices = merge_count_transitions([build_count_transitions(part) for part in iter_pitch_store()])
+    save_count_transitions(matrices)
+    print(f"✅ Saved count transitions for {len(matrices['batter_ids'])} batters and {len(matrices['pitcher_ids'])} pitchers to {TRANSITIONS_FILE}")
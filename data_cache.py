@@ -0,0 +1,29 @@
+import os
+import hashlib
+
+# Derived tables are cached under a version key built from their source files,
+# so any refresh that rewrites a source invalidates them without a manual clear.
+
+
+def file_version(path):
+    if not os.path.exists(path):
+        return (path, None, None)
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def data_version(*paths):
+    return tuple(file_version(p) for p in paths)
+
+
+def content_hash(*paths, chunk_size=1 << 20):
+    # Slower than data_version but stable across copies and touch-only writes
+    digest = hashlib.sha1()
+    for path in paths:
+        digest.update(path.encode())
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(chunk_size), b""):
+                digest.update(block)
+    return digest.hexdigest()
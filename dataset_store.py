@@ -0,0 +1,188 @@
+import os
+import sys
+import json
+import uuid
+import shutil
+from contextlib import contextmanager
+from datetime import datetime
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no advisory lock; callers' re-read and merge still narrows the race
+    fcntl = None
+
+VERSIONS_DIR = "data/versions"
+KEEP_VERSIONS = 3
+
+# Pitch-level partitions (pitch_store.py) and today's live-feed rows (live_ingest.py)
+PITCH_STORE_DIR = "data/pitches"
+
+# Every dataset write lands as a new snapshot under data/versions/<path>/ and
+# is then swapped in at its usual path with one os.replace, so a page reading
+# mid-refresh sees either the old file or the new one, never half of either.
+# The published file is a hard link to its snapshot (no extra disk), and the
+# last KEEP_VERSIONS snapshots stay around for `python dataset_store.py rollback`.
+#
+# Never write a published path in place (to_csv(path), open(path, "w")):
+# that truncates the shared inode and the snapshot with it.
+
+
+def versions_dir(path):
+    # data/versions/<path>/, e.g. data/versions/data/mlb_fp_stats.csv/
+    rel = os.path.relpath(path)
+    if rel.startswith(os.pardir):
+        # Outside the project (scratch runs): keep versions beside the file
+        return os.path.join(os.path.dirname(os.path.abspath(path)), "versions", os.path.basename(path))
+    return os.path.join(VERSIONS_DIR, rel)
+
+
+def list_versions(path):
+    # Snapshots for `path`, newest first
+    folder = versions_dir(path)
+    if not os.path.isdir(folder):
+        return []
+    names = [n for n in os.listdir(folder) if not n.endswith(".tmp")]
+    return [os.path.join(folder, n) for n in sorted(names, reverse=True)]
+
+
+def current_version(path):
+    # The snapshot `path` points at, or None if it was written some other way
+    if not os.path.exists(path):
+        return None
+    for snapshot in list_versions(path):
+        try:
+            if os.path.samefile(snapshot, path):
+                return snapshot
+        except FileNotFoundError:
+            # Pruned or re-pointed by another writer mid-scan
+            continue
+    return None
+
+
+def _temp_name(path):
+    # Unique per call: Streamlit sessions are threads of one process, so a pid isn't enough
+    return f"{path}.{uuid.uuid4().hex}.tmp"
+
+
+def atomic_write(path, write):
+    # write(tmp_path) fills a temp file beside `path`, which then replaces it whole
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp = _temp_name(path)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return path
+
+
+@contextmanager
+def file_lock(path):
+    # Exclusive lock on `path`.lock for read-merge-write cycles shared by sessions and processes
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(f"{path}.lock", "w") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _point(path, snapshot):
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp = _temp_name(path)
+    try:
+        os.link(snapshot, tmp)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        # No hard links here (other filesystem): publish a copy instead
+        shutil.copyfile(snapshot, tmp)
+    os.replace(tmp, path)
+
+
+def publish(path, write, keep=KEEP_VERSIONS):
+    # write(tmp_path) produces the new version; returns its snapshot path
+    folder = versions_dir(path)
+    os.makedirs(folder, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    snapshot = os.path.join(folder, f"{stamp}-{uuid.uuid4().hex[:8]}{os.path.splitext(path)[1]}")
+
+    atomic_write(snapshot, write)
+    try:
+        _point(path, snapshot)
+    except FileNotFoundError:
+        # Concurrent writers landed `keep` newer versions and pruned this one;
+        # the newest of theirs is what readers should see anyway
+        return current_version(path)
+    prune_versions(path, keep)
+    return snapshot
+
+
+def prune_versions(path, keep=KEEP_VERSIONS):
+    # Drop all but the newest `keep` snapshots; the published one always stays
+    current = current_version(path)
+    for snapshot in list_versions(path)[keep:]:
+        if snapshot != current:
+            try:
+                os.remove(snapshot)
+            except FileNotFoundError:
+                # Another writer pruned it first
+                pass
+
+
+def rollback(path, steps=1):
+    # Re-point `path` at the snapshot `steps` older than the one it shows now
+    versions = list_versions(path)
+    current = current_version(path)
+    start = versions.index(current) if current in versions else -1
+    if start + steps >= len(versions):
+        raise ValueError(f"only {len(versions)} versions of {path} are kept")
+    snapshot = versions[start + steps]
+    _point(path, snapshot)
+    return snapshot
+
+
+# ---------- WRITERS ----------
+def write_csv(df, path, keep=KEEP_VERSIONS, **kwargs):
+    kwargs.setdefault("index", False)
+    return publish(path, lambda tmp: df.to_csv(tmp, **kwargs), keep)
+
+
+def write_npz(path, arrays, keep=KEEP_VERSIONS):
+    def write(tmp):
+        # A file object, so numpy doesn't append .npz to the temp name
+        with open(tmp, "wb") as f:
+            np.savez_compressed(f, **arrays)
+    return publish(path, write, keep)
+
+
+def write_json(data, path, keep=KEEP_VERSIONS, **kwargs):
+    def write(tmp):
+        with open(tmp, "w") as f:
+            json.dump(data, f, **kwargs)
+    return publish(path, write, keep)
+
+
+if __name__ == "__main__":
+    # python dataset_store.py list <path> | rollback <path> [steps]
+    if len(sys.argv) < 3 or sys.argv[1] not in ("list", "rollback"):
+        print("usage: python dataset_store.py list <path> | rollback <path> [steps]")
+        sys.exit(1)
+    command, path = sys.argv[1], sys.argv[2]
+    if command == "list":
+        current = current_version(path)
+        for snapshot in list_versions(path):
+            print(f"{'👉' if snapshot == current else '  '} {snapshot} ({os.path.getsize(snapshot) / 1024:.0f} KB)")
+    else:
+        snapshot = rollback(path, int(sys.argv[3]) if len(sys.argv) > 3 else 1)
+        print(f"✅ {path} now points at {snapshot}")
@@ -0,0 +1,166 @@
+import re
+import sys
+import json
+import time
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from synthetic_data import generate_game_feed, TEAMS
+
+HOST = "127.0.0.1"
+PORT = 8503
+GAMES = 6
+
+# Stand-in for the MLB Stats API endpoints the pages call, with faults that can
+# be changed while it runs. Start it, then run a page with
+# MLB_API_BASE=http://127.0.0.1:8503 to watch the tracker ride out a bad upstream.
+ROUTES = [
+    ("schedule", re.compile(r"^/api/v1/schedule$")),
+    ("boxscore", re.compile(r"^/api/v1/game/(\d+)/boxscore$")),
+    ("feed", re.compile(r"^/api/v1\.1/game/(\d+)/feed/live$")),
+]
+
+
+def no_faults():
+    # Per endpoint: extra delay, share of 500s, share of requests that hang;
+    # hung_games hang every boxscore/feed request for those game_pks
+    return {
+        "schedule": {"delay": 0.0, "error_rate": 0.0, "hang_rate": 0.0},
+        "boxscore": {"delay": 0.0, "error_rate": 0.0, "hang_rate": 0.0},
+        "feed": {"delay": 0.0, "error_rate": 0.0, "hang_rate": 0.0},
+        "hung_games": set(),
+        "hang_seconds": 30.0,
+    }
+
+
+# ---------- PAYLOADS ----------
+def _lineup(game_pk, side):
+    base = 600000 + (game_pk % 50) * 20 + (0 if side == "away" else 10)
+    return list(range(base, base + 9))
+
+
+def build_payloads(games=GAMES):
+    schedule_games = []
+    boxscores = {}
+    feeds = {}
+    for i in range(games):
+        game_pk = 800000 + i
+        away, home = TEAMS[(2 * i) % len(TEAMS)], TEAMS[(2 * i + 1) % len(TEAMS)]
+        lineups = {"away": _lineup(game_pk, "away"), "home": _lineup(game_pk, "home")}
+        schedule_games.append({
+            "gamePk": game_pk,
+            "status": {"abstractGameState": "Live", "detailedState": "In Progress"},
+            "teams": {side: {"team": {"name": f"{abbr} Club", "abbreviation": abbr}} for side, abbr in (("away", away), ("home", home))},
+            "linescore": {"currentInning": 4, "isTopInning": True, "outs": i % 3, "offense": {"batter": {"id": lineups["away"][i % 9]}}},
+        })
+        boxscores[game_pk] = {"teams": {
+            side: {
+                "batters": ids,
+                "players": {
+                    f"ID{pid}": {
+                        "person": {"id": pid, "fullName": f"Batter {pid}", "primaryPosition": {"code": "8"}},
+                        "battingOrder": str((slot + 1) * 100),
+                        "stats": {"batting": {"atBats": 2, "hits": slot % 2}},
+                    }
+                    for slot, pid in enumerate(ids)
+                },
+            }
+            for side, ids in lineups.items()
+        }}
+        feed = generate_game_feed(game_pk, seed=i)
+        feed["liveData"]["plays"]["currentPlay"] = {"matchup": {"batter": {"id": lineups["away"][i % 9]}}}
+        feeds[game_pk] = feed
+
+    schedule = {"dates": [{"games": schedule_games}]}
+    return schedule, boxscores, feeds
+
+
+# ---------- SERVER ----------
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            path = urlsplit(self.path).path
+            for endpoint, pattern in ROUTES:
+                match = pattern.match(path)
+                if match:
+                    break
+            else:
+                return self._send(404, b'{"error": "not found"}')
+
+            game_pk = int(match.group(1)) if match.groups() else None
+            faults = state["faults"]
+            rules = faults[endpoint]
+            state["requests"][endpoint] = state["requests"].get(endpoint, 0) + 1
+
+            if game_pk in faults["hung_games"] or random.random() < rules["hang_rate"]:
+                time.sleep(faults["hang_seconds"])
+            if rules["delay"]:
+                time.sleep(rules["delay"])
+            if random.random() < rules["error_rate"]:
+                return self._send(500, b'{"error": "injected"}')
+
+            if endpoint == "schedule":
+                return self._send(200, state["bodies"]["schedule"])
+            body = state["bodies"][endpoint].get(game_pk)
+            if body is None:
+                return self._send(404, b'{"error": "unknown game"}')
+            self._send(200, body)
+
+        def _send(self, status, body):
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # The client gave up on a hung request
+                pass
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def make_fake_server(host=HOST, port=PORT, games=GAMES):
+    schedule, boxscores, feeds = build_payloads(games)
+    state = {
+        "faults": no_faults(),
+        "requests": {},
+        "bodies": {
+            "schedule": json.dumps(schedule).encode(),
+            "boxscore": {pk: json.dumps(b).encode() for pk, b in boxscores.items()},
+            "feed": {pk: json.dumps(f).encode() for pk, f in feeds.items()},
+        },
+    }
+    server = ThreadingHTTPServer((host, port), make_handler(state))
+    server.daemon_threads = True
+    server.state = state
+    server.game_pks = sorted(boxscores)
+    return server
+
+
+def start_fake_server(games=GAMES):
+    # In-process server on a free port, for scripts that drive the client against it
+    server = make_fake_server(port=0, games=games)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{HOST}:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    # python fake_mlb_server.py [port] [error_rate] [delay]: faults apply to every endpoint
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else PORT
+    server = make_fake_server(port=port)
+    for endpoint in ("schedule", "boxscore", "feed"):
+        server.state["faults"][endpoint]["error_rate"] = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+        server.state["faults"][endpoint]["delay"] = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    print(f"🧪 Fake MLB API with {len(server.game_pks)} live games on http://{HOST}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -1,4 +1,5 @@
 import pandas as pd
+from dataset_store import write_csv
 
 # Load original Statcast data
 df = pd.read_csv("first_pitch_data_2025.csv")
@@ -13,6 +14,6 @@ df["batter_id"] = pd.to_numeric(df["batter"], errors="coerce")
 # Normalize player name for consistency
 df["player_name"] = df["player_name"].astype(str).str.strip().str.lower()
 
-# Save cleaned file back to same name
-df.to_csv("first_pitch_data_2025.csv", index=False)
+# Publish the cleaned file as a new version under the same name
+write_csv(df, "first_pitch_data_2025.csv")
 print("✅ Saved: first_pitch_data_2025.csv with 'batter_id' and lowercase names.")
@@ -1,4 +1,5 @@
 import pandas as pd
+from dataset_store import write_csv
 
 def calculate_last_5_game_stats(log_file="mlb_fp_logs.csv", output_file="last_5_fp_stats.csv"):
     df = pd.read_csv(log_file, parse_dates=["Date"])
@@ -38,7 +39,7 @@ def calculate_last_5_game_stats(log_file="mlb_fp_logs.csv", output_file="last_5_
         })
 
     result_df = pd.DataFrame(players)
-    result_df.to_csv(output_file, index=False)
+    write_csv(result_df, output_file)
     print(f"✅ Saved last-5-game first pitch stats to {output_file}")
 
 if __name__ == "__main__":
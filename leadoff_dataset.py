@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+LEADOFF_HITTERS_FILE = "first_pitch_leadoff_2025.csv"
+LEADOFF_PITCHERS_FILE = "first_pitch_leadoff_cleaned.csv"
+HALF_INNING_KEYS = ["game_pk", "inning", "inning_topbot"]
+
+# The leadoff PA of each half inning is its lowest at_bat_number. One stable
+# sort plus a compare against the previous row's keys marks them all, without
+# a groupby over every half inning of the season.
+
+
+def leadoff_mask(df):
+    # Boolean array aligned with df's rows: True on each half inning's leadoff first pitch
+    is_first = (df["pitch_number"] == 1).to_numpy() if "pitch_number" in df.columns else np.ones(len(df), dtype=bool)
+    rows = np.flatnonzero(is_first)
+    first = df.iloc[rows]
+
+    game = pd.to_numeric(first["game_pk"], errors="coerce").to_numpy()
+    inning = pd.to_numeric(first["inning"], errors="coerce").to_numpy()
+    half = (first["inning_topbot"] == "Bot").to_numpy()
+    at_bat = pd.to_numeric(first["at_bat_number"], errors="coerce").to_numpy()
+    order = np.lexsort((at_bat, half, inning, game))
+
+    game, inning, half = game[order], inning[order], half[order]
+    starts = np.ones(len(order), dtype=bool)
+    starts[1:] = (game[1:] != game[:-1]) | (inning[1:] != inning[:-1]) | (half[1:] != half[:-1])
+
+    mask = np.zeros(len(df), dtype=bool)
+    mask[rows[order[starts]]] = True
+    return mask
+
+
+def leadoff_pas(df):
+    return df[leadoff_mask(df)]
@@ -0,0 +1,107 @@
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from pa_table import PA_TABLE_FILE
+from shared_data import shared_dataset
+
+DEFAULT_SIMS = 10000
+LEAGUE_OBP = 0.315
+LAST_INNING = 9
+
+# Safety cap on PAs in one simulated half-inning (a 20-batter inning is ~never)
+MAX_PA_PER_INNING = 20
+
+# Season OBP from the PA table, shrunk toward league by this many league-average PAs
+OBP_PRIOR_PA = 150
+ON_BASE_EVENTS = {"single", "double", "triple", "home_run", "walk", "intent_walk", "hit_by_pitch"}
+NOT_OBP_PA_EVENTS = {"sac_bunt", "catcher_interf", "truncated_pa"}
+
+
+def parse_obp(value):
+    try:
+        obp = float(value)
+    except (TypeError, ValueError):
+        return LEAGUE_OBP
+    return obp if 0 < obp < 1 else LEAGUE_OBP
+
+
+def boxscore_obp(player):
+    return parse_obp(player.get("seasonStats", {}).get("batting", {}).get("obp"))
+
+
+def season_obp(pa):
+    # {batter id: OBP} from the PA table's outcomes, shrunk toward LEAGUE_OBP
+    pa = pa[pa["pa_events"].notna() & ~pa["pa_events"].isin(NOT_OBP_PA_EVENTS)]
+    grouped = pa.assign(on_base=pa["pa_events"].isin(ON_BASE_EVENTS)).groupby("batter")["on_base"]
+    obp = (grouped.sum() + OBP_PRIOR_PA * LEAGUE_OBP) / (grouped.size() + OBP_PRIOR_PA)
+    return dict(zip(obp.index.astype(np.int64), obp.round(3)))
+
+
+def load_season_obp(path=PA_TABLE_FILE):
+    # Shared across sessions, reloaded when update_stats.py rewrites the PA table
+    def load():
+        if not os.path.exists(path):
+            return {}
+        return season_obp(pd.read_csv(path, usecols=["batter", "pa_events"]))
+    return shared_dataset(f"season_obp:{path}", [path], load)
+
+
+def lineup_obp(lineup, obp_by_id):
+    # Each batter's own OBP; league average only for ids with no PAs yet
+    return [obp_by_id.get(int(pid), LEAGUE_OBP) for pid in lineup]
+
+
+@lru_cache(maxsize=256)
+def pregame_forecast(obp):
+    # Posted lineups rarely change between reruns, so each OBP tuple is simulated once
+    return simulate_leadoffs(list(obp))
+
+
+def simulate_leadoffs(obp, start_inning=1, start_index=0, outs=0, sims=DEFAULT_SIMS, seed=None):
+    # Returns {inning: P(each lineup slot leads it off)} for every inning after start_inning.
+    # Each PA is on base with the batter's OBP, otherwise an out; no double plays or
+    # baserunning outs, so it slightly overstates how far the order turns over.
+    obp = np.asarray(obp, dtype=float)
+    n = len(obp)
+    rng = np.random.default_rng(seed)
+
+    idx = np.full(sims, start_index % n)
+    out_count = np.full(sims, outs)
+    forecast = {}
+
+    for inning in range(start_inning, LAST_INNING):
+        for _ in range(MAX_PA_PER_INNING):
+            batting = out_count < 3
+            if not batting.any():
+                break
+            made_out = rng.random(sims) >= obp[idx]
+            out_count = out_count + (batting & made_out)
+            idx = np.where(batting, (idx + 1) % n, idx)
+
+        forecast[inning + 1] = np.bincount(idx, minlength=n) / sims
+        out_count = np.zeros(sims, dtype=int)
+
+    return forecast
+
+
+def forecast_table(names, forecast):
+    table = pd.DataFrame({f"Inn {inning}": probs for inning, probs in forecast.items()})
+    table.insert(0, "Player", names)
+    return table
+
+
+def target_odds(names, forecast, is_target, min_prob=0.05):
+    # [(name, [(inning, prob), ...])] for target hitters with a real chance to lead off
+    odds = []
+    for i, name in enumerate(names):
+        if not is_target(name):
+            continue
+        chances = [(inning, probs[i]) for inning, probs in forecast.items() if probs[i] >= min_prob]
+        if chances:
+            odds.append((name, chances))
+    return odds
+
+
+def format_odds(chances):
+    return " · ".join(f"Inn {inning}: {prob:.0%}" for inning, prob in chances)
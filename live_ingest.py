@@ -0,0 +1,132 @@
+import os
+import glob
+import numpy as np
+import pandas as pd
+from dataset_store import atomic_write, file_lock, PITCH_STORE_DIR
+from leadoff_dataset import leadoff_pas
+
+# First pitches from today's live feeds, in Statcast's column layout, kept in a
+# provisional partition per day until the next Statcast pull replaces them.
+PROVISIONAL_COLUMNS = [
+    "game_pk", "game_date", "batter", "pitcher", "player_name", "stand", "p_throws",
+    "inning", "inning_topbot", "outs_when_up", "at_bat_number", "pitch_number",
+    "pitch_type", "description", "events", "balls", "strikes", "plate_x", "plate_z",
+    "zone", "home_team", "away_team", "estimated_ba_using_speedangle",
+]
+
+# Live feed pitch call codes -> Statcast `description`
+CALL_DESCRIPTIONS = {
+    "B": "ball", "*B": "blocked_ball", "V": "ball", "P": "pitchout", "I": "intent_ball",
+    "C": "called_strike", "S": "swinging_strike", "W": "swinging_strike_blocked",
+    "F": "foul", "T": "foul_tip", "L": "foul_bunt", "M": "missed_bunt", "R": "foul_pitchout",
+    "X": "hit_into_play", "D": "hit_into_play", "E": "hit_into_play", "H": "hit_by_pitch",
+}
+
+def provisional_path(day, store_dir=PITCH_STORE_DIR):
+    return os.path.join(store_dir, f"provisional_{day}.csv")
+
+
+def list_provisional(store_dir=PITCH_STORE_DIR):
+    return sorted(glob.glob(os.path.join(store_dir, "provisional_*.csv")))
+
+
+def load_provisional(store_dir=PITCH_STORE_DIR):
+    # Two processes (or an older build) can append the same PA; count it once
+    parts = [pd.read_csv(p) for p in list_provisional(store_dir)]
+    if not parts:
+        return pd.DataFrame(columns=PROVISIONAL_COLUMNS)
+    return pd.concat(parts, ignore_index=True).drop_duplicates(["game_pk", "at_bat_number"], keep="last", ignore_index=True)
+
+
+def clear_provisional(through_date, store_dir=PITCH_STORE_DIR):
+    # Statcast now covers these days, so their provisional rows are superseded
+    removed = []
+    for path in list_provisional(store_dir):
+        day = os.path.basename(path)[len("provisional_"):-len(".csv")]
+        if day <= str(through_date):
+            os.remove(path)
+            removed.append(path)
+    return removed
+
+
+def first_pitch_rows(feed):
+    # One row per completed PA; `events` is only set when the PA ended on that pitch
+    game = feed.get("gameData", {})
+    teams = game.get("teams", {})
+    base = {
+        "game_pk": feed.get("gamePk") or game.get("game", {}).get("pk"),
+        "game_date": game.get("datetime", {}).get("officialDate"),
+        "home_team": teams.get("home", {}).get("abbreviation"),
+        "away_team": teams.get("away", {}).get("abbreviation"),
+    }
+
+    rows = []
+    for play in feed.get("liveData", {}).get("plays", {}).get("allPlays", []):
+        about = play.get("about", {})
+        if not about.get("isComplete"):
+            continue
+        pitches = [ev for ev in play.get("playEvents", []) if ev.get("isPitch")]
+        if not pitches:
+            continue
+
+        first = pitches[0]
+        matchup = play.get("matchup", {})
+        coords = first.get("pitchData", {}).get("coordinates", {})
+        rows.append({
+            **base,
+            "batter": matchup.get("batter", {}).get("id"),
+            "pitcher": matchup.get("pitcher", {}).get("id"),
+            "player_name": matchup.get("batter", {}).get("fullName"),
+            "stand": matchup.get("batSide", {}).get("code"),
+            "p_throws": matchup.get("pitchHand", {}).get("code"),
+            "inning": about.get("inning"),
+            "inning_topbot": "Top" if about.get("isTopInning", about.get("halfInning") == "top") else "Bot",
+            "outs_when_up": first.get("count", {}).get("outs"),
+            "at_bat_number": about.get("atBatIndex", 0) + 1,
+            "pitch_number": 1,
+            "pitch_type": first.get("details", {}).get("type", {}).get("code"),
+            "description": CALL_DESCRIPTIONS.get(first.get("details", {}).get("call", {}).get("code"), ""),
+            "events": play.get("result", {}).get("eventType") if len(pitches) == 1 else np.nan,
+            "balls": 0,
+            "strikes": 0,
+            "plate_x": coords.get("pX"),
+            "plate_z": coords.get("pZ"),
+            "zone": first.get("pitchData", {}).get("zone"),
+            "estimated_ba_using_speedangle": np.nan,
+        })
+    return pd.DataFrame(rows, columns=PROVISIONAL_COLUMNS)
+
+
+def ingest_feed(feed, store_dir=PITCH_STORE_DIR):
+    # Appends PAs not already in the day's provisional partition; returns how many were new
+    rows = first_pitch_rows(feed)
+    if rows.empty or rows["game_date"].isna().all():
+        return 0
+
+    # Tracker sessions and other processes ingest (and pitch_store.py clears) the
+    # same day's file: re-read it under a lock and replace it whole, so readers
+    # never see a half-written last line and nobody works from a stale copy
+    path = provisional_path(rows["game_date"].iloc[0], store_dir)
+    with file_lock(path):
+        existing = pd.read_csv(path) if os.path.exists(path) else pd.DataFrame(columns=PROVISIONAL_COLUMNS)
+        seen = set(zip(existing["game_pk"], existing["at_bat_number"]))
+        new = rows[[k not in seen for k in zip(rows["game_pk"], rows["at_bat_number"])]]
+        if new.empty:
+            return 0
+
+        day = pd.concat([existing, new], ignore_index=True) if len(existing) else new
+        atomic_write(path, lambda tmp: day.to_csv(tmp, index=False))
+    return len(new)
+
+
+def with_provisional(df, store_dir=PITCH_STORE_DIR, leadoff=False):
+    # Statcast rows win over provisional rows for the same PA; `leadoff` keeps
+    # only each half inning's first PA, to match the leadoff-only files
+    provisional = load_provisional(store_dir)
+    if leadoff:
+        provisional = leadoff_pas(provisional)
+    if provisional.empty:
+        return df
+    have = pd.MultiIndex.from_frame(df[["game_pk", "at_bat_number"]])
+    provisional = provisional[~pd.MultiIndex.from_frame(provisional[["game_pk", "at_bat_number"]]).isin(have)]
+    return pd.concat([df, provisional], ignore_index=True)
@@ -0,0 +1,90 @@
+import os
+import json
+from datetime import datetime
+from dataset_store import atomic_write, file_lock
+
+LIVE_STATE_FILE = "data/live_leadoff_state.json"
+CHECKPOINT_FILE = "data/live_checkpoint.json"
+
+# The Live Tracker writes its latest leadoff projections here so tools outside
+# Streamlit (the local API, scripts) can read them without scraping the page.
+# The checkpoint is the tracker's own resume point after a restart.
+
+WALK_EVENTS = {"walk", "hit_by_pitch", "balk"}
+
+
+def _write_json(path, data):
+    # Write then rename so a reader never sees a half-written file; the temp
+    # name is unique per call since every tracker session writes these
+    def write(tmp):
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=2)
+    atomic_write(path, write)
+
+
+def save_live_state(leadoffs, forecast, path=LIVE_STATE_FILE):
+    _write_json(path, {
+        "updated": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "leadoffs": leadoffs,
+        "forecast": forecast,
+    })
+
+
+def load_live_state(path=LIVE_STATE_FILE):
+    if not os.path.exists(path):
+        return {"updated": None, "leadoffs": [], "forecast": []}
+    with open(path) as f:
+        return json.load(f)
+
+
+# ---------- CHECKPOINT ----------
+def save_checkpoint(alerts_fired, games, slate_ids=None, path=CHECKPOINT_FILE):
+    # Every tracker tab checkpoints to the same file: merge with what's on disk
+    # under a lock so one tab never drops alerts another already fired. Entries
+    # for games off the slate are dropped. Returns the merged alerts_fired.
+    with file_lock(path):
+        disk_alerts, disk_games = load_checkpoint(path)
+        alerts_fired = disk_alerts | set(alerts_fired)
+        games = {**disk_games, **games}
+        if slate_ids is not None:
+            alerts_fired = {key for key in alerts_fired if key[0] in slate_ids}
+            games = {pk: state for pk, state in games.items() if pk in slate_ids}
+        _write_json(path, {
+            "updated": datetime.now().astimezone().isoformat(timespec="seconds"),
+            "alerts_fired": sorted(list(key) for key in alerts_fired),
+            "games": {str(pk): state for pk, state in games.items()},
+        })
+    return alerts_fired
+
+
+def load_checkpoint(path=CHECKPOINT_FILE):
+    # (alerts_fired, per-game state); a missing or unreadable checkpoint starts cold
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return set(), {}
+    alerts_fired = {tuple(key) for key in data.get("alerts_fired", [])}
+    games = {int(pk): state for pk, state in data.get("games", {}).items()}
+    return alerts_fired, games
+
+
+def advance_plays(game, all_plays):
+    # Scan only completed plays past the checkpoint, remembering per side the
+    # last batter whose PA could end an inning (walks and HBP can't make an out)
+    start = game.get("last_play_index", 0)
+    if start > len(all_plays):
+        start, game = 0, {}
+
+    last_batter = dict(game.get("last_batter", {}))
+    index = start
+    for play in all_plays[start:]:
+        about = play.get("about", {})
+        if not about.get("isComplete", True):
+            break
+        batter = play.get("matchup", {}).get("batter", {}).get("id")
+        if batter and play.get("result", {}).get("eventType", "") not in WALK_EVENTS:
+            last_batter["away" if about.get("halfInning") == "top" else "home"] = batter
+        index += 1
+
+    return {**game, "last_play_index": index, "last_batter": last_batter}
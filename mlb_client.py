@@ -0,0 +1,190 @@
+import os
+import time
+import random
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+# Point every page at a stand-in server (see fake_mlb_server.py) with MLB_API_BASE=http://127.0.0.1:8503
+BASE_URL = os.environ.get("MLB_API_BASE", "https://statsapi.mlb.com")
+
+# (connect, read) seconds per endpoint; the read timeout also caps each call
+# in total, retries included. The feed is the heaviest payload.
+TIMEOUTS = {
+    "schedule": (3.05, 4.0),
+    "boxscore": (3.05, 3.0),
+    "feed": (3.05, 4.0),
+}
+RETRIES = 2
+BACKOFF = 0.25  # seconds; doubled per retry, full jitter
+
+# A breaker opens after this many failed calls in a row and lets one trial
+# call through once COOLDOWN has passed
+FAILURE_THRESHOLD = 3
+COOLDOWN = 30.0
+
+# Wall-clock cap for one refresh cycle's fetches; games are fetched in parallel
+CYCLE_BUDGET = 8.0
+FETCH_WORKERS = 16
+
+# data is the payload (None if nothing good was ever fetched); stale means it
+# is the last good copy from `age` seconds ago because this call failed
+Fetched = namedtuple("Fetched", ["data", "stale", "age", "error"])
+
+
+class CircuitBreaker:
+    def __init__(self, threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+    def allow(self, now):
+        if self.opened_at is None:
+            return True
+        if now - self.opened_at >= self.cooldown:
+            # Half-open: this call is the trial; a failure re-opens for another cooldown
+            self.opened_at = now
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self, now):
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = now
+
+
+class MLBClient:
+    # One client per process: breakers and last-good payloads are keyed per
+    # endpoint and game, so one bad game doesn't stall the others
+    def __init__(self, base_url=None, timeouts=None, retries=RETRIES, backoff=BACKOFF,
+                 threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN):
+        self.base_url = (base_url or BASE_URL).rstrip("/")
+        self.timeouts = {**TIMEOUTS, **(timeouts or {})}
+        self.retries = retries
+        self.backoff = backoff
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.session = requests.Session()
+        self.breakers = {}
+        self.last_good = {}
+        self.lock = threading.Lock()
+
+    def breaker(self, key):
+        with self.lock:
+            if key not in self.breakers:
+                self.breakers[key] = CircuitBreaker(self.threshold, self.cooldown)
+            return self.breakers[key]
+
+    def open_breakers(self):
+        return sorted(key for key, b in self.breakers.items() if b.is_open)
+
+    def _fallback(self, key, error):
+        good = self.last_good.get(key)
+        if good is None:
+            return Fetched(None, True, None, error)
+        return Fetched(good[0], True, time.time() - good[1], error)
+
+    def get_json(self, endpoint, path, key=None, params=None, deadline=None):
+        # `deadline` (time.monotonic()) is the caller's cycle deadline
+        key = key or endpoint
+        breaker = self.breaker(key)
+        with self.lock:
+            allowed = breaker.allow(time.monotonic())
+        if not allowed:
+            return self._fallback(key, "circuit open")
+
+        connect, read = self.timeouts[endpoint]
+        call_deadline = time.monotonic() + read
+        deadline = min(deadline, call_deadline) if deadline else call_deadline
+        error = None
+        attempts = 0
+        for attempt in range(self.retries + 1):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0.05:
+                error = error or "cycle deadline reached"
+                break
+            attempts += 1
+            try:
+                r = self.session.get(
+                    self.base_url + path, params=params,
+                    timeout=(min(connect, remaining), min(read, remaining)),
+                )
+                if r.status_code < 500:
+                    r.raise_for_status()
+                    data = r.json()
+                    with self.lock:
+                        breaker.record_success()
+                        self.last_good[key] = (data, time.time())
+                    return Fetched(data, False, 0.0, None)
+                error = f"HTTP {r.status_code}"
+            except requests.HTTPError as e:
+                # 4xx won't fix itself on a retry
+                error = str(e)
+                break
+            except (requests.RequestException, ValueError) as e:
+                error = f"{type(e).__name__}: {e}"
+
+            if attempt < self.retries:
+                pause = random.uniform(0, self.backoff * 2 ** attempt)
+                time.sleep(min(pause, max(deadline - time.monotonic(), 0)))
+
+        # Running out of cycle budget before asking isn't the endpoint's fault
+        if attempts:
+            with self.lock:
+                breaker.record_failure(time.monotonic())
+        return self._fallback(key, error)
+
+    # ---------- ENDPOINTS ----------
+    def schedule(self, day, hydrate="team,linescore", deadline=None):
+        params = {"sportId": 1, "date": day, "hydrate": hydrate}
+        return self.get_json("schedule", "/api/v1/schedule", f"schedule:{day}:{hydrate}", params, deadline)
+
+    def boxscore(self, game_pk, deadline=None):
+        return self.get_json("boxscore", f"/api/v1/game/{game_pk}/boxscore", f"boxscore:{game_pk}", deadline=deadline)
+
+    def feed(self, game_pk, deadline=None):
+        return self.get_json("feed", f"/api/v1.1/game/{game_pk}/feed/live", f"feed:{game_pk}", deadline=deadline)
+
+
+_shared = {}
+
+
+def shared_client():
+    # Process-wide client so breakers and last-good state survive reruns and sessions
+    if "client" not in _shared:
+        _shared["client"] = MLBClient()
+    return _shared["client"]
+
+
+def fetch_games(client, game_pks, deadline=None, endpoints=("boxscore", "feed"), workers=FETCH_WORKERS):
+    # {game_pk: {endpoint: Fetched}}; every request runs in parallel, so one
+    # hung game or endpoint can't hold up the rest
+    calls = [(pk, endpoint) for pk in game_pks for endpoint in endpoints]
+    if not calls:
+        return {}
+
+    def fetch(call):
+        pk, endpoint = call
+        return getattr(client, endpoint)(pk, deadline=deadline)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(calls))) as pool:
+        for (pk, endpoint), fetched in zip(calls, pool.map(fetch, calls)):
+            results.setdefault(pk, {})[endpoint] = fetched
+    return results
+
+
+def schedule_games(fetched):
+    # Games from a schedule response (fresh or last-good); [] if there is none
+    data = fetched.data or {}
+    return data["dates"][0].get("games", []) if data.get("dates") else []
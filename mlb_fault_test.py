@@ -0,0 +1,88 @@
+import time
+import numpy as np
+from fake_mlb_server import start_fake_server, no_faults
+from mlb_client import MLBClient, fetch_games, schedule_games, CYCLE_BUDGET
+
+CYCLES = 12
+
+# Runs the Live Tracker's fetch cycle (schedule, then every game's boxscore
+# and feed under one deadline) against the fake server with faults injected.
+# A cycle passes if it stays inside the budget and every game still has data,
+# fresh or last-good.
+
+
+def run_cycle(client, day="2025-07-01", budget=CYCLE_BUDGET):
+    start = time.monotonic()
+    deadline = start + budget
+    schedule = client.schedule(day, deadline=deadline)
+    games = schedule_games(schedule)
+    fetched = fetch_games(client, [g["gamePk"] for g in games], deadline)
+
+    results = [r for per_game in fetched.values() for r in per_game.values()] + [schedule]
+    return {
+        "seconds": time.monotonic() - start,
+        "games": len(games),
+        "stale": sum(r.stale and r.data is not None for r in results),
+        "missing": sum(r.data is None for r in results),
+    }
+
+
+def scenario(server, base_url, name, faults, cycles=CYCLES, warm=True, cooldown=2.0, **client_args):
+    client = MLBClient(base_url, cooldown=cooldown, **client_args)
+    if warm:
+        # Last-good state comes from a healthy cycle first, as it would mid-game
+        server.state["faults"] = no_faults()
+        run_cycle(client)
+
+    server.state["faults"] = faults
+    server.state["requests"] = {}
+    runs = [run_cycle(client) for _ in range(cycles)]
+    server.state["faults"] = no_faults()
+
+    seconds = np.array([r["seconds"] for r in runs])
+    return {
+        "scenario": name,
+        "p50_s": np.percentile(seconds, 50),
+        "max_s": seconds.max(),
+        "stale": sum(r["stale"] for r in runs),
+        "missing": sum(r["missing"] for r in runs),
+        "requests": sum(server.state["requests"].values()),
+        "open_breakers": len(client.open_breakers()),
+    }
+
+
+def faults_with(**changes):
+    faults = no_faults()
+    for key, value in changes.items():
+        if key in ("hung_games", "hang_seconds"):
+            faults[key] = value
+        else:
+            endpoint, field = key.split("__")
+            faults[endpoint][field] = value
+    return faults
+
+
+def main(cycles=CYCLES):
+    server, base_url = start_fake_server()
+    hung = set(server.game_pks[:1])
+    all_down = {f"{e}__error_rate": 1.0 for e in ("schedule", "boxscore", "feed")}
+
+    scenarios = [
+        ("healthy", no_faults()),
+        ("slow upstream (0.3s/request)", faults_with(schedule__delay=0.3, boxscore__delay=0.3, feed__delay=0.3)),
+        ("flaky (30% 500s)", faults_with(boxscore__error_rate=0.3, feed__error_rate=0.3)),
+        ("one game hangs", faults_with(hung_games=hung, hang_seconds=20.0)),
+        ("upstream down", faults_with(**all_down)),
+    ]
+
+    print(f"⏳ {cycles} cycles per scenario, {len(server.game_pks)} live games, {CYCLE_BUDGET:.0f}s cycle budget")
+    for name, faults in scenarios:
+        r = scenario(server, base_url, name, faults, cycles)
+        flag = "✅" if r["max_s"] <= CYCLE_BUDGET + 0.5 and r["missing"] == 0 else "⚠️"
+        print(f"{flag} {r['scenario']:<30} p50 {r['p50_s']:.2f}s  max {r['max_s']:.2f}s  "
+              f"stale {r['stale']:<4} missing {r['missing']:<3} requests {r['requests']:<4} open breakers {r['open_breakers']}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
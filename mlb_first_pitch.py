@@ -1,21 +1,31 @@
 import pandas as pd
 from datetime import datetime, timedelta
 import os
+from player_registry import id_to_name as registry_names
+from live_ingest import with_provisional
+from leadoff_dataset import LEADOFF_HITTERS_FILE
+from shared_data import hot_hitters_file
+from dataset_store import write_csv
 
-def get_hot_hitters(include_ball=False):
-    df = pd.read_csv("first_pitch_hitters_2025.csv")
+# Outcomes like field_out or single are `events`, never `description`; every
+# first-pitch ball in play already shows up here
+IN_PLAY_DESCRIPTIONS = ["hit_into_play", "hit_into_play_no_out", "hit_into_play_score"]
+
+def first_pitch_success(df):
+    success_no_ball = df["description"].isin(IN_PLAY_DESCRIPTIONS)
+    success_with_ball = success_no_ball | (df["description"] == "ball")
+    return success_no_ball, success_with_ball
+
+def get_hot_hitters(include_ball=False, leadoff=False):
+    # Today's live-feed first pitches count until the next Statcast pull replaces them
+    source = LEADOFF_HITTERS_FILE if leadoff else "first_pitch_hitters_2025.csv"
+    df = with_provisional(pd.read_csv(source), leadoff=leadoff)
 
     df["game_date"] = pd.to_datetime(df["game_date"], errors="coerce")
     df = df[df["game_date"] >= datetime.now() - timedelta(days=14)]
     df = df[df["pitch_number"] == 1]
 
-    success_events = ["single", "double", "triple", "home_run"]
-    success_descriptions = [
-        "hit_into_play", "field_out", "force_out", "grounded_into_double_play", "sac_fly"
-    ]
-
-    df["success_no_ball"] = df["description"].isin(success_descriptions) | df["events"].isin(success_events)
-    df["success_with_ball"] = df["success_no_ball"] | (df["description"] == "ball")
+    df["success_no_ball"], df["success_with_ball"] = first_pitch_success(df)
 
     df = df.sort_values("game_date", ascending=False)
     grouped = df.groupby("batter").head(10)
@@ -31,18 +41,18 @@ def get_hot_hitters(include_ball=False):
     if include_ball:
         summary = summary[(summary["total_pa"] == 10) & (summary["success_with_ball"] >= 8)]
         summary["Successes"] = summary["success_with_ball"]
-        save_path = "data/hot_hitters_with_ball.csv"
+        save_path = hot_hitters_file(True, leadoff)
     else:
         summary = summary[(summary["total_pa"] == 10) & (summary["success_no_ball"] >= 4)]
         summary["Successes"] = summary["success_no_ball"]
-        save_path = "data/hot_hitters_no_ball.csv"
+        save_path = hot_hitters_file(False, leadoff)
 
     print("Included after filter:", summary.shape[0])
     print(summary[["batter", "total_pa", "Successes"]].head(10))
 
     try:
-        lookup = pd.read_csv("player_name_lookup.csv")
-        id_to_name = dict(zip(lookup["key_mlbam"], lookup["full_name"]))
+        # Registry covers call-ups that player_name_lookup.csv hasn't caught up with yet
+        id_to_name = registry_names(summary["batter"])
         summary["Batter"] = summary["batter"].map(id_to_name)
     except:
         summary["Batter"] = summary["batter"]
@@ -53,10 +63,11 @@ def get_hot_hitters(include_ball=False):
     final_df = final_df.sort_values("Successes", ascending=False)
 
     os.makedirs("data", exist_ok=True)
-    final_df.to_csv(save_path, index=False)
+    write_csv(final_df, save_path)
 
     return final_df
 
-# Run both versions
-get_hot_hitters(include_ball=True)
-get_hot_hitters(include_ball=False)
+if __name__ == "__main__":
+    # Run both versions
+    get_hot_hitters(include_ball=True)
+    get_hot_hitters(include_ball=False)
@@ -0,0 +1,30 @@
+from dataset_store import write_csv
+
+PA_TABLE_FILE = "data/pa_table_2025.csv"
+PA_KEYS = ["game_pk", "at_bat_number"]
+
+# Statcast only sets `events` on the last pitch of a PA, so the first-pitch row
+# alone can't say how the PA ended. One row per PA carries both.
+
+
+def build_pa_table(df):
+    df = df.sort_values(PA_KEYS + ["pitch_number"], kind="stable")
+    # Only a real pitch_number == 1 row is a first pitch; a PA whose first
+    # pitch is missing from the data is left out rather than shifted
+    first = df[df["pitch_number"] == 1].drop_duplicates(PA_KEYS).set_index(PA_KEYS)
+    last = df.drop_duplicates(PA_KEYS, keep="last").set_index(PA_KEYS)
+
+    # Keep the first pitch under its Statcast column names so existing
+    # first-pitch code can read the PA table unchanged
+    pa = first.copy()
+    pa["pitch_count"] = df.groupby(PA_KEYS, sort=False)["pitch_number"].size()
+    pa["ended_on_first_pitch"] = pa["pitch_count"] == 1
+    pa["pa_events"] = last["events"]
+    pa["pa_description"] = last["description"]
+    pa["end_balls"] = last["balls"]
+    pa["end_strikes"] = last["strikes"]
+    return pa.reset_index()
+
+
+def save_pa_table(pa, path=PA_TABLE_FILE):
+    write_csv(pa, path)
@@ -0,0 +1,136 @@
+import os
+import csv
+import time
+import cProfile
+from contextlib import contextmanager
+from datetime import datetime
+from dataset_store import atomic_write, file_lock
+
+PROFILE_DIR = "data/profiles"
+TIMINGS_FILE = os.path.join(PROFILE_DIR, "section_timings.csv")
+TIMING_COLUMNS = ["Timestamp", "Page", "RunId", "Section", "Seconds"]
+
+# Set FIRSTPITCH_PROFILE=1 to capture a cProfile for every rerun of every page.
+# Nothing is written unless a capture is on.
+PROFILE_ENV_VAR = "FIRSTPITCH_PROFILE"
+
+# Retention: the newest .prof files per page, and the newest reruns in the
+# timings CSV (trimmed once it passes MAX_TIMINGS_BYTES)
+KEEP_PROFILES = 20
+KEEP_TIMING_RUNS = 500
+MAX_TIMINGS_BYTES = 2 * 1024 ** 2
+
+SCRIPT_END_EXCEPTIONS = {"StopException", "RerunException"}
+
+# A section opened inside another is recorded as "parent > child", so its time
+# can be told apart from (and isn't added on top of) the parent's
+SECTION_SEPARATOR = " > "
+
+
+class PageProfiler:
+    def __init__(self, page, capture=False):
+        self.page = page
+        self.run_id = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        self.capture = capture or os.environ.get(PROFILE_ENV_VAR) == "1"
+        self.timings = []
+        self.open_sections = []
+        self.started = time.perf_counter()
+        self.finished = False
+        self.profile = None
+
+        if self.capture:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    @contextmanager
+    def section(self, name):
+        path = SECTION_SEPARATOR.join(self.open_sections + [name])
+        self.open_sections.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            self._close(path, start)
+            # st.stop()/st.rerun() end the script from inside a section
+            if type(e).__name__ in SCRIPT_END_EXCEPTIONS:
+                self.finish()
+            raise
+        self._close(path, start)
+
+    def _close(self, path, start):
+        self.timings.append((path, time.perf_counter() - start))
+        self.open_sections.pop()
+
+    def finish(self):
+        if self.finished:
+            return
+        self.finished = True
+        self.timings.append(("total", time.perf_counter() - self.started))
+        if not self.capture:
+            return
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+
+        self.profile.disable()
+        self.profile.dump_stats(os.path.join(PROFILE_DIR, f"{self.page}_{self.run_id}.prof"))
+        for old in list_profiles(self.page)[KEEP_PROFILES:]:
+            try:
+                os.remove(old)
+            except FileNotFoundError:
+                pass  # another session pruned it first
+
+        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Every session appends here; the lock keeps a trim from dropping an append
+        with file_lock(TIMINGS_FILE):
+            write_header = not os.path.exists(TIMINGS_FILE)
+            with open(TIMINGS_FILE, "a", newline="") as f:
+                writer = csv.writer(f)
+                if write_header:
+                    writer.writerow(TIMING_COLUMNS)
+                for name, seconds in self.timings:
+                    writer.writerow([stamp, self.page, self.run_id, name, round(seconds, 5)])
+            if os.path.getsize(TIMINGS_FILE) > MAX_TIMINGS_BYTES:
+                trim_timings()
+
+
+def start_page_profiler(page):
+    import streamlit as st
+
+    capture = st.sidebar.checkbox("🩺 Capture profile for this rerun", value=False, key=f"profile_{page}")
+    return PageProfiler(page, capture=capture)
+
+
+# ---------- DIAGNOSTICS HELPERS ----------
+def load_timings():
+    import pandas as pd
+
+    if not os.path.exists(TIMINGS_FILE):
+        return pd.DataFrame(columns=TIMING_COLUMNS)
+    return pd.read_csv(TIMINGS_FILE)
+
+
+def is_top_level(sections):
+    return ~sections.str.contains(SECTION_SEPARATOR, regex=False)
+
+
+def trim_timings(keep=KEEP_TIMING_RUNS):
+    # Keep only the newest `keep` reruns across all pages
+    timings = load_timings()
+    recent = timings["RunId"].drop_duplicates().tail(keep)
+    timings = timings[timings["RunId"].isin(recent)]
+    atomic_write(TIMINGS_FILE, lambda tmp: timings.to_csv(tmp, index=False))
+
+
+def list_profiles(page):
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    files = [f for f in os.listdir(PROFILE_DIR) if f.startswith(f"{page}_") and f.endswith(".prof")]
+    return sorted((os.path.join(PROFILE_DIR, f) for f in files), reverse=True)
+
+
+def profile_summary(path, sort="cumulative", limit=25):
+    import io
+    import pstats
+
+    out = io.StringIO()
+    pstats.Stats(path, stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+    return out.getvalue()
@@ -0,0 +1,73 @@
+import re
+import numpy as np
+import pandas as pd
+from unidecode import unidecode
+
+DEFAULT_PAGE_SIZE = 50
+
+# Large tables stay on the server: filter and sort the cached frame, then hand
+# st.dataframe only the rows on screen.
+
+
+def _fold(name):
+    return unidecode(str(name)).lower().strip()
+
+
+class NameIndex:
+    # Every name folded into one newline-joined string, so a search is a single
+    # regex scan in C plus a searchsorted back to row numbers
+    def __init__(self, names):
+        folded = [_fold(n) if isinstance(n, str) else "" for n in names]
+        self.size = len(folded)
+        self.text = "\n".join(folded)
+        lengths = np.fromiter((len(n) + 1 for n in folded), dtype=np.int64, count=self.size)
+        self.starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]) if self.size else np.zeros(0, dtype=np.int64)
+
+    def search(self, query):
+        # Boolean mask of rows whose name contains the query (case/accent-insensitive)
+        query = _fold(query) if query else ""
+        if not query:
+            return np.ones(self.size, dtype=bool)
+        hits = np.fromiter((m.start() for m in re.finditer(re.escape(query), self.text)), dtype=np.int64)
+        mask = np.zeros(self.size, dtype=bool)
+        mask[np.searchsorted(self.starts, hits, side="right") - 1] = True
+        return mask
+
+
+def page_rows(df, mask, sort_by, ascending=False, page=1, page_size=DEFAULT_PAGE_SIZE):
+    # (rows on this page, matching row count)
+    matched = df[mask] if mask is not None else df
+    total = len(matched)
+    start = (max(page, 1) - 1) * page_size
+
+    # Top-N pages don't need a full sort
+    if start + page_size <= 1000 and pd.api.types.is_numeric_dtype(matched[sort_by]):
+        n = start + page_size
+        top = matched.nsmallest(n, sort_by) if ascending else matched.nlargest(n, sort_by)
+        if len(top) < min(n, total):
+            # nlargest drops NaNs; fall back so they still page in at the end
+            top = matched.sort_values(sort_by, ascending=ascending, kind="stable").head(n)
+        return top.iloc[start:], total
+
+    ordered = matched.sort_values(sort_by, ascending=ascending, kind="stable")
+    return ordered.iloc[start:start + page_size], total
+
+
+def render_paged_table(st, df, columns, key, sort_options, mask=None, page_size=DEFAULT_PAGE_SIZE):
+    # Sort/page controls plus the current page; `mask` carries the caller's filters
+    col1, col2, col3 = st.columns([3, 1, 1])
+    sort_by = col1.selectbox("Sort by", sort_options, key=f"{key}_sort")
+    ascending = col2.toggle("Ascending", value=False, key=f"{key}_asc")
+
+    total = int(mask.sum()) if mask is not None else len(df)
+    pages = max((total - 1) // page_size + 1, 1)
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 0) not in range(1, pages + 1):
+        # New filters can shrink the table below the page the user was on
+        st.session_state[page_key] = 1
+    page = col3.number_input(f"Page (of {pages})", min_value=1, max_value=pages, key=page_key)
+
+    rows, total = page_rows(df, mask, sort_by, ascending, page, page_size)
+    st.dataframe(rows[columns], use_container_width=True, hide_index=True)
+    first = (page - 1) * page_size + 1 if total else 0
+    st.caption(f"Showing {first}–{first + len(rows) - 1 if total else 0} of {total} rows")
@@ -1,6 +1,5 @@
 import streamlit as st
 import pandas as pd
-import requests
 from datetime import datetime
 import pytz
 import time
@@ -9,10 +8,25 @@ import json
 import gspread
 from google.oauth2 import service_account
 from unidecode import unidecode
+from page_profiler import start_page_profiler
+from leadoff_forecast import simulate_leadoffs, boxscore_obp, target_odds, format_odds, load_season_obp, lineup_obp, pregame_forecast
+from slate_loader import load_lineups
+from live_state import save_live_state, save_checkpoint, load_checkpoint, advance_plays
+from poll_scheduler import PollScheduler, game_state, DEFAULT_BASE
+from live_ingest import ingest_feed
+from mlb_client import shared_client, fetch_games, schedule_games, CYCLE_BUDGET
+from refresh_hot_hitters import refresh_if_due
+from shared_data import hot_hitter_names, name_lookup
+from alert_rules import (
+    RULES_FILE, DEFAULT_RULES, compiled_rules, compile_rules, evaluate_rules,
+    matchup_scores, pitcher_strike_pcts, pitcher_strike_pct,
+)
 
 st.set_page_config(page_title="Live Tracker", layout="wide")
 st.title("🔴 Live First Pitch Leadoff Tracker")
 
+profiler = start_page_profiler("live_tracker")
+
 # ---------- GOOGLE SHEETS CONFIG ----------
 OUTCOME_SHEET_NAME = "firstpitch_outcome_log"
 
@@ -35,19 +49,21 @@ def normalize(name):
 def normalize(name):
     return unidecode(name).lower().strip().replace("\xa0", " ")
 
-try:
-    df_with = pd.read_csv("data/hot_hitters_with_ball.csv")
-    hot_with_ball = set(df_with["Batter"].astype(str).map(normalize).dropna())
-except Exception as e:
-    st.sidebar.write("⚠️ Error loading hot_with_ball:", e)
-    hot_with_ball = set()
+leadoff_hot_lists = st.sidebar.toggle("🔝 Leadoff-only hot lists", value=False)
 
-try:
-    df_no = pd.read_csv("data/hot_hitters_no_ball.csv")
-    hot_no_ball = set(df_no["Batter"].astype(str).map(normalize).dropna())
-except Exception as e:
-    st.sidebar.write("⚠️ Error loading hot_no_ball:", e)
-    hot_no_ball = set()
+with profiler.section("load hot hitters"):
+    # Shared across sessions; reloaded only when a refresh rewrites the CSVs
+    try:
+        hot_with_ball = hot_hitter_names(include_ball=True, leadoff=leadoff_hot_lists)
+    except Exception as e:
+        st.sidebar.write("⚠️ Error loading hot_with_ball:", e)
+        hot_with_ball = set()
+
+    try:
+        hot_no_ball = hot_hitter_names(include_ball=False, leadoff=leadoff_hot_lists)
+    except Exception as e:
+        st.sidebar.write("⚠️ Error loading hot_no_ball:", e)
+        hot_no_ball = set()
 
 
 def format_hot_name(name):
@@ -61,36 +77,58 @@ def format_hot_name(name):
 target_hitters = st.session_state.get("target_hitters", set())
 normalized_targets = {normalize(name) for name in target_hitters}
 
-# ---------- HOT HITTER DEBUGGING ----------
-hot_with_ball = set()
-hot_no_ball = set()
-
-try:
-    df_with = pd.read_csv("data/hot_hitters_with_ball.csv")
-    df_with["Batter"] = df_with["Batter"].astype(str).apply(normalize)
-    hot_with_ball = set(df_with["Batter"])
-except Exception as e:
-    st.sidebar.write("⚠️ Error loading with-ball CSV:", e)
+def is_target(name):
+    return normalize(name) in normalized_targets
 
-try:
-    df_no = pd.read_csv("data/hot_hitters_no_ball.csv")
-    df_no["Batter"] = df_no["Batter"].astype(str).apply(normalize)
-    hot_no_ball = set(df_no["Batter"])
-except Exception as e:
-    st.sidebar.write("⚠️ Error loading no-ball CSV:", e)
+# ---------- ALERT RULES ----------
+# Rules from data/alert_rules.json are compiled once per edit of the file and
+# run as one batch over every game's next leadoff at the end of each cycle
+with profiler.section("load alert rules"):
+    try:
+        alert_rules = compiled_rules()
+    except (ValueError, TypeError, json.JSONDecodeError) as e:
+        st.sidebar.error(f"⚠️ Bad alert rule in {RULES_FILE}: {e}. Using the default rule.")
+        alert_rules = compile_rules(DEFAULT_RULES)
+    st.sidebar.caption(f"🚨 Alert rules: {', '.join(alert_rules['names']) or 'none'}")
 
+    try:
+        matchups = matchup_scores()
+    except Exception as e:
+        st.sidebar.write("⚠️ Error loading matchup scores:", e)
+        matchups = {}
+    try:
+        strike_pcts = pitcher_strike_pcts()
+    except Exception as e:
+        st.sidebar.write("⚠️ Error loading pitcher strike %:", e)
+        strike_pcts = {"ids": {}, "names": {}}
 
-def format_hot_name(name):
+def hot_tier(name):
     norm = normalize(name)
-
-    if norm in hot_with_ball:
-        return f"{name} 🔥🟢"
-    elif norm in hot_no_ball:
-        return f"{name} 🔥🟡"
-    return name
-
-if "alerts_fired" not in st.session_state:
-    st.session_state.alerts_fired = set()
+    return 2 if norm in hot_no_ball else 1 if norm in hot_with_ball else 0
+
+def leadoff_candidate(game, feed, side, name, player_id, locked):
+    # Everything a rule can test about one game's next leadoff (see alert_rules.FIELDS)
+    linescore = game.get("linescore", {})
+    runs = {s: linescore.get("teams", {}).get(s, {}).get("runs", game["teams"][s].get("score")) or 0 for s in ("away", "home")}
+    hit_prob, in_play_prob, hand = matchups.get(normalize(name), (None, None, None))
+    person = feed.get("gameData", {}).get("players", {}).get(f"ID{player_id}", {})
+    pitcher = feed.get("liveData", {}).get("plays", {}).get("currentPlay", {}).get("matchup", {}).get("pitcher", {})
+    return {
+        "target": is_target(name),
+        "locked": locked,
+        "hot_tier": hot_tier(name),
+        "hit_prob": hit_prob,
+        "in_play_prob": in_play_prob,
+        "pitcher_strike_pct": pitcher_strike_pct(strike_pcts, pitcher.get("id"), pitcher.get("fullName")),
+        "inning": linescore.get("currentInning", 0) + 1,
+        "score_margin": runs[side] - runs["home" if side == "away" else "away"],
+        "batter_hand": person.get("batSide", {}).get("code") or hand,
+    }
+
+# Resume fired alerts and per-game progress after a restart instead of starting cold
+if "game_checkpoints" not in st.session_state:
+    st.session_state.alerts_fired, st.session_state.game_checkpoints = load_checkpoint()
+checkpoints = st.session_state.game_checkpoints
 
 ALERTS_FILE = "data/pinned_alerts.json"
 os.makedirs("data", exist_ok=True)
@@ -102,13 +140,20 @@ else:
     st.session_state.pinned_alerts = []
 
 if "refresh_rate" not in st.session_state:
-    st.session_state.refresh_rate = 60
+    st.session_state.refresh_rate = DEFAULT_BASE
 
 refresh_rate = st.sidebar.slider(
     "🔁 Refresh Frequency (seconds)", 15, 120, st.session_state.refresh_rate, 15
 )
 st.session_state.refresh_rate = refresh_rate
 
+# Per-game polling: fast with two outs, slow between innings/in blowouts, skipped before first pitch
+if "poll_scheduler" not in st.session_state:
+    st.session_state.poll_scheduler = PollScheduler(base=refresh_rate)
+    st.session_state.game_feeds = {}
+scheduler = st.session_state.poll_scheduler
+scheduler.base = refresh_rate
+
 if st.sidebar.button("🗑️ Clear Pinned Alerts"):
     st.session_state.pinned_alerts = []
     with open(ALERTS_FILE, "w") as f:
@@ -117,193 +162,336 @@ if st.sidebar.button("🗑️ Clear Pinned Alerts"):
 eastern = pytz.timezone("US/Eastern")
 st.caption(f"🕒 Last Checked: {datetime.now(eastern).strftime('%I:%M %p').lstrip('0')} (ET)")
 
+# Timeouts, retries and per-game circuit breakers live in the client; a failed
+# call hands back the last good payload marked stale instead of an exception
+mlb = shared_client()
+cycle_deadline = time.monotonic() + CYCLE_BUDGET
+
 def get_live_games():
     now = datetime.now(eastern)
     target_date = (now - pd.Timedelta(days=1)).strftime("%Y-%m-%d") if now.hour < 4 else now.strftime("%Y-%m-%d")
-    url = f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={target_date}&hydrate=team,linescore"
-    r = requests.get(url)
-    data = r.json()
-    return data["dates"][0].get("games", []) if data.get("dates") else []
-
-games = get_live_games()
-live_games = [g for g in games if g.get("status", {}).get("detailedState") == "In Progress"]
-debug_blocks = []
-alerts = []
-leadoff_memory = {}
-
-for game in live_games:
-    try:
-        game_id = game["gamePk"]
-        linescore = game.get("linescore", {})
-        is_top = linescore.get("isTopInning", True)
-        outs = linescore.get("outs", 0)
-        inning = linescore.get("currentInning", 0)
-        side = "away" if is_top else "home"
-        team_name = game["teams"][side]["team"]["name"]
-
-        boxscore_url = f"https://statsapi.mlb.com/api/v1/game/{game_id}/boxscore"
-        boxscore = requests.get(boxscore_url).json()
-        team_data = boxscore["teams"][side]
-        players = team_data["players"]
-        batters = team_data["batters"]
-
-        feed_url = f"https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live"
-        feed = requests.get(feed_url).json()
-        play = feed.get("liveData", {}).get("plays", {}).get("currentPlay", {})
-        batter_id = play.get("matchup", {}).get("batter", {}).get("id")
-
-        if batter_id not in batters:
-            continue
-
-        valid_batters = []
-        for b in batters:
-            player = players.get(f"ID{b}", {})
-            pos_code = player.get("person", {}).get("primaryPosition", {}).get("code", "")
-            stats = player.get("stats", {})
-            is_in_lineup = "battingOrder" in player
-            has_batting_stats = any("batting" in k for k in stats.keys())
-
-            if pos_code != "P" and has_batting_stats and is_in_lineup:
-                valid_batters.append(b)
-
-        if not valid_batters or batter_id not in valid_batters:
-            continue
+    schedule = mlb.schedule(target_date, deadline=cycle_deadline)
+    if schedule.data is None:
+        st.error(f"❌ MLB schedule unavailable: {schedule.error}")
+    elif schedule.stale:
+        st.warning(f"⚠️ MLB schedule unavailable ({schedule.error}); showing the one from {schedule.age:.0f}s ago.")
+    return schedule_games(schedule)
+
+with profiler.section("schedule fetch"):
+    games = get_live_games()
+    live_games = [g for g in games if g.get("status", {}).get("detailedState") == "In Progress"]
+    live_ids = {g["gamePk"] for g in live_games}
+    st.session_state.game_feeds = {pk: v for pk, v in st.session_state.game_feeds.items() if pk in live_ids}
+    debug_blocks = []
+    alerts = []
+    leadoff_memory = {}
+    forecast_rows = []
+    alert_candidates = []
+    ingested = 0
+
+    # Reuse the last boxscore/feed until the scheduler says a game changed or is due.
+    # Every scheduled game is observed so a game that goes Final or Delayed
+    # stops (or slows) the heartbeat instead of leaving a stale wake-up behind.
+    due = set(scheduler.cycle({g["gamePk"]: game_state(g) for g in games}, time.time()))
+    due_ids = [pk for pk in (g["gamePk"] for g in live_games) if pk in due or pk not in st.session_state.game_feeds]
+with profiler.section("game fetch"):
+    fetched_games = fetch_games(mlb, due_ids, deadline=cycle_deadline)
+    if mlb.open_breakers():
+        st.sidebar.caption(f"🔌 Backing off: {', '.join(mlb.open_breakers())}")
+
+with profiler.section("process games"):
+    for game in live_games:
+        try:
+            game_id = game["gamePk"]
+            linescore = game.get("linescore", {})
+            is_top = linescore.get("isTopInning", True)
+            outs = linescore.get("outs", 0)
+            inning = linescore.get("currentInning", 0)
+            side = "away" if is_top else "home"
+            team_name = game["teams"][side]["team"]["name"]
+
+            stale_note = ""
+            if game_id in fetched_games:
+                box_fetch, feed_fetch = fetched_games[game_id]["boxscore"], fetched_games[game_id]["feed"]
+                if box_fetch.data is None or feed_fetch.data is None:
+                    st.warning(f"⚠️ No data yet for game {game_id}: {box_fetch.error or feed_fetch.error}")
+                    continue
+                boxscore, feed = box_fetch.data, feed_fetch.data
+
+                if box_fetch.stale or feed_fetch.stale:
+                    # Not cached, so the game is due again next cycle (the breaker paces retries)
+                    st.session_state.game_feeds.pop(game_id, None)
+                    age = max(f.age for f in (box_fetch, feed_fetch) if f.stale)
+                    stale_note = f" <span style='color:orange;'>⚠️ stale ({age:.0f}s old: {box_fetch.error or feed_fetch.error})</span>"
+                else:
+                    st.session_state.game_feeds[game_id] = (boxscore, feed)
+                    # Completed PAs become provisional first-pitch rows for today
+                    with profiler.section("ingest first pitches"):
+                        ingested += ingest_feed(feed)
+            else:
+                boxscore, feed = st.session_state.game_feeds[game_id]
+
+            team_data = boxscore["teams"][side]
+            players = team_data["players"]
+            batters = team_data["batters"]
+
+            # Only plays since the last checkpoint are scanned
+            all_plays = feed.get("liveData", {}).get("plays", {}).get("allPlays", [])
+            checkpoints[game_id] = advance_plays(checkpoints.get(game_id, {}), all_plays)
 
-        current_index = valid_batters.index(batter_id)
-        current_name = players.get(f"ID{batter_id}", {}).get("person", {}).get("fullName", "❓ Unknown")
+            play = feed.get("liveData", {}).get("plays", {}).get("currentPlay", {})
+            batter_id = play.get("matchup", {}).get("batter", {}).get("id")
 
-        block_lines = [f"<strong>🧠 {team_name} - Inning {inning} ({'Top' if is_top else 'Bottom'}), Outs: {outs}</strong>",
-                       f"Current Batter: {format_hot_name(current_name)} (Index {current_index})"]
+            if batter_id not in batters:
+                continue
 
-        if outs < 3:
-            projected_index = (current_index + (3 - outs)) % len(valid_batters)
-            next_id = valid_batters[projected_index]
-            next_name = players.get(f"ID{next_id}", {}).get("person", {}).get("fullName", "❓ Unknown")
+            valid_batters = []
+            for b in batters:
+                player = players.get(f"ID{b}", {})
+                pos_code = player.get("person", {}).get("primaryPosition", {}).get("code", "")
+                stats = player.get("stats", {})
+                is_in_lineup = "battingOrder" in player
+                has_batting_stats = any("batting" in k for k in stats.keys())
 
-            leadoff_memory[game_id] = {
-                "id": next_id,
-                "name": format_hot_name(next_name)
-            }
-            target_marker = " 🎯" if normalize(next_name) in normalized_targets else ""
-            block_lines.append(f"⏭️ Projected Leadoff Next Inning: {format_hot_name(next_name)}{target_marker}")
+                if pos_code != "P" and has_batting_stats and is_in_lineup:
+                    valid_batters.append(b)
 
-        else:
-            all_plays = feed.get("liveData", {}).get("plays", {}).get("allPlays", [])
-            last_batter_id = None
-            for p in reversed(all_plays):
-                batter = p.get("matchup", {}).get("batter", {}).get("id")
-                result = p.get("result", {}).get("eventType", "")
-                if batter in valid_batters and result not in {"walk", "hit_by_pitch", "balk"}:
-                    last_batter_id = batter
-                    break
-
-            if last_batter_id is None or last_batter_id not in valid_batters:
+            if not valid_batters or batter_id not in valid_batters:
                 continue
 
-            last_index = valid_batters.index(last_batter_id)
-            locked_index = (last_index + 1) % len(valid_batters)
-            locked_id = valid_batters[locked_index]
-            locked_name = players.get(f"ID{locked_id}", {}).get("person", {}).get("fullName", "❓ Unknown")
-
-            leadoff_memory[game_id] = {
-                "id": locked_id,
-                "name": format_hot_name(locked_name)
-            }
-
-            target_marker = " 🎯" if normalize(format_hot_name(locked_name)) in normalized_targets else ""
-            block_lines.append(f"<span style='color:red; font-weight:bold;'>⏭️ Leadoff Next Inning (locked): {format_hot_name(locked_name)}{target_marker}</span>")
-
-            if normalize(locked_name) in normalized_targets:
-                alert_key = (game_id, inning + 1, format_hot_name(locked_name))
-                if alert_key not in st.session_state.alerts_fired:
-                    st.session_state.alerts_fired.add(alert_key)
-                    now = datetime.now(eastern)
-                    detected_time = now.strftime('%I:%M %p').lstrip('0')
-                    alert_date = now.strftime('%Y-%m-%d')
-                    alert = {
-                        "Batter": format_hot_name(locked_name),
-                        "Team": team_name,
-                        "Will Lead Off Inning": inning + 1,
-                        "Detected At": detected_time,
-                        "Date": alert_date,
-                        "Game": f"{game['teams']['away']['team']['abbreviation']} @ {game['teams']['home']['team']['abbreviation']}",
-                        "Outcome": ""
-                    }
-                    alerts.append(alert)
-                    st.session_state.pinned_alerts.append(alert)
-                    with open(ALERTS_FILE, "w") as f:
-                        json.dump(st.session_state.pinned_alerts, f, indent=2)
-
-        debug_blocks.append(block_lines)
-
-    except Exception as e:
-        st.warning(f"⚠️ Error processing game {game.get('gamePk', '?')}: {e}")
-
-if alerts:
-    st.subheader("🚨 Leadoff Alert: Target Hitter Leading Off Next Inning")
-    for alert in alerts:
-        msg = f"**🧨 {format_hot_name(alert['Batter'])}** from the **{alert['Team']}** will lead off the **{alert['Will Lead Off Inning']}** inning. ⏰ Detected at **{alert['Detected At']}**."
-        st.markdown(f"""
-        <div style='background-color:#ff6347; color:white; padding:15px; border-radius:10px; font-weight:bold;'>
-            {msg}
-        </div>
-        """, unsafe_allow_html=True)
-else:
-    st.info("No target hitters currently set to lead off next inning.")
-
-if st.session_state.pinned_alerts:
-    with st.expander("📌 Pinned Alerts with Outcome Logging"):
-        outcome_options = ["", "In-play Hit", "In-play Out", "Ball", "Foul", "Strike Looking", "Swinging Strike"]
-
-        for i, alert in enumerate(st.session_state.pinned_alerts):
-            cols = st.columns([3, 2])
-            with cols[0]:
-                game_info = alert.get("Game", "Unknown Game")
-                alert_date = alert.get("Date", "")
-                st.markdown(f"🔔 **{format_hot_name(alert['Batter'])}** – {game_info} – Inning {alert['Will Lead Off Inning']} – ⏰ {alert['Detected At']} – 📅 {alert_date}")
-            with cols[1]:
-                outcome = st.selectbox(
-                    f"Log Outcome ({i})",
-                    outcome_options,
-                    index=outcome_options.index(alert.get("Outcome", "")),
-                    key=f"outcome_select_{i}"
+            current_index = valid_batters.index(batter_id)
+            current_name = players.get(f"ID{batter_id}", {}).get("person", {}).get("fullName", "❓ Unknown")
+
+            block_lines = [f"<strong>🧠 {team_name} - Inning {inning} ({'Top' if is_top else 'Bottom'}), Outs: {outs}</strong>{stale_note}",
+                           f"Current Batter: {format_hot_name(current_name)} (Index {current_index})"]
+
+            # Monte Carlo odds for each target hitter to lead off a later inning
+            with profiler.section("leadoff forecast"):
+                lineup_names = [players.get(f"ID{b}", {}).get("person", {}).get("fullName", "❓ Unknown") for b in valid_batters]
+                lineup_obp = [boxscore_obp(players.get(f"ID{b}", {})) for b in valid_batters]
+                forecast = simulate_leadoffs(
+                    lineup_obp,
+                    start_inning=inning,
+                    start_index=current_index + (1 if outs >= 3 else 0),
+                    outs=min(outs, 3)
                 )
-                st.session_state.pinned_alerts[i]["Outcome"] = outcome
-
-        if st.button("📤 Log Outcomes to Google Sheet"):
-            still_pinned = []
-            for alert in st.session_state.pinned_alerts:
-                outcome = alert.get("Outcome", "")
-                if outcome and not alert.get("Logged"):
-                    new_row = [
-                        alert.get("Detected At", ""),
-                        alert.get("Date", ""),
-                        alert.get("Game", ""),
-                        alert.get("Team", ""),
-                        alert.get("Batter", ""),
-                        alert.get("Will Lead Off Inning", ""),
-                        outcome
-                    ]
-                    try:
-                        outcome_sheet.append_row(new_row)
-                        alert["Logged"] = True
-                    except Exception as e:
-                        st.error(f"❌ Failed to log: {format_hot_name(alert['Batter'])} – {e}")
+                for name, chances in target_odds(lineup_names, forecast, is_target):
+                    block_lines.append(f"🔮 {format_hot_name(name)} leadoff odds: {format_odds(chances)}")
+                    forecast_rows.append({"Game": team_name, "Batter": format_hot_name(name), "Odds": format_odds(chances)})
+
+            if outs < 3:
+                projected_index = (current_index + (3 - outs)) % len(valid_batters)
+                next_id = valid_batters[projected_index]
+                next_name = players.get(f"ID{next_id}", {}).get("person", {}).get("fullName", "❓ Unknown")
+
+                leadoff_memory[game_id] = {
+                    "id": next_id,
+                    "name": format_hot_name(next_name),
+                    "team": team_name,
+                    "inning": inning + 1,
+                    "locked": False
+                }
+                target_marker = " 🎯" if normalize(next_name) in normalized_targets else ""
+                block_lines.append(f"⏭️ Projected Leadoff Next Inning: {format_hot_name(next_name)}{target_marker}")
+                alert_candidates.append((leadoff_candidate(game, feed, side, next_name, next_id, False), game, team_name, next_name))
+
+            else:
+                last_batter_id = checkpoints[game_id]["last_batter"].get(side)
+                if last_batter_id not in valid_batters:
+                    # Checkpointed batter left the lineup; fall back to a full scan
+                    last_batter_id = None
+                    for p in reversed(all_plays):
+                        batter = p.get("matchup", {}).get("batter", {}).get("id")
+                        result = p.get("result", {}).get("eventType", "")
+                        if batter in valid_batters and result not in {"walk", "hit_by_pitch", "balk"}:
+                            last_batter_id = batter
+                            break
+
+                if last_batter_id is None or last_batter_id not in valid_batters:
+                    continue
+
+                last_index = valid_batters.index(last_batter_id)
+                locked_index = (last_index + 1) % len(valid_batters)
+                locked_id = valid_batters[locked_index]
+                locked_name = players.get(f"ID{locked_id}", {}).get("person", {}).get("fullName", "❓ Unknown")
+
+                leadoff_memory[game_id] = {
+                    "id": locked_id,
+                    "name": format_hot_name(locked_name),
+                    "team": team_name,
+                    "inning": inning + 1,
+                    "locked": True
+                }
+
+                target_marker = " 🎯" if normalize(format_hot_name(locked_name)) in normalized_targets else ""
+                block_lines.append(f"<span style='color:red; font-weight:bold;'>⏭️ Leadoff Next Inning (locked): {format_hot_name(locked_name)}{target_marker}</span>")
+
+                alert_candidates.append((leadoff_candidate(game, feed, side, locked_name, locked_id, True), game, team_name, locked_name))
+
+            debug_blocks.append(block_lines)
+
+        except Exception as e:
+            st.warning(f"⚠️ Error processing game {game.get('gamePk', '?')}: {e}")
+
+with profiler.section("alert rules"):
+    fired = evaluate_rules(alert_rules, [candidate for candidate, *_ in alert_candidates])
+    for (candidate, game, team_name, name), rule_names in zip(alert_candidates, fired):
+        if not rule_names:
+            continue
+        alert_key = (game["gamePk"], candidate["inning"], format_hot_name(name))
+        if alert_key in st.session_state.alerts_fired:
+            continue
+        st.session_state.alerts_fired.add(alert_key)
+        now = datetime.now(eastern)
+        alert = {
+            "Batter": format_hot_name(name),
+            "Team": team_name,
+            "Will Lead Off Inning": candidate["inning"],
+            "Detected At": now.strftime('%I:%M %p').lstrip('0'),
+            "Date": now.strftime('%Y-%m-%d'),
+            "Game": f"{game['teams']['away']['team']['abbreviation']} @ {game['teams']['home']['team']['abbreviation']}",
+            "Rule": ", ".join(rule_names),
+            "Outcome": ""
+        }
+        alerts.append(alert)
+        st.session_state.pinned_alerts.append(alert)
+
+    if alerts:
+        with open(ALERTS_FILE, "w") as f:
+            json.dump(st.session_state.pinned_alerts, f, indent=2)
+
+with profiler.section("render alerts"):
+    if alerts:
+        st.subheader("🚨 Leadoff Alert: Target Hitter Leading Off Next Inning")
+        for alert in alerts:
+            msg = f"**🧨 {format_hot_name(alert['Batter'])}** from the **{alert['Team']}** will lead off the **{alert['Will Lead Off Inning']}** inning. ⏰ Detected at **{alert['Detected At']}**. 📏 {alert['Rule']}"
+            st.markdown(f"""
+            <div style='background-color:#ff6347; color:white; padding:15px; border-radius:10px; font-weight:bold;'>
+                {msg}
+            </div>
+            """, unsafe_allow_html=True)
+    else:
+        st.info("No target hitters currently set to lead off next inning.")
+
+    if st.session_state.pinned_alerts:
+        with st.expander("📌 Pinned Alerts with Outcome Logging"):
+            outcome_options = ["", "In-play Hit", "In-play Out", "Ball", "Foul", "Strike Looking", "Swinging Strike"]
+
+            for i, alert in enumerate(st.session_state.pinned_alerts):
+                cols = st.columns([3, 2])
+                with cols[0]:
+                    game_info = alert.get("Game", "Unknown Game")
+                    alert_date = alert.get("Date", "")
+                    st.markdown(f"🔔 **{format_hot_name(alert['Batter'])}** – {game_info} – Inning {alert['Will Lead Off Inning']} – ⏰ {alert['Detected At']} – 📅 {alert_date}" + (f" – 📏 {alert['Rule']}" if alert.get("Rule") else ""))
+                with cols[1]:
+                    outcome = st.selectbox(
+                        f"Log Outcome ({i})",
+                        outcome_options,
+                        index=outcome_options.index(alert.get("Outcome", "")),
+                        key=f"outcome_select_{i}"
+                    )
+                    st.session_state.pinned_alerts[i]["Outcome"] = outcome
+
+            if st.button("📤 Log Outcomes to Google Sheet"):
+                still_pinned = []
+                for alert in st.session_state.pinned_alerts:
+                    outcome = alert.get("Outcome", "")
+                    if outcome and not alert.get("Logged"):
+                        new_row = [
+                            alert.get("Detected At", ""),
+                            alert.get("Date", ""),
+                            alert.get("Game", ""),
+                            alert.get("Team", ""),
+                            alert.get("Batter", ""),
+                            alert.get("Will Lead Off Inning", ""),
+                            outcome
+                        ]
+                        try:
+                            outcome_sheet.append_row(new_row)
+                            alert["Logged"] = True
+                        except Exception as e:
+                            st.error(f"❌ Failed to log: {format_hot_name(alert['Batter'])} – {e}")
+                            still_pinned.append(alert)
+                    elif not outcome:
                         still_pinned.append(alert)
-                elif not outcome:
-                    still_pinned.append(alert)
-            st.session_state.pinned_alerts = still_pinned
-            with open(ALERTS_FILE, "w") as f:
-                json.dump(st.session_state.pinned_alerts, f, indent=2)
-            st.success("✅ Outcomes logged and completed alerts removed.")
-
-with st.expander("🔍 Live Game Status"):
-    for block in debug_blocks:
-        html = "<div style='border:2px solid #ccc; padding:10px; border-radius:10px; margin-bottom:10px;'>"
-        for line in block:
-            html += f"<div style='margin-bottom:4px'>{line}</div>"
-        html += "</div>"
-        st.markdown(html, unsafe_allow_html=True)
-
-time.sleep(refresh_rate)
+                st.session_state.pinned_alerts = still_pinned
+                with open(ALERTS_FILE, "w") as f:
+                    json.dump(st.session_state.pinned_alerts, f, indent=2)
+                st.success("✅ Outcomes logged and completed alerts removed.")
+
+with profiler.section("pregame forecast"):
+    # Posted lineups give early warning before first pitch; slot order drives the odds
+    lineups = load_lineups()
+    try:
+        lookup = name_lookup()
+        id_to_name = dict(zip(lookup["key_mlbam"], lookup["full_name"].str.title()))
+    except Exception:
+        id_to_name = {}
+
+    try:
+        obp_by_id = load_season_obp()
+    except Exception as e:
+        st.sidebar.write("⚠️ Error loading season OBP:", e)
+        obp_by_id = {}
+
+    pregame_games = [g for g in games if g.get("status", {}).get("abstractGameState") == "Preview"]
+    for game in pregame_games:
+        for side in ["away", "home"]:
+            team = game["teams"][side]["team"]
+            lineup = lineups.get(team.get("abbreviation", ""), [])
+            if not lineup:
+                continue
+            lineup_names = [id_to_name.get(pid, str(pid)) for pid in lineup]
+            forecast = pregame_forecast(tuple(lineup_obp(lineup, obp_by_id)))
+            for name, chances in target_odds(lineup_names, forecast, is_target):
+                forecast_rows.append({"Game": f"{team['name']} (pregame)", "Batter": format_hot_name(name), "Odds": format_odds(chances)})
+
+# Today's first pitches move the hot lists, throttled to one rebuild every
+# LIVE_REFRESH_INTERVAL across sessions; the next rerun reloads them
+if ingested:
+    with profiler.section("refresh hot hitters"):
+        try:
+            refresh_if_due()
+        except Exception as e:
+            st.sidebar.write("⚠️ Error refreshing hot hitters:", e)
+
+# Share the latest projections with the local API and scripts
+leadoff_rows = [{"game_pk": game_id, **entry} for game_id, entry in leadoff_memory.items()]
+try:
+    save_live_state(leadoff_rows, forecast_rows)
+except OSError as e:
+    st.sidebar.warning(f"⚠️ Couldn't save live state: {e}")
+
+# Checkpoint after every cycle; games no longer on today's schedule are dropped.
+# Alerts fired by other open tabs come back merged, so they aren't fired here too.
+slate_ids = {g["gamePk"] for g in games}
+st.session_state.game_checkpoints = {pk: c for pk, c in checkpoints.items() if pk in slate_ids}
+st.session_state.alerts_fired = {key for key in st.session_state.alerts_fired if key[0] in slate_ids}
+try:
+    st.session_state.alerts_fired = save_checkpoint(
+        st.session_state.alerts_fired, st.session_state.game_checkpoints, slate_ids
+    )
+except OSError as e:
+    # A failed save must not stop the auto-refresh loop below
+    st.sidebar.warning(f"⚠️ Couldn't save checkpoint: {e}")
+
+with profiler.section("render forecast"):
+    with st.expander("🔮 Target Leadoff Forecast (Innings 2–9)"):
+        if forecast_rows:
+            st.dataframe(pd.DataFrame(forecast_rows), use_container_width=True, hide_index=True)
+        else:
+            st.caption("No target hitters in posted or live lineups.")
+
+with profiler.section("render game status"):
+    with st.expander("🔍 Live Game Status"):
+        for block in debug_blocks:
+            html = "<div style='border:2px solid #ccc; padding:10px; border-radius:10px; margin-bottom:10px;'>"
+            for line in block:
+                html += f"<div style='margin-bottom:4px'>{line}</div>"
+            html += "</div>"
+            st.markdown(html, unsafe_allow_html=True)
+
+profiler.finish()
+# Wake for the soonest game that needs a look (the scheduler floors the slate heartbeat), never slower than the slider
+time.sleep(min(scheduler.seconds_until_next(time.time(), refresh_rate), refresh_rate))
 st.rerun()
@@ -2,11 +2,13 @@
 import streamlit as st
 import json
 import os
-import requests
+import time
 from unidecode import unidecode
 from datetime import datetime
 import pytz
 import pandas as pd
+from mlb_client import shared_client, fetch_games, schedule_games, CYCLE_BUDGET
+from slate_scoring import score_slate, OUTPUT_FILE, LEADOFF_OUTPUT_FILE
 
 st.title("🎯 Manage Target Hitters")
 
@@ -37,18 +39,22 @@ def get_live_hitters():
     eastern = pytz.timezone("US/Eastern")
     now = datetime.now(eastern)
     target_date = (now - pd.Timedelta(days=1)).strftime("%Y-%m-%d") if now.hour < 4 else now.strftime("%Y-%m-%d")
-    schedule_url = f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={target_date}&hydrate=team,linescore"
-    r = requests.get(schedule_url)
-    data = r.json()
-    games = data.get("dates", [{}])[0].get("games", [])
 
-    for game in games:
-        if game.get("status", {}).get("detailedState") != "In Progress":
+    # Bounded by one cycle budget; failed calls fall back to the last good copy
+    mlb = shared_client()
+    deadline = time.monotonic() + CYCLE_BUDGET
+    schedule = mlb.schedule(target_date, deadline=deadline)
+    if schedule.stale:
+        st.caption(f"⚠️ Live games may be out of date ({schedule.error})")
+    games = [g for g in schedule_games(schedule) if g.get("status", {}).get("detailedState") == "In Progress"]
+
+    fetched = fetch_games(mlb, [g["gamePk"] for g in games], deadline=deadline, endpoints=("boxscore",))
+    for per_game in fetched.values():
+        boxscore = per_game["boxscore"].data
+        if not boxscore:
             continue
         for side in ["home", "away"]:
             try:
-                boxscore_url = f"https://statsapi.mlb.com/api/v1/game/{game['gamePk']}/boxscore"
-                boxscore = requests.get(boxscore_url).json()
                 team_players = boxscore["teams"][side]["players"]
                 batters = boxscore["teams"][side]["batters"]
                 for pid in batters:
@@ -73,6 +79,33 @@ if live_hitters:
         save_targets(st.session_state["target_hitters"])
         st.success("Selected hitters added.")
 
+# --- Ranked Suggestions from Slate Scoring ---
+st.subheader("🤖 Suggested Targets (Today's Slate)")
+leadoff_only = st.toggle("Score on inning leadoff PAs only", value=False)
+SUGGESTIONS_FILE = LEADOFF_OUTPUT_FILE if leadoff_only else OUTPUT_FILE
+if st.button("🔁 Score Today's Slate"):
+    with st.spinner("Scoring batters against today's probable pitchers..."):
+        try:
+            score_slate(leadoff=leadoff_only)
+        except Exception as e:
+            st.error(f"❌ Failed to score slate: {e}")
+
+if os.path.exists(SUGGESTIONS_FILE):
+    suggestions = pd.read_csv(SUGGESTIONS_FILE)
+    if "Hit_Prob" in suggestions.columns:
+        top = suggestions.head(25)
+        st.dataframe(top, use_container_width=True, hide_index=True)
+        picked = st.multiselect("Add suggested hitters:", top["Player"].tolist())
+        added = [name for name in picked if name not in st.session_state["target_hitters"]]
+        if added:
+            st.session_state["target_hitters"].extend(added)
+            save_targets(st.session_state["target_hitters"])
+            st.success("Suggested hitters added.")
+    else:
+        st.info("Click 'Score Today's Slate' to build ranked suggestions.")
+else:
+    st.info("Click 'Score Today's Slate' to build ranked suggestions.")
+
 # --- Manual Add Option ---
 st.subheader("📝 Manually Add Target")
 new_target = st.text_input("Type a new target hitter:")
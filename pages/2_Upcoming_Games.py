@@ -38,7 +38,7 @@ if st.button("🔁 Refresh Starters (Projected Pitchers)"):
     with st.spinner("Updating projected pitchers..."):
         try:
             result = subprocess.run([
-                "python", "update_starred_pitchers.py"
+                "python", "slate_loader.py"
             ], capture_output=True, text=True, check=True)
             st.success("✅ Projected pitchers updated!")
             st.code(result.stdout)
@@ -1,16 +1,45 @@
 import streamlit as st
 import pandas as pd
+import altair as alt
 import os
-import json
 from datetime import date
-from pybaseball import statcast, playerid_reverse_lookup
+from pybaseball import statcast
+from stream_aggregates import aggregate_first_pitches, batter_table, pitcher_table, add_pitcher_counts
+from live_ingest import list_provisional, load_provisional
+from player_registry import id_to_name as registry_names
+from clean_pitcher_data import build_cleaned_pitchers
+from page_profiler import start_page_profiler
+from data_cache import data_version
+from shared_data import shared_dataset, drop_dataset, name_lookup
+from slate_loader import load_projected_pitcher_names
+from pitch_location_profiles import load_location_profiles, pitcher_profile, heatmap_frame, zone_breakdown, PROFILE_FILE
+from trend_series import build_series_index, load_series_index, rolling_rates, SERIES_FILE
+from split_cube import load_split_cube, slice_players, split_breakdown, DIMENSIONS, CUBE_FILE
+from paged_table import NameIndex, render_paged_table
+from count_transitions import load_count_transitions, count_tendencies, league_tendencies, COUNTS, TRANSITIONS_FILE
+from leadoff_dataset import leadoff_pas, LEADOFF_HITTERS_FILE, LEADOFF_PITCHERS_FILE
+from dataset_store import write_csv
 
 CSV_FILE = "first_pitch_hitters_2025.csv"
 CLEANED_PITCHER_FILE = "first_pitch_data_2025_cleaned.csv"
-
-@st.cache_data
-def load_first_pitch_data():
-    from pybaseball import statcast, playerid_reverse_lookup
+LOOKUP_FILE = "player_name_lookup.csv"
+PROJECTED_FILE = "data/projected_pitchers_today.json"
+
+# Season-sized tables are held once per process and shared by every session
+def load_first_pitch_data(path=CSV_FILE):
+    return shared_dataset(path, [path], lambda: read_first_pitch_data(path))
+
+def read_first_pitch_data(path=CSV_FILE):
+    if os.path.exists(path):
+        return pd.read_csv(path)
+    if path != CSV_FILE:
+        # The leadoff file comes from update_stats.py, not a pull from here
+        return pd.DataFrame()
+    return pull_first_pitch_data()
+
+def pull_first_pitch_data():
+    # Publishes new versions while the current files stay readable for other sessions
+    from pybaseball import statcast
     from datetime import date
 
     start = "2025-03-20"
@@ -23,90 +52,132 @@ def load_first_pitch_data():
     df = df[df["pitch_number"] == 1].copy()
 
     # Save full unfiltered first pitch data
-    df.to_csv("first_pitch_data_2025.csv", index=False)
+    write_csv(df, "first_pitch_data_2025.csv")
 
     # Remove likely pitchers from batter dataset
     batter_df = df[~df["player_name"].str.contains(" P$", na=False)]
 
     # Save hitters-only file
-    batter_df.to_csv("first_pitch_hitters_2025.csv", index=False)
+    write_csv(batter_df, CSV_FILE)
 
     return batter_df
 
-    st.warning("⚠️ Data not found. Please click 'Refresh Batters Data' to generate stats.")
-    return pd.DataFrame()
+def load_batter_table(path=CSV_FILE):
+    return shared_dataset(f"batter_table:{path}", [path, LOOKUP_FILE], lambda: build_batter_table(path))
 
-st.title("📊 Trend Explorer – First Pitch Performance")
+def build_batter_table(path=CSV_FILE):
+    df = load_first_pitch_data(path)
+    if df.empty:
+        return pd.DataFrame()
 
-if st.sidebar.button("🔄 Refresh Pitcher Data"):
-    st.info("Refreshing pitcher data, please wait...")
-    pitcher_data = statcast("2025-03-27", date.today().strftime("%Y-%m-%d"))
-    pitcher_data = pitcher_data[pitcher_data["pitch_number"] == 1]
-
-    grouped = pitcher_data.groupby("pitcher").agg(
-        **{
-            "First Pitch Total": ("pitch_type", "count"),
-            "First Pitch In-Play #": ("description", lambda x: (x == "hit_into_play").sum()),
-            "First Pitch Ball #": ("description", lambda x: (x == "ball").sum()),
-            "First Pitch Called Strike #": ("description", lambda x: (x == "called_strike").sum()),
-            "First Pitch Swinging Strike #": ("description", lambda x: (x == "swinging_strike").sum()),
-            "First Pitch Foul #": ("description", lambda x: (x == "foul").sum()),
-            "First Pitch Hit #": ("events", lambda x: x.isin(["single", "double", "triple", "home_run"]).sum()),
-            "First Pitch xBA": ("estimated_ba_using_speedangle", lambda x: x.mean(skipna=True)),
-        }
-    )
+    # The season frame is shared, so derive rather than convert in place
+    df = df.assign(batter=pd.to_numeric(df["batter"], errors="coerce"))
 
-    grouped["First Pitch In-Play %"] = (grouped["First Pitch In-Play #"] / grouped["First Pitch Total"]).round(3)
-    grouped["First Pitch Ball %"] = (grouped["First Pitch Ball #"] / grouped["First Pitch Total"]).round(3)
-    grouped["First Pitch Strike %"] = (
-        (
-            grouped["First Pitch Called Strike #"] +
-            grouped["First Pitch Swinging Strike #"] +
-            grouped["First Pitch Foul #"]
-        ) / grouped["First Pitch Total"]
-    ).round(3)
-    grouped["First Pitch xBA"] = grouped["First Pitch xBA"].round(3)
-
-    grouped = grouped.reset_index().rename(columns={"pitcher": "player_id"})
-
-    name_map = playerid_reverse_lookup(grouped["player_id"].tolist())
-    name_map["player_name"] = name_map["name_first"] + " " + name_map["name_last"]
-
-    merged = grouped.merge(
-        name_map[["key_mlbam", "player_name"]],
-        left_on="player_id",
-        right_on="key_mlbam",
-        how="left"
-    )
+    lookup_df = name_lookup(LOOKUP_FILE)
+    id_to_name = dict(zip(lookup_df["key_mlbam"], lookup_df["full_name"]))
+
+    batter_sums, _ = aggregate_first_pitches(df)
+    return batter_table(batter_sums, id_to_name)
+
+def normalize_name(name):
+    if not isinstance(name, str):
+        return ""
+    if "," in name:
+        parts = [p.strip().lower() for p in name.split(",")]
+        return f"{parts[1]} {parts[0]}"
+    return name.lower()
+
+def pitcher_paths(path=CLEANED_PITCHER_FILE):
+    return [path, PROJECTED_FILE, *list_provisional()]
+
+def pitcher_version(path=CLEANED_PITCHER_FILE):
+    return data_version(*pitcher_paths(path))
+
+def load_pitcher_table(path=CLEANED_PITCHER_FILE):
+    return shared_dataset(f"pitcher_table:{path}", pitcher_paths(path), lambda: build_pitcher_table(path))
+
+def build_pitcher_table(path=CLEANED_PITCHER_FILE):
+    pitcher_df = pd.read_csv(path)
+
+    # Fold in today's first pitches from the live feeds until Statcast has them
+    provisional = load_provisional()
+    if path == LEADOFF_PITCHERS_FILE:
+        provisional = leadoff_pas(provisional)
+    if not provisional.empty:
+        _, provisional_sums = aggregate_first_pitches(provisional)
+        pitcher_df = add_pitcher_counts(pitcher_df, pitcher_table(provisional_sums))
+        unnamed = pitcher_df["player_name"].isna()
+        names = registry_names(pitcher_df.loc[unnamed, "player_id"], lower=False)
+        pitcher_df.loc[unnamed, "player_name"] = pitcher_df.loc[unnamed, "player_id"].map(names)
 
-    # ✅ Add pitcher team name safely
-    pitcher_to_team = pitcher_data.groupby("pitcher")["home_team"].first().to_dict()
-    merged["Team"] = merged["player_id"].map(pitcher_to_team)
+    pitcher_df = pitcher_df.rename(columns={"player_name": "pitcher_name"})
 
-    merged.to_csv(CLEANED_PITCHER_FILE, index=False)
+    norm_proj = set(p.lower() for p in load_projected_pitcher_names(PROJECTED_FILE))
 
+    pitcher_df["normalized_name"] = pitcher_df["pitcher_name"].map(normalize_name)
+    starred = pitcher_df["normalized_name"].isin(norm_proj)
+    pitcher_df.loc[starred, "pitcher_name"] = "🌟 " + pitcher_df.loc[starred, "pitcher_name"].astype(str)
+    pitcher_df["Is Starred"] = starred
+    return pitcher_df
+
+# Name search indexes live next to the cached tables they point into
+@st.cache_resource(max_entries=4)
+def batter_name_index(path, version):
+    return NameIndex(load_batter_table(path)["batter_name"])
+
+@st.cache_resource(max_entries=4)
+def pitcher_name_index(path, version):
+    return NameIndex(load_pitcher_table(path)["pitcher_name"])
+
+def load_trend_series():
+    def load():
+        if os.path.exists(SERIES_FILE):
+            return load_series_index(SERIES_FILE)
+        return build_series_index(load_first_pitch_data())
+    return shared_dataset("trend_series", [SERIES_FILE, CSV_FILE], load)
+
+def load_batter_ids():
+    def load():
+        lookup_df = name_lookup(LOOKUP_FILE)
+        return lookup_df.groupby(lookup_df["full_name"].str.lower())["key_mlbam"].apply(list).to_dict()
+    return shared_dataset("batter_ids", [LOOKUP_FILE], load)
+
+def load_cube():
+    return shared_dataset("split_cube", [CUBE_FILE], lambda: load_split_cube(CUBE_FILE))
+
+def load_transitions():
+    return shared_dataset("count_transitions", [TRANSITIONS_FILE], lambda: load_count_transitions(TRANSITIONS_FILE))
+
+def load_profiles():
+    return shared_dataset("location_profiles", [PROFILE_FILE], lambda: load_location_profiles(PROFILE_FILE))
+
+st.title("📊 Trend Explorer – First Pitch Performance")
+
+profiler = start_page_profiler("trend_explorer")
+
+# Leadoff-only tables are precomputed by update_stats.py alongside the all-PA ones
+leadoff_only = st.sidebar.toggle("🔝 Inning leadoff PAs only", value=False)
+batter_file = LEADOFF_HITTERS_FILE if leadoff_only else CSV_FILE
+pitcher_file = LEADOFF_PITCHERS_FILE if leadoff_only else CLEANED_PITCHER_FILE
+
+if st.sidebar.button("🔄 Refresh Pitcher Data"):
+    st.info("Refreshing pitcher data, please wait...")
+    build_cleaned_pitchers(CLEANED_PITCHER_FILE)
     st.success("Pitcher data refreshed!")
     st.rerun()
 
 if st.sidebar.button("🔄 Refresh Batter Data"):
-    if os.path.exists(CSV_FILE):
-        os.remove(CSV_FILE)
-    st.cache_data.clear()
+    # The old files keep serving other sessions until the new versions swap in
+    with st.spinner("Pulling fresh first pitch data..."):
+        pull_first_pitch_data()
+    drop_dataset()
     st.rerun()
 if st.sidebar.button("🧼 One-Click Full Refresh and Regenerate"):
-    files = [
-        "first_pitch_data_2025.csv",
-        "first_pitch_hitters_2025.csv"
-    ]
-    for file in files:
-        if os.path.exists(file):
-            os.remove(file)
-
-    st.cache_data.clear()
     st.info("Generating fresh first pitch data... please wait.")
 
-    # Regenerate CSV
-    df = load_first_pitch_data()
+    # Regenerate CSVs as new versions, then reload
+    df = pull_first_pitch_data()
+    drop_dataset()
 
     if df.empty:
         st.error("❌ Failed to generate fresh data.")
@@ -114,120 +185,236 @@ if st.sidebar.button("🧼 One-Click Full Refresh and Regenerate"):
         st.success("✅ First pitch data successfully refreshed and reloaded.")
         st.rerun()
 
-with st.spinner("Loading 2025 first pitch data..."):
-    df = load_first_pitch_data()
+with profiler.section("load batter table"):
+    batter_version = data_version(batter_file, LOOKUP_FILE)
+    with st.spinner("Loading 2025 first pitch data..."):
+        grouped = load_batter_table(batter_file)
 
-if df.empty:
-    st.stop()
+    if grouped.empty:
+        if leadoff_only:
+            st.warning("⚠️ No leadoff data yet. Run update_stats.py (or build.py) to generate it.")
+        else:
+            st.warning("⚠️ Data not found. Please click 'Refresh Batters Data' to generate stats.")
+        st.stop()
 
 st.subheader("Search and Filter First Pitch Hitters")
 
-df["batter"] = pd.to_numeric(df["batter"], errors="coerce")
-
-lookup_df = pd.read_csv("player_name_lookup.csv")
-id_to_name = dict(zip(lookup_df["key_mlbam"], lookup_df["full_name"]))
-
-df["batter_name"] = df["batter"].map(id_to_name).str.lower()
-
-grouped = df.groupby("batter_name").agg(
-    total_fp=("pitch_type", "count"),
-    balls=("description", lambda x: (x == "ball").sum()),
-    singles=("events", lambda x: (x == "single").sum()),
-    xbh=("events", lambda x: x.isin(["double", "triple", "home_run"]).sum()),
-    hits=("events", lambda x: x.isin(["single", "double", "triple", "home_run"]).sum()),
-    fouls=("description", lambda x: (x == "foul").sum()),
-    in_play=("description", lambda x: (x == "hit_into_play").sum()),
-    swings=("description", lambda x: x.isin(["foul", "swinging_strike", "swinging_strike_blocked", "hit_into_play"]).sum()),
-    strikes_looking=("description", lambda x: (x == "called_strike").sum())
-)
-
-grouped["in_play_pct"] = (grouped["in_play"] / grouped["total_fp"]).round(3)
-grouped["swing_pct"] = (grouped["swings"] / grouped["total_fp"]).round(3)
-grouped["strike_look_pct"] = (grouped["strikes_looking"] / grouped["total_fp"]).round(3)
-grouped = grouped.reset_index()
-
-min_fp = st.sidebar.slider("Minimum First Pitch ABs", 5, 100, 10)
-filtered = grouped[grouped["total_fp"] >= min_fp]
-
-search_query = st.text_input("Search by batter name:")
-if search_query:
-    filtered = filtered[filtered["batter_name"].str.contains(search_query, case=False)]
-
-st.dataframe(
-    filtered.sort_values("in_play_pct", ascending=False)[[
-        "batter_name", "total_fp", "in_play", "in_play_pct",
-        "swings", "swing_pct", "strikes_looking", "strike_look_pct",
-        "xbh", "hits", "balls"
-    ]],
-    use_container_width=True,
-    hide_index=True
-)
+with profiler.section("batter filter"):
+    min_fp = st.sidebar.slider("Minimum First Pitch ABs", 5, 100, 10)
+    search_query = st.text_input("Search by batter name:")
+    batter_mask = (grouped["total_fp"] >= min_fp).to_numpy() & batter_name_index(batter_file, batter_version).search(search_query)
+    filtered = grouped[batter_mask]
+
+with profiler.section("render batter table"):
+    # Only the visible page is sent to the browser
+    render_paged_table(
+        st, grouped,
+        [
+            "batter_name", "total_fp", "in_play", "in_play_pct",
+            "swings", "swing_pct", "strikes_looking", "strike_look_pct",
+            "xbh", "hits", "balls"
+        ],
+        key="batters",
+        sort_options=["in_play_pct", "swing_pct", "strike_look_pct", "total_fp", "hits", "xbh", "batter_name"],
+        mask=batter_mask
+    )
 
-st.markdown("---")
-show_pitchers = st.toggle("🎯 Show Pitcher First Pitch Trends", value=True)
+st.subheader("📈 Rolling First Pitch Trends")
 
-if show_pitchers:
-    st.subheader("🎯 Pitcher First Pitch Trends")
+with profiler.section("rolling trend chart"):
+    series = load_trend_series()
 
-    try:
-        pitcher_df = pd.read_csv(CLEANED_PITCHER_FILE)
-        pitcher_df = pitcher_df.rename(columns={"player_name": "pitcher_name"})
-    except FileNotFoundError:
-        st.warning("Missing cleaned pitcher data file. Please ensure first_pitch_data_2025_cleaned.csv exists.")
-        st.stop()
+    col1, col2, col3 = st.columns(3)
+    role = col1.radio("Player type", ["Batter", "Pitcher"], horizontal=True)
+    metric = col2.radio("Metric", ["In-Play %", "Swing %"], horizontal=True)
+    window = col3.slider("Rolling window (days)", 3, 60, 14)
 
-    projected_path = "data/projected_pitchers_today.json"
-    if os.path.exists(projected_path):
-        with open(projected_path) as f:
-            target_pitchers = set(json.load(f))
-            norm_proj = set(p.lower() for p in target_pitchers)
+    if role == "Batter":
+        batter_ids = load_batter_ids()
+        pick = st.selectbox("Batter", filtered["batter_name"].tolist())
+        player_ids = batter_ids.get(pick, [])
+    elif os.path.exists(CLEANED_PITCHER_FILE):
+        pitchers = load_pitcher_table().dropna(subset=["player_id"])
+        pick = st.selectbox("Pitcher", pitchers["pitcher_name"].tolist())
+        player_ids = pitchers.loc[pitchers["pitcher_name"] == pick, "player_id"].astype(int).tolist()
     else:
-        norm_proj = set()
-
-    def normalize_name(name):
-        if not isinstance(name, str):
-            return ""
-        if "," in name:
-            parts = [p.strip().lower() for p in name.split(",")]
-            return f"{parts[1]} {parts[0]}"
-        return name.lower()
-
-    pitcher_df["normalized_name"] = pitcher_df["pitcher_name"].apply(normalize_name)
-    pitcher_df["pitcher_name"] = pitcher_df.apply(
-        lambda row: "🌟 " + row["pitcher_name"] if row["normalized_name"] in norm_proj else row["pitcher_name"],
-        axis=1
-    )
-    pitcher_df["Is Starred"] = pitcher_df["pitcher_name"].astype(str).str.startswith("🌟")
-    pitcher_df["Is Starred"] = pitcher_df["Is Starred"].fillna(False)
+        player_ids = []
 
-    min_pitch_fp = st.sidebar.slider("Minimum First Pitch PAs (Pitchers)", 5, 100, 10)
-
-    if "First Pitch Total" in pitcher_df.columns:
-        pitcher_filtered = pitcher_df[pitcher_df["First Pitch Total"] >= min_pitch_fp]
+    rolled = rolling_rates(series, role.lower(), player_ids, window) if player_ids else pd.DataFrame()
+    if rolled.empty:
+        st.info("No first pitch history for this player.")
+    else:
+        st.line_chart(rolled[metric])
+        st.caption(f"{metric} over the trailing {window} days ({int(rolled['total_fp'].iloc[-1])} first pitches in the latest window)")
 
-        filter_starred = st.sidebar.checkbox("⭐ Show Only Starred Pitchers", value=False)
-        if filter_starred:
-            pitcher_filtered = pitcher_filtered[pitcher_filtered["Is Starred"]]
+st.markdown("---")
+st.subheader("🧊 First Pitch Splits")
+
+if not os.path.exists(CUBE_FILE):
+    st.info("No split cube yet. Run update_stats.py to build it.")
+else:
+    with profiler.section("split cube"):
+        cube = load_cube()
+        split_labels = {
+            "stand": "Batter hand", "p_throws": "Pitcher hand", "venue": "Batter home/away",
+            "month": "Month", "inning": "Inning", "tto": "Times through order",
+        }
 
-        pitcher_query = st.text_input("Search by pitcher name:")
-        if pitcher_query:
-            pitcher_filtered = pitcher_filtered[pitcher_filtered["pitcher_name"].str.contains(pitcher_query, case=False)]
+        split_role = st.radio("Split players", ["Batter", "Pitcher"], horizontal=True, key="split_role")
+        filter_cols = st.columns(len(DIMENSIONS))
+        split_filters = {}
+        for col, (dim, labels) in zip(filter_cols, DIMENSIONS.items()):
+            picked = col.multiselect(split_labels[dim], labels, default=labels, key=f"split_{dim}")
+            if len(picked) < len(labels):
+                split_filters[dim] = picked
+
+        role = split_role.lower()
+        split_df = slice_players(cube, role, split_filters)
+        if role == "batter":
+            lookup_df = name_lookup(LOOKUP_FILE)
+            id_to_name = dict(zip(lookup_df["key_mlbam"], lookup_df["full_name"]))
+        elif os.path.exists(CLEANED_PITCHER_FILE):
+            pitchers = load_pitcher_table().dropna(subset=["player_id"])
+            id_to_name = dict(zip(pitchers["player_id"].astype(int), pitchers["pitcher_name"]))
+        else:
+            id_to_name = {}
+        split_df.insert(0, "name", split_df["player_id"].map(id_to_name).fillna(split_df["player_id"].astype(str)))
+
+        min_split_fp = st.slider("Minimum first pitches in split", 1, 100, 10, key="split_min_fp")
+        render_paged_table(
+            st, split_df,
+            [
+                "name", "total_fp", "in_play", "in_play_pct", "swings", "swing_pct",
+                "called_strikes", "strike_look_pct", "hits", "balls", "ball_pct"
+            ],
+            key="splits",
+            sort_options=["in_play_pct", "swing_pct", "strike_look_pct", "ball_pct", "total_fp", "name"],
+            mask=(split_df["total_fp"] >= min_split_fp).to_numpy()
+        )
 
+        breakdown_dim = st.selectbox("Break down by", list(DIMENSIONS), format_func=split_labels.get)
         st.dataframe(
-            pitcher_filtered.sort_values("First Pitch In-Play %", ascending=False)[[
-                "pitcher_name",
-                "Team",
-                "First Pitch Total",
-                "First Pitch In-Play #",
-                "First Pitch In-Play %",
-                "First Pitch Strike %",
-                "First Pitch Ball %",
-                "First Pitch Hit #",
-                "First Pitch xBA"
+            split_breakdown(cube, role, breakdown_dim, split_filters)[[
+                breakdown_dim, "total_fp", "in_play_pct", "swing_pct", "strike_look_pct", "ball_pct"
             ]],
             use_container_width=True,
             hide_index=True
         )
+
+st.markdown("---")
+st.subheader("🔢 Count Tendencies")
+
+if not os.path.exists(TRANSITIONS_FILE):
+    st.info("No count transitions yet. Run update_stats.py to build them.")
+else:
+    with profiler.section("count tendencies"):
+        transitions = load_transitions()
+
+        col1, col2 = st.columns([1, 3])
+        count_role = col1.radio("Player type", ["Batter", "Pitcher"], horizontal=True, key="count_role")
+        picked_counts = col2.multiselect("Counts", COUNTS, default=["0-0", "1-0", "0-1"])
+
+        if count_role == "Batter":
+            pick = st.selectbox("Batter", filtered["batter_name"].tolist(), key="count_batter")
+            count_ids = load_batter_ids().get(pick, [])
+        elif os.path.exists(CLEANED_PITCHER_FILE):
+            pitchers = load_pitcher_table().dropna(subset=["player_id"])
+            pick = st.selectbox("Pitcher", pitchers["pitcher_name"].tolist(), key="count_pitcher")
+            count_ids = pitchers.loc[pitchers["pitcher_name"] == pick, "player_id"].astype(int).tolist()
+        else:
+            count_ids = []
+
+        tendencies = count_tendencies(transitions, count_role.lower(), count_ids, picked_counts) if count_ids and picked_counts else None
+        if tendencies is None:
+            st.info("No pitches seen for this player in those counts.")
+        else:
+            st.dataframe(tendencies, use_container_width=True)
+            st.caption("League, same counts:")
+            st.dataframe(league_tendencies(transitions, picked_counts), use_container_width=True)
+
+st.markdown("---")
+show_pitchers = st.toggle("🎯 Show Pitcher First Pitch Trends", value=True)
+
+if show_pitchers:
+    st.subheader("🎯 Pitcher First Pitch Trends")
+
+    with profiler.section("load pitcher table"):
+        if not os.path.exists(pitcher_file):
+            st.warning(f"Missing cleaned pitcher data file. Please ensure {pitcher_file} exists.")
+            st.stop()
+
+        pitcher_table_version = pitcher_version(pitcher_file)
+        pitcher_df = load_pitcher_table(pitcher_file)
+
+    min_pitch_fp = st.sidebar.slider("Minimum First Pitch PAs (Pitchers)", 5, 100, 10)
+
+    if "First Pitch Total" in pitcher_df.columns:
+        with profiler.section("pitcher filter"):
+            pitcher_mask = (pitcher_df["First Pitch Total"] >= min_pitch_fp).to_numpy()
+
+            filter_starred = st.sidebar.checkbox("⭐ Show Only Starred Pitchers", value=False)
+            if filter_starred:
+                pitcher_mask &= pitcher_df["Is Starred"].to_numpy()
+
+            pitcher_query = st.text_input("Search by pitcher name:")
+            pitcher_mask &= pitcher_name_index(pitcher_file, pitcher_table_version).search(pitcher_query)
+            pitcher_filtered = pitcher_df[pitcher_mask]
+
+        with profiler.section("render pitcher table"):
+            render_paged_table(
+                st, pitcher_df,
+                [
+                    "pitcher_name",
+                    "Team",
+                    "First Pitch Total",
+                    "First Pitch In-Play #",
+                    "First Pitch In-Play %",
+                    "First Pitch Strike %",
+                    "First Pitch Ball %",
+                    "First Pitch Hit #",
+                    "First Pitch xBA"
+                ],
+                key="pitchers",
+                sort_options=["First Pitch In-Play %", "First Pitch Strike %", "First Pitch Ball %", "First Pitch Total", "First Pitch xBA", "pitcher_name"],
+                mask=pitcher_mask
+            )
+
+        with st.expander("🗺️ First Pitch Location & Mix"):
+            if not os.path.exists(PROFILE_FILE) or "player_id" not in pitcher_filtered.columns:
+                st.info("No location profiles yet. Run update_stats.py to build them.")
+            elif not pitcher_filtered.empty:
+                with profiler.section("location drilldown"):
+                    profiles = load_profiles()
+                    pick = st.selectbox("Pitcher", pitcher_filtered["pitcher_name"].tolist())
+                    hand = st.radio("Batter hand", ["All", "L", "R"], horizontal=True)
+
+                    pitcher_id = int(pitcher_filtered.loc[pitcher_filtered["pitcher_name"] == pick, "player_id"].iloc[0])
+                    profile = pitcher_profile(profiles, pitcher_id, None if hand == "All" else hand)
+                    if profile is None:
+                        st.info("No located first pitches for this pitcher.")
+                    else:
+                        location, zones, mix = profile
+                        heat = alt.Chart(heatmap_frame(profiles, location)).mark_rect().encode(
+                            x=alt.X("plate_x:O", title="Plate X (ft)", sort="ascending"),
+                            y=alt.Y("plate_z:O", title="Plate Z (ft)", sort="descending"),
+                            color=alt.Color("pitches:Q", scale=alt.Scale(scheme="reds")),
+                            tooltip=["plate_x", "plate_z", "pitches"],
+                        )
+                        col1, col2 = st.columns(2)
+                        col1.altair_chart(heat, use_container_width=True)
+                        col2.bar_chart(mix)
+
+                        # Zone breakdown: where the first pitch lands by Statcast zone
+                        grid, chase = zone_breakdown(zones)
+                        st.metric("In-zone first pitches", f"{grid.to_numpy().sum():.1%}", help=f"{int(zones.sum())} pitches with a zone")
+                        col1, col2 = st.columns(2)
+                        col1.caption("Strike zone (catcher's view)")
+                        col1.dataframe(grid.style.format("{:.1%}"), use_container_width=True)
+                        col2.caption("Chase quadrants")
+                        col2.dataframe(chase.to_frame().style.format("{:.1%}"), use_container_width=True)
     else:
         st.error("🚫 'First Pitch Total' column not found in pitcher data.")
-        st.stop()
\ No newline at end of file
+        profiler.finish()
+        st.stop()
+
+profiler.finish()
@@ -0,0 +1,47 @@
+import streamlit as st
+import os
+from page_profiler import load_timings, list_profiles, profile_summary, is_top_level, PROFILE_ENV_VAR
+
+st.set_page_config(page_title="Diagnostics", layout="wide")
+st.title("🩺 Page Render Diagnostics")
+
+timings = load_timings()
+if timings.empty:
+    st.info(f"No timings recorded yet. Tick '🩺 Capture profile' in the Trend Explorer or Live Tracker sidebar, or set {PROFILE_ENV_VAR}=1.")
+    st.stop()
+
+page = st.selectbox("Page", sorted(timings["Page"].unique()))
+history = st.sidebar.slider("Reruns to include", 5, 500, 50, 5)
+
+page_timings = timings[timings["Page"] == page]
+recent_runs = page_timings["RunId"].drop_duplicates().tail(history)
+page_timings = page_timings[page_timings["RunId"].isin(recent_runs)]
+
+# Sections can repeat within a rerun (e.g. one fetch per game), so sum per run first
+per_run = page_timings.groupby(["RunId", "Section"], sort=False)["Seconds"].sum().reset_index()
+
+st.subheader("🐢 Slowest Sections")
+summary = per_run[per_run["Section"] != "total"].groupby("Section")["Seconds"].agg(
+    Runs="count",
+    Mean="mean",
+    P95=lambda x: x.quantile(0.95),
+    Max="max",
+).sort_values("Mean", ascending=False).round(4).reset_index()
+st.dataframe(summary, use_container_width=True, hide_index=True)
+
+st.subheader("📈 Rerun History")
+# Nested sections ("parent > child") are already inside their parent's bar
+top_level = per_run[(per_run["Section"] != "total") & is_top_level(per_run["Section"])]
+totals = top_level.pivot_table(
+    index="RunId", columns="Section", values="Seconds", aggfunc="sum", fill_value=0
+)
+st.bar_chart(totals)
+
+st.subheader("🔬 Captured Profiles")
+profiles = list_profiles(page)
+if profiles:
+    chosen = st.selectbox("Profile", profiles, format_func=os.path.basename)
+    sort = st.radio("Sort by", ["cumulative", "tottime", "ncalls"], horizontal=True)
+    st.code(profile_summary(chosen, sort=sort))
+else:
+    st.caption(f"No cProfile captures for this page. Tick '🩺 Capture profile' in its sidebar or set {PROFILE_ENV_VAR}=1.")
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+from dataset_store import write_npz
+
+PROFILE_FILE = "data/pitcher_location_profiles.npz"
+INPUT_FILE = "first_pitch_data_2025.csv"
+
+# Fixed grid over the plate area in feet (catcher's view); outside pitches land in the edge bins
+X_EDGES = np.linspace(-2.0, 2.0, 17)
+Z_EDGES = np.linspace(0.0, 5.0, 21)
+STANDS = ["L", "R"]
+ZONES = 15  # Statcast zones 1-9 and 11-14, indexed by zone number
+
+
+def _bin(values, edges):
+    idx = np.searchsorted(edges, values, side="right") - 1
+    return np.clip(idx, 0, len(edges) - 2)
+
+
+def build_location_profiles(df):
+    df = df[(df["pitch_number"] == 1) & df["stand"].isin(STANDS)]
+    df = df.dropna(subset=["pitcher"])
+
+    pitcher_ids, p = np.unique(df["pitcher"].astype(np.int64).to_numpy(), return_inverse=True)
+    s = (df["stand"] == "R").to_numpy().astype(np.int64)
+    n_p, n_s = len(pitcher_ids), len(STANDS)
+    n_x, n_z = len(X_EDGES) - 1, len(Z_EDGES) - 1
+
+    located = df["plate_x"].notna().to_numpy() & df["plate_z"].notna().to_numpy()
+    xi = _bin(df["plate_x"].fillna(0).to_numpy(), X_EDGES)
+    zi = _bin(df["plate_z"].fillna(0).to_numpy(), Z_EDGES)
+    cell = ((p * n_s + s) * n_z + zi) * n_x + xi
+    location = np.bincount(cell[located], minlength=n_p * n_s * n_z * n_x)
+
+    zone = pd.to_numeric(df["zone"], errors="coerce").to_numpy()
+    has_zone = ~np.isnan(zone) & (zone > 0) & (zone < ZONES)
+    zone_cell = (p * n_s + s) * ZONES + np.nan_to_num(zone).astype(np.int64)
+    zones = np.bincount(zone_cell[has_zone], minlength=n_p * n_s * ZONES)
+
+    pitch_types, t = np.unique(df["pitch_type"].fillna("UN").to_numpy(dtype=str), return_inverse=True)
+    mix = np.bincount((p * n_s + s) * len(pitch_types) + t, minlength=n_p * n_s * len(pitch_types))
+
+    return {
+        "pitcher_ids": pitcher_ids,
+        "location": location.reshape(n_p, n_s, n_z, n_x).astype(np.uint16),
+        "zones": zones.reshape(n_p, n_s, ZONES).astype(np.uint16),
+        "pitch_mix": mix.reshape(n_p, n_s, len(pitch_types)).astype(np.uint16),
+        "pitch_types": pitch_types,
+        "x_edges": X_EDGES,
+        "z_edges": Z_EDGES,
+    }
+
+
+def save_location_profiles(profiles, path=PROFILE_FILE):
+    write_npz(path, profiles)
+
+
+def load_location_profiles(path=PROFILE_FILE):
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
+
+
+def pitcher_profile(profiles, pitcher_id, stand=None):
+    # (location heatmap, zone counts, pitch mix) for one pitcher, optionally vs one batter hand
+    row = np.searchsorted(profiles["pitcher_ids"], pitcher_id)
+    if row >= len(profiles["pitcher_ids"]) or profiles["pitcher_ids"][row] != pitcher_id:
+        return None
+
+    hands = slice(None) if stand is None else STANDS.index(stand)
+    location = profiles["location"][row, hands].astype(np.int64)
+    zones = profiles["zones"][row, hands].astype(np.int64)
+    mix = profiles["pitch_mix"][row, hands].astype(np.int64)
+    if stand is None:
+        location, zones, mix = location.sum(axis=0), zones.sum(axis=0), mix.sum(axis=0)
+
+    mix = pd.Series(mix, index=profiles["pitch_types"])
+    return location, zones, mix[mix > 0].sort_values(ascending=False)
+
+
+def zone_breakdown(zones):
+    # Share of first pitches by Statcast zone (catcher's view): the 3x3 strike
+    # zone (1-9) as a grid, and the four chase quadrants (11-14)
+    total = zones.sum()
+    share = zones / total if total else zones.astype(float)
+    grid = pd.DataFrame(share[1:10].reshape(3, 3), index=["High", "Middle", "Low"], columns=["Left", "Center", "Right"])
+    chase = pd.Series(share[11:15], index=["High Left", "High Right", "Low Left", "Low Right"], name="share")
+    return grid, chase
+
+
+def heatmap_frame(profiles, location):
+    # Long-form cells for charting, one row per grid cell
+    x_mid = (profiles["x_edges"][:-1] + profiles["x_edges"][1:]) / 2
+    z_mid = (profiles["z_edges"][:-1] + profiles["z_edges"][1:]) / 2
+    zz, xx = np.meshgrid(z_mid, x_mid, indexing="ij")
+    return pd.DataFrame({"plate_x": xx.ravel().round(3), "plate_z": zz.ravel().round(3), "pitches": location.ravel()})
+
+
+if __name__ == "__main__":
+    df = pd.read_csv(INPUT_FILE)
+    profiles = build_location_profiles(df)
+    save_location_profiles(profiles)
+    print(f"✅ Saved first-pitch location profiles for {len(profiles['pitcher_ids'])} pitchers to {PROFILE_FILE}")
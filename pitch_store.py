@@ -0,0 +1,67 @@
+import os
+import glob
+from datetime import date
+import pandas as pd
+from dataset_store import atomic_write, PITCH_STORE_DIR
+from live_ingest import clear_provisional
+
+# Pitch-level Statcast history lives in PITCH_STORE_DIR as one CSV per game
+# month, so nothing has to hold a full season (or several) in memory at once.
+
+
+def partition_path(month, store_dir=PITCH_STORE_DIR):
+    return os.path.join(store_dir, f"pitches_{month}.csv")
+
+
+def save_pitch_partitions(df, store_dir=PITCH_STORE_DIR):
+    os.makedirs(store_dir, exist_ok=True)
+    months = pd.to_datetime(df["game_date"], errors="coerce").dt.strftime("%Y-%m")
+
+    paths = []
+    for month, part in df.groupby(months):
+        path = partition_path(month, store_dir)
+        # Partitions are read while a backfill runs, so each lands whole
+        atomic_write(path, lambda tmp: part.to_csv(tmp, index=False))
+        paths.append(path)
+    return paths
+
+
+def list_partitions(store_dir=PITCH_STORE_DIR):
+    return sorted(glob.glob(os.path.join(store_dir, "pitches_*.csv")))
+
+
+def iter_pitch_store(start=None, end=None, store_dir=PITCH_STORE_DIR):
+    # One month's pitches at a time, limited to a game_date range; empty months are skipped.
+    # A game (and so every PA) sits wholly inside one partition.
+    for path in list_partitions(store_dir):
+        df = pd.read_csv(path)
+        dates = pd.to_datetime(df["game_date"], errors="coerce")
+        keep = pd.Series(True, index=df.index)
+        if start:
+            keep &= dates >= pd.Timestamp(start)
+        if end:
+            keep &= dates <= pd.Timestamp(end)
+        if keep.any():
+            yield df[keep]
+
+
+def load_pitch_store(start=None, end=None, store_dir=PITCH_STORE_DIR):
+    # Whole store as one frame; prefer iter_pitch_store for anything season-sized
+    parts = list(iter_pitch_store(start, end, store_dir))
+    return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+
+
+if __name__ == "__main__":
+    from pybaseball import statcast
+
+    start = "2025-03-20"
+    end = date.today().strftime("%Y-%m-%d")
+    print("⏳ Pulling Statcast pitches into the pitch store...")
+    df = statcast(start, end)
+    paths = save_pitch_partitions(df)
+    print(f"✅ Saved {len(paths)} partitions to {PITCH_STORE_DIR}")
+
+    # Statcast rows replace the live-feed rows for every day it now covers
+    removed = clear_provisional(pd.to_datetime(df["game_date"]).max().strftime("%Y-%m-%d"))
+    if removed:
+        print(f"🧹 Replaced {len(removed)} provisional partitions")
@@ -0,0 +1,86 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+from data_cache import file_version
+from dataset_store import atomic_write, file_lock
+
+REGISTRY_FILE = "data/player_registry.csv"
+REGISTRY_COLUMNS = ["key_mlbam", "name_first", "name_last"]
+
+# MLBAM id -> name for batters and pitchers alike. Only ids the registry has
+# never seen go to pybaseball (which loads the whole Chadwick register per call);
+# everything else is an index lookup on the in-memory copy.
+_registry = {"version": None, "table": None}
+_unresolved = set()
+
+
+def _read_registry(path):
+    if not os.path.exists(path):
+        table = pd.DataFrame(columns=REGISTRY_COLUMNS)
+    else:
+        table = pd.read_csv(path, dtype={"name_first": str, "name_last": str})
+    table["key_mlbam"] = table["key_mlbam"].astype(np.int64)
+    return table.set_index("key_mlbam")
+
+
+def load_registry(path=REGISTRY_FILE):
+    version = file_version(path)
+    if _registry["version"] != version:
+        _registry["table"] = _read_registry(path)
+        _registry["version"] = version
+    return _registry["table"]
+
+
+def _add_to_registry(found, path=REGISTRY_FILE):
+    # Parallel build steps resolve ids at the same time: merge into what's on
+    # disk now, under a lock, so one writer never drops another's rows
+    with file_lock(path):
+        table = pd.concat([_read_registry(path), found.set_index("key_mlbam")])
+        table = table[~table.index.duplicated(keep="first")]
+        atomic_write(path, lambda tmp: table.reset_index().to_csv(tmp, index=False))
+
+
+def _ids(values):
+    ids = pd.to_numeric(pd.Series(values), errors="coerce").dropna().astype(np.int64)
+    return pd.Index(ids.unique())
+
+
+def lookup_players(ids, path=REGISTRY_FILE):
+    # Rows for the requested ids (key_mlbam, name_first, name_last), resolving unknown ids once
+    ids = _ids(ids)
+    table = load_registry(path)
+
+    missing = ids.difference(table.index).difference(pd.Index(list(_unresolved), dtype=np.int64))
+    if len(missing):
+        from pybaseball import playerid_reverse_lookup
+
+        found = playerid_reverse_lookup(missing.tolist(), key_type="mlbam")
+        found = found[REGISTRY_COLUMNS].dropna(subset=["key_mlbam"])
+        found["key_mlbam"] = found["key_mlbam"].astype(np.int64)
+        _unresolved.update(set(missing) - set(found["key_mlbam"]))
+
+        if not found.empty:
+            _add_to_registry(found.drop_duplicates("key_mlbam"), path)
+            table = load_registry(path)
+
+    return table.reindex(ids).dropna(how="all").rename_axis("key_mlbam").reset_index()
+
+
+def id_to_name(ids, lower=True, path=REGISTRY_FILE):
+    # {id: "first last"}; lowercased to match player_name_lookup.csv by default
+    players = lookup_players(ids, path)
+    names = (players["name_first"].fillna("") + " " + players["name_last"].fillna("")).str.strip()
+    if lower:
+        names = names.str.lower()
+    return dict(zip(players["key_mlbam"], names))
+
+
+if __name__ == "__main__":
+    # python player_registry.py some.csv [id column ...]: register every id in the given columns
+    source = sys.argv[1] if len(sys.argv) > 1 else "first_pitch_data_2025.csv"
+    columns = sys.argv[2:] or ["batter", "pitcher"]
+    df = pd.read_csv(source, usecols=lambda c: c in columns)
+    ids = pd.concat([df[c] for c in df.columns])
+    players = lookup_players(ids)
+    print(f"✅ Registry covers {len(players)} of {len(_ids(ids))} ids from {source} ({REGISTRY_FILE})")
@@ -1,16 +1,17 @@
 # save as: generate_player_lookup.py
 import pandas as pd
-from pybaseball import playerid_reverse_lookup
+from player_registry import lookup_players
+from dataset_store import write_csv
 
 # You can pull from your actual dataset
 df = pd.read_csv("first_pitch_data_2025.csv")
 unique_ids = df["batter"].dropna().unique().astype(int)
 
-# Use pybaseball to reverse lookup IDs
-lookup_df = playerid_reverse_lookup(unique_ids, key_type='mlbam')
+# Resolve through the local registry; only ids it hasn't seen hit pybaseball
+lookup_df = lookup_players(unique_ids)
 
 # Clean and save
 lookup_df["full_name"] = (lookup_df["name_first"] + " " + lookup_df["name_last"]).str.lower()
-lookup_df[["key_mlbam", "full_name"]].to_csv("player_name_lookup.csv", index=False)
+write_csv(lookup_df[["key_mlbam", "full_name"]], "player_name_lookup.csv")
 
 print("✅ Saved player_name_lookup.csv")
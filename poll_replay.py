@@ -0,0 +1,164 @@
+import sys
+import json
+import bisect
+import numpy as np
+import pandas as pd
+from poll_scheduler import PollScheduler, DEFAULT_BASE
+
+# Replays whole slates of recorded live feeds against a polling policy and
+# reports how long each leadoff lock (third out) took to be seen and how many
+# requests it cost. Feeds come from /api/v1.1/game/{gamePk}/feed/live saved
+# after the game; without any, synthetic games are used.
+
+FIXED_INTERVALS = [15, 30, 60]
+# Same base as a Live Tracker left on its default refresh rate
+ADAPTIVE_BASE = DEFAULT_BASE
+FEED_REQUESTS_PER_POLL = 2  # boxscore + live feed
+MIN_WAKE = 2
+
+
+def _seconds(ts):
+    return pd.Timestamp(ts).timestamp()
+
+
+def feed_timeline(feed):
+    # [(time, state)] after every pitch and play, plus third-out (lock) times
+    plays = feed.get("liveData", {}).get("plays", {}).get("allPlays", [])
+    timeline, locks = [], []
+    runs = {"away": 0, "home": 0}
+
+    for at_bat, play in enumerate(plays):
+        about = play.get("about", {})
+        inning = about.get("inning", 0)
+        for ev in play.get("playEvents", []):
+            if not ev.get("isPitch") or "startTime" not in ev:
+                continue
+            count = ev.get("count", {})
+            timeline.append((_seconds(ev["startTime"]), {
+                "status": "In Progress",
+                "inning": inning,
+                "between_innings": False,
+                "outs": count.get("outs", 0),
+                "balls": count.get("balls", 0),
+                "strikes": count.get("strikes", 0),
+                "run_diff": abs(runs["away"] - runs["home"]),
+                "batter": at_bat,
+            }))
+
+        result = play.get("result", {})
+        runs = {"away": result.get("awayScore", runs["away"]), "home": result.get("homeScore", runs["home"])}
+        outs = play.get("count", {}).get("outs", 0)
+        end = _seconds(about["endTime"]) if about.get("endTime") else timeline[-1][0]
+        timeline.append((end, {
+            "status": "In Progress",
+            "inning": inning,
+            "between_innings": outs >= 3,
+            "outs": outs,
+            "balls": 0,
+            "strikes": 0,
+            "run_diff": abs(runs["away"] - runs["home"]),
+            "batter": at_bat,
+        }))
+        if outs >= 3:
+            locks.append(end)
+
+    timeline.sort(key=lambda item: item[0])
+    return timeline, locks
+
+
+def state_at(timeline, times, t):
+    i = bisect.bisect_right(times, t) - 1
+    if i < 0:
+        return {"status": "Pre-Game", "inning": 0, "between_innings": False, "outs": 0, "balls": 0, "strikes": 0, "run_diff": 0}
+    if i == len(times) - 1 and t > times[-1]:
+        return {**timeline[-1][1], "status": "Final"}
+    return timeline[i][1]
+
+
+def simulate(games, policy, interval=None):
+    # games: [(timeline, locks)]; returns request counts and lock detection delays
+    prepared = [(tl, [t for t, _ in tl], locks) for tl, locks in games if tl]
+    start = min(times[0] for _, times, _ in prepared) - 300
+    end = max(times[-1] for _, times, _ in prepared)
+    polls = {g: [] for g in range(len(prepared))}
+    wakes = 0
+
+    scheduler = PollScheduler(base=ADAPTIVE_BASE)
+    now = start
+    while now <= end:
+        wakes += 1
+        states = {g: state_at(tl, times, now) for g, (tl, times, _) in enumerate(prepared)}
+        if policy == "fixed":
+            due = [g for g, state in states.items() if state["status"] == "In Progress"]
+        else:
+            # Same heartbeat as the Live Tracker: every scheduled game, live or not
+            due = scheduler.cycle(states, now)
+        for g in due:
+            polls[g].append(now)
+
+        if policy == "fixed":
+            now += interval
+        else:
+            now += max(scheduler.seconds_until_next(now, ADAPTIVE_BASE), MIN_WAKE)
+
+    delays, missed = [], 0
+    for g, (tl, times, locks) in enumerate(prepared):
+        poll_times = np.array(polls[g])
+        for lock in locks:
+            # The lock is only visible until the next half-inning's first pitch;
+            # the game-ending out has no next leadoff
+            nxt = bisect.bisect_right(times, lock)
+            if nxt >= len(times):
+                continue
+            window_end = times[nxt]
+            seen = poll_times[(poll_times >= lock) & (poll_times < window_end)]
+            if len(seen):
+                delays.append(seen[0] - lock)
+            else:
+                missed += 1
+
+    delays = np.array(delays) if delays else np.array([np.nan])
+    return {
+        "policy": f"adaptive base {ADAPTIVE_BASE}s" if policy != "fixed" else f"fixed {interval}s",
+        "feed_requests": FEED_REQUESTS_PER_POLL * sum(len(p) for p in polls.values()),
+        "schedule_requests": wakes,
+        "total_requests": FEED_REQUESTS_PER_POLL * sum(len(p) for p in polls.values()) + wakes,
+        "missed": missed,
+        "mean_delay_s": round(float(np.nanmean(delays)), 1),
+        "p90_delay_s": round(float(np.nanpercentile(delays, 90)), 1),
+    }
+
+
+def end_early(feed, innings=3):
+    # The same game cut short (rain, mercy) so it goes Final while the rest play on
+    plays = feed["liveData"]["plays"]["allPlays"]
+    kept = [p for p in plays if p.get("about", {}).get("inning", 0) <= innings]
+    return {**feed, "liveData": {**feed["liveData"], "plays": {**feed["liveData"]["plays"], "allPlays": kept}}}
+
+
+def compare_policies(games):
+    rows = [simulate(games, "fixed", interval) for interval in FIXED_INTERVALS]
+    rows.append(simulate(games, "adaptive"))
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    # python poll_replay.py [feed1.json feed2.json ...]
+    if len(sys.argv) > 1:
+        feeds = []
+        for path in sys.argv[1:]:
+            with open(path) as f:
+                feeds.append(json.load(f))
+    else:
+        from synthetic_data import generate_game_feed
+        print("🧪 No recorded feeds given, replaying 15 synthetic games")
+        starts = pd.date_range("2025-07-01T23:05:00Z", periods=15, freq="10min")
+        feeds = [generate_game_feed(i, s.isoformat(), seed=i) for i, s in enumerate(starts)]
+
+    games = [feed_timeline(feed) for feed in feeds]
+    print(compare_policies(games).to_string(index=False))
+
+    # A game that finishes mid-session must stop waking the tracker
+    print(f"\n🏁 Same slate with the first game final after 3 innings")
+    games[0] = feed_timeline(end_early(feeds[0]))
+    print(compare_policies(games).to_string(index=False))
@@ -0,0 +1,112 @@
+LIVE_STATES = {"In Progress", "Manager challenge", "Review"}
+DELAYED_STATES = {"Delayed", "Delayed Start", "Suspended"}
+
+# Seconds between feed polls for one game. The leadoff locks on the third out,
+# so the budget goes to two-out, deep-count moments and is saved between
+# innings (already locked), during delays and in late-game blowouts.
+CLOSE_INTERVAL = 5       # two outs and a two-strike or three-ball count
+TWO_OUT_INTERVAL = 10
+LATE_COUNT_INTERVAL = 10
+BREAK_INTERVAL = 60
+DELAY_INTERVAL = 120
+BLOWOUT_RUNS = 7
+BLOWOUT_INNING = 7
+MAX_INTERVAL = 180
+
+# The Live Tracker's default refresh rate, used as the base interval
+DEFAULT_BASE = 60
+
+# One tight game must not set the heartbeat for the whole slate: each wake is a
+# schedule request, so close counts get polled every 20s at most (replayed on
+# 15 synthetic games at base 60 that's fewer requests than a fixed 60s loop)
+SLATE_HEARTBEAT_FLOOR = 20
+
+# Feeds are refetched whenever the heartbeat shows a change; this only bounds staleness
+STALE_REFRESH = 120
+
+
+def game_state(game):
+    # Scheduling inputs from a schedule entry hydrated with linescore
+    linescore = game.get("linescore", {})
+    teams = linescore.get("teams", {})
+    return {
+        "status": game.get("status", {}).get("detailedState", ""),
+        "inning": linescore.get("currentInning", 0),
+        "between_innings": linescore.get("inningState", "") in ("Middle", "End") or linescore.get("outs", 0) >= 3,
+        "outs": linescore.get("outs", 0),
+        "balls": linescore.get("balls", 0),
+        "strikes": linescore.get("strikes", 0),
+        "run_diff": abs(teams.get("away", {}).get("runs", 0) - teams.get("home", {}).get("runs", 0)),
+        "batter": linescore.get("offense", {}).get("batter", {}).get("id"),
+    }
+
+
+def poll_interval(state, base=DEFAULT_BASE):
+    # None means don't poll the game at all (not started or already over)
+    if state["status"] in DELAYED_STATES:
+        return DELAY_INTERVAL
+    if state["status"] not in LIVE_STATES:
+        return None
+
+    if state["between_innings"]:
+        interval = max(base, BREAK_INTERVAL)
+    elif state["outs"] == 2 and (state["strikes"] == 2 or state["balls"] == 3):
+        interval = CLOSE_INTERVAL
+    elif state["outs"] == 2:
+        interval = TWO_OUT_INTERVAL
+    elif state["strikes"] == 2 or state["balls"] == 3:
+        interval = min(base, LATE_COUNT_INTERVAL)
+    else:
+        interval = base
+
+    if state["inning"] >= BLOWOUT_INNING and state["run_diff"] >= BLOWOUT_RUNS:
+        interval *= 2
+    return min(interval, MAX_INTERVAL)
+
+
+class PollScheduler:
+    # The schedule request (one call for the whole slate) is the heartbeat and
+    # follows the tightest per-game interval, floored at SLATE_HEARTBEAT_FLOOR. A game's boxscore and feed are only
+    # refetched when its out or half-inning (or two-out batter) changes, or after
+    # STALE_REFRESH seconds, so fast heartbeats don't multiply feed requests.
+    def __init__(self, base=DEFAULT_BASE):
+        self.base = base
+        self.next_look = {}
+        self.next_fetch = {}
+        self.seen = {}
+
+    def observe(self, game_pk, state, now):
+        # Called for every game on each heartbeat; True when its feed should be fetched
+        interval = poll_interval(state, self.base)
+        if interval is None:
+            self.forget(game_pk)
+            return False
+        self.next_look[game_pk] = now + interval
+
+        # A new batter only moves the next-inning projection much with two outs
+        batter = state.get("batter") if state["outs"] == 2 else None
+        key = (state["inning"], state["between_innings"], state["outs"], batter)
+        changed = self.seen.get(game_pk) != key
+        self.seen[game_pk] = key
+        if changed or now >= self.next_fetch.get(game_pk, 0):
+            self.next_fetch[game_pk] = now + STALE_REFRESH
+            return True
+        return False
+
+    def forget(self, game_pk):
+        self.next_look.pop(game_pk, None)
+        self.next_fetch.pop(game_pk, None)
+        self.seen.pop(game_pk, None)
+
+    def cycle(self, states, now):
+        # One heartbeat over every game on the schedule ({game_pk: state}), not
+        # just the live ones, so finished and delayed games update their entries.
+        # Games gone from the schedule are dropped. Returns the game_pks that are due.
+        for game_pk in set(self.next_look) | set(self.seen):
+            if game_pk not in states:
+                self.forget(game_pk)
+        return [game_pk for game_pk, state in states.items() if self.observe(game_pk, state, now)]
+
+    def seconds_until_next(self, now, default):
+        soonest = min((t - now for t in self.next_look.values()), default=default)
+        return max(soonest, min(SLATE_HEARTBEAT_FLOOR, self.base))
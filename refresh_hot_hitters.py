@@ -1,57 +1,89 @@
 import pandas as pd
 from datetime import datetime, timedelta
 import os
+import time
+import threading
 from unidecode import unidecode
+from player_registry import id_to_name as registry_names
+from live_ingest import with_provisional
+from leadoff_dataset import LEADOFF_HITTERS_FILE
+from shared_data import hot_hitters_file
+from dataset_store import write_csv
+from mlb_first_pitch import first_pitch_success
 
-# Load raw data
-df = pd.read_csv("first_pitch_hitters_2025.csv")
-
-# Filter to last 14 days + first pitches only
-df["game_date"] = pd.to_datetime(df["game_date"], errors="coerce")
-df = df[df["game_date"] >= datetime.now() - timedelta(days=14)]
-df = df[df["pitch_number"] == 1]
-
-# Success criteria
-success_events = ["single", "double", "triple", "home_run"]
-success_descriptions = [
-    "hit_into_play", "field_out", "force_out", "grounded_into_double_play", "sac_fly"
-]
-
-df["success_no_ball"] = df["description"].isin(success_descriptions) | df["events"].isin(success_events)
-df["success_with_ball"] = df["success_no_ball"] | (df["description"] == "ball")
-
-# Get last 10 first-pitch PAs per batter
-df = df.sort_values("game_date", ascending=False)
-grouped = df.groupby("batter").head(10)
-
-# Summarize
-summary = grouped.groupby("batter").agg(
-    total_pa=("description", "count"),
-    success_with_ball=("success_with_ball", "sum"),
-    success_no_ball=("success_no_ball", "sum")
-).reset_index()
-
-# Load name lookup
-try:
-    lookup = pd.read_csv("player_name_lookup.csv")
-    id_to_name = dict(zip(lookup["key_mlbam"], lookup["full_name"]))
-    summary["Batter"] = summary["batter"].map(id_to_name)
-except:
-    summary["Batter"] = summary["batter"]
-
-# Save filtered versions
-os.makedirs("data", exist_ok=True)
-
-# With ball
-with_ball = summary[(summary["total_pa"] >= 5) & (summary["success_with_ball"] >= 3)].copy()
-with_ball["Successes"] = with_ball["success_with_ball"]
-with_ball[["Batter", "total_pa", "Successes"]].rename(columns={"total_pa": "First Pitch PAs"}).to_csv(
-    "data/hot_hitters_with_ball.csv", index=False)
-
-# No ball
-no_ball = summary[(summary["total_pa"] >= 5) & (summary["success_no_ball"] >= 3)].copy()
-no_ball["Successes"] = no_ball["success_no_ball"]
-no_ball[["Batter", "total_pa", "Successes"]].rename(columns={"total_pa": "First Pitch PAs"}).to_csv(
-    "data/hot_hitters_no_ball.csv", index=False)
-
-print("✅ Done. Both hot hitter files regenerated.")
+# The live tracker asks for a refresh whenever it ingests a PA; the rebuild
+# re-reads the season files, so it runs at most this often
+LIVE_REFRESH_INTERVAL = 600  # seconds
+_refreshing = threading.Lock()
+
+
+def refresh_hot_hitters(leadoff=False):
+    # Load raw data, plus today's first pitches from the live feeds; `leadoff`
+    # reads the precomputed inning-leadoff PAs instead of every PA
+    source = LEADOFF_HITTERS_FILE if leadoff else "first_pitch_hitters_2025.csv"
+    df = with_provisional(pd.read_csv(source), leadoff=leadoff)
+
+    # Filter to last 14 days + first pitches only
+    df["game_date"] = pd.to_datetime(df["game_date"], errors="coerce")
+    df = df[df["game_date"] >= datetime.now() - timedelta(days=14)]
+    df = df[df["pitch_number"] == 1]
+
+    # Same success definition as get_hot_hitters, so both hot lists agree
+    df["success_no_ball"], df["success_with_ball"] = first_pitch_success(df)
+
+    # Get last 10 first-pitch PAs per batter
+    df = df.sort_values(["game_date", "at_bat_number"], ascending=False)
+    grouped = df.groupby("batter").head(10)
+
+    # Summarize
+    summary = grouped.groupby("batter").agg(
+        total_pa=("description", "count"),
+        success_with_ball=("success_with_ball", "sum"),
+        success_no_ball=("success_no_ball", "sum")
+    ).reset_index()
+
+    # Load name lookup
+    try:
+        # Registry covers call-ups that player_name_lookup.csv hasn't caught up with yet
+        id_to_name = registry_names(summary["batter"])
+        summary["Batter"] = summary["batter"].map(id_to_name)
+    except:
+        summary["Batter"] = summary["batter"]
+
+    # Save filtered versions
+    os.makedirs("data", exist_ok=True)
+
+    # With ball
+    with_ball = summary[(summary["total_pa"] >= 5) & (summary["success_with_ball"] >= 3)].copy()
+    with_ball["Successes"] = with_ball["success_with_ball"]
+    write_csv(with_ball[["Batter", "total_pa", "Successes"]].rename(columns={"total_pa": "First Pitch PAs"}),
+              hot_hitters_file(True, leadoff))
+
+    # No ball
+    no_ball = summary[(summary["total_pa"] >= 5) & (summary["success_no_ball"] >= 3)].copy()
+    no_ball["Successes"] = no_ball["success_no_ball"]
+    write_csv(no_ball[["Batter", "total_pa", "Successes"]].rename(columns={"total_pa": "First Pitch PAs"}),
+              hot_hitters_file(False, leadoff))
+
+
+def refresh_if_due(min_interval=LIVE_REFRESH_INTERVAL):
+    # Both views, only once the oldest hot list is min_interval old (file age, so
+    # every session and process agrees) and never two rebuilds at once
+    files = [hot_hitters_file(ball, leadoff) for leadoff in (False, True) for ball in (True, False)]
+    if all(os.path.exists(f) for f in files):
+        if time.time() - min(os.path.getmtime(f) for f in files) < min_interval:
+            return False
+    if not _refreshing.acquire(blocking=False):
+        return False
+    try:
+        refresh_hot_hitters()
+        refresh_hot_hitters(leadoff=True)
+    finally:
+        _refreshing.release()
+    return True
+
+
+if __name__ == "__main__":
+    refresh_hot_hitters()
+    refresh_hot_hitters(leadoff=True)
+    print("✅ Done. All-PA and leadoff hot hitter files regenerated.")
@@ -0,0 +1,90 @@
+import os
+import sys
+import pickle
+import resource
+import tempfile
+import subprocess
+import pandas as pd
+from synthetic_data import generate_pitches, generate_name_lookup
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+SESSIONS = 8
+SCALE = 1
+
+# RSS as Streamlit sessions pile up, holding the season frame, name lookup and
+# hot lists either as per-session copies (what st.cache_data returns on every
+# hit) or as the one shared object from shared_data. Each mode runs in its own
+# process so the numbers don't bleed into each other.
+DATASETS = {
+    "first_pitch_hitters_2025.csv": "first_pitch_hitters",
+    "player_name_lookup.csv": "player_name_lookup",
+    "data/hot_hitters_with_ball.csv": "hot_with_ball",
+    "data/hot_hitters_no_ball.csv": "hot_no_ball",
+}
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except OSError:
+        # Peak rather than current, but still grows with each held copy
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def write_inputs(data_dir, scale):
+    os.makedirs(os.path.join(data_dir, "data"), exist_ok=True)
+    first_pitches = generate_pitches(scale, first_pitch_only=True)
+    first_pitches.to_csv(os.path.join(data_dir, "first_pitch_hitters_2025.csv"), index=False)
+    lookup = generate_name_lookup()
+    lookup.to_csv(os.path.join(data_dir, "player_name_lookup.csv"), index=False)
+    hot = lookup.rename(columns={"full_name": "Batter"}).head(40)
+    hot.to_csv(os.path.join(data_dir, "data/hot_hitters_with_ball.csv"), index=False)
+    hot.tail(20).to_csv(os.path.join(data_dir, "data/hot_hitters_no_ball.csv"), index=False)
+    return len(first_pitches)
+
+
+def run_sessions(mode, sessions):
+    # Child process: open `sessions` sessions in one mode, printing RSS after each
+    from shared_data import shared_dataset
+
+    loaded = {}
+    held = []
+    for i in range(sessions):
+        if mode == "shared":
+            session = [shared_dataset(name, [path], lambda p=path: pd.read_csv(p)) for path, name in DATASETS.items()]
+        else:
+            if not loaded:
+                loaded = {path: pd.read_csv(path) for path in DATASETS}
+            # st.cache_data pickles on write and unpickles a new copy on every read
+            session = [pickle.loads(pickle.dumps(df)) for df in loaded.values()]
+        held.append(session)
+        print(f"{i + 1},{rss_mb():.1f}", flush=True)
+
+
+def measure(mode, sessions, data_dir):
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", mode, str(sessions)],
+        cwd=data_dir, capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": REPO_DIR},
+    ).stdout
+    rss = [float(line.split(",")[1]) for line in out.strip().splitlines()]
+    per_session = (rss[-1] - rss[0]) / (len(rss) - 1) if len(rss) > 1 else 0.0
+    return rss, per_session
+
+
+def main(sessions=SESSIONS, scale=SCALE):
+    with tempfile.TemporaryDirectory() as data_dir:
+        rows = write_inputs(data_dir, scale)
+        print(f"🧪 {rows} first pitches, {sessions} sessions per mode")
+        for mode in ["copy", "shared"]:
+            rss, per_session = measure(mode, sessions, data_dir)
+            print(f"📏 {mode:>6}: first session {rss[0]:.1f} MB, last {rss[-1]:.1f} MB, +{per_session:.1f} MB per added session")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        run_sessions(sys.argv[2], int(sys.argv[3]))
+    else:
+        # python session_memory_test.py [sessions] [scale]
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else SESSIONS, float(sys.argv[2]) if len(sys.argv) > 2 else SCALE)
@@ -0,0 +1,98 @@
+import threading
+import numpy as np
+import pandas as pd
+from unidecode import unidecode
+from data_cache import data_version
+
+HOT_WITH_BALL_FILE = "data/hot_hitters_with_ball.csv"
+HOT_NO_BALL_FILE = "data/hot_hitters_no_ball.csv"
+HOT_LEADOFF_WITH_BALL_FILE = "data/hot_hitters_leadoff_with_ball.csv"
+HOT_LEADOFF_NO_BALL_FILE = "data/hot_hitters_leadoff_no_ball.csv"
+LOOKUP_FILE = "player_name_lookup.csv"
+
+# One in-memory copy of each dataset per process, shared by every Streamlit
+# session. st.cache_data unpickles a fresh copy for each caller, so memory grew
+# with every open tab. Entries are keyed by their source files' version and a
+# refresh swaps the new object in with a single assignment; sessions already
+# holding the old one keep it until their rerun ends.
+#
+# Shared objects are read-only: filter or .assign() to derive, never write in place.
+_datasets = {}
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _lock(name):
+    with _locks_guard:
+        return _locks.setdefault(name, threading.Lock())
+
+
+def _freeze(value):
+    # Arrays (npz indexes) can be locked for real; frames rely on the rule above
+    if isinstance(value, dict):
+        for array in value.values():
+            if isinstance(array, np.ndarray):
+                array.flags.writeable = False
+    elif isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    return value
+
+
+def shared_dataset(name, paths, loader):
+    # The current object for `name`, loading it once per version of `paths`
+    version = data_version(*paths)
+    entry = _datasets.get(name)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    # One loader per dataset at a time; other sessions wait, then reuse its result
+    with _lock(name):
+        entry = _datasets.get(name)
+        if entry is None or entry[0] != version:
+            entry = (version, _freeze(loader()))
+            _datasets[name] = entry
+    return entry[1]
+
+
+def drop_dataset(name=None):
+    if name is None:
+        _datasets.clear()
+    else:
+        _datasets.pop(name, None)
+
+
+def dataset_memory():
+    # {name: MB} for the frames currently held
+    return {
+        name: round(value.memory_usage(deep=True).sum() / 1024 ** 2, 1)
+        for name, (_, value) in _datasets.items()
+        if isinstance(value, pd.DataFrame)
+    }
+
+
+# ---------- COMMON DATASETS ----------
+def _normalize(name):
+    return unidecode(name).lower().strip().replace("\xa0", " ")
+
+
+def _hot_names(path):
+    def load():
+        return frozenset(pd.read_csv(path)["Batter"].dropna().astype(str).map(_normalize))
+    return load
+
+
+def hot_hitters_file(include_ball=True, leadoff=False):
+    if leadoff:
+        return HOT_LEADOFF_WITH_BALL_FILE if include_ball else HOT_LEADOFF_NO_BALL_FILE
+    return HOT_WITH_BALL_FILE if include_ball else HOT_NO_BALL_FILE
+
+
+def hot_hitter_names(include_ball=True, leadoff=False):
+    # Normalized names on the current hot list
+    path = hot_hitters_file(include_ball, leadoff)
+    return shared_dataset(path, [path], _hot_names(path))
+
+
+def name_lookup(path=LOOKUP_FILE):
+    # player_name_lookup.csv (key_mlbam, full_name)
+    return shared_dataset(path, [path], lambda: pd.read_csv(path))
@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+from datetime import datetime
+import pandas as pd
+import requests
+from pytz import timezone
+from dataset_store import write_csv, write_json
+
+SCHEDULE_URL = "https://statsapi.mlb.com/api/v1/schedule"
+HYDRATE = "probablePitcher,lineups,team"
+
+GAMES_FILE = "games_today.csv"
+PROJECTED_FILE = "data/projected_pitchers_today.json"
+LINEUPS_FILE = "data/lineups_today.json"
+
+eastern = timezone("US/Eastern")
+
+
+def today_eastern():
+    return datetime.now(eastern).strftime("%Y-%m-%d")
+
+
+def fetch_schedule(day, timeout=10):
+    # One hydrated request returns teams, probable pitchers and posted lineups
+    params = {"sportId": 1, "date": day, "hydrate": HYDRATE}
+    r = requests.get(SCHEDULE_URL, params=params, timeout=timeout)
+    r.raise_for_status()
+    return r.json()
+
+
+def _game_time_et(iso_time):
+    if not iso_time:
+        return "TBD"
+    ts = pd.Timestamp(iso_time).tz_convert(eastern)
+    return ts.strftime("%I:%M %p ET").lstrip("0")
+
+
+def parse_schedule(payload):
+    games = []
+    lineups = {}
+
+    for day in payload.get("dates", []):
+        for g in day.get("games", []):
+            teams = g.get("teams", {})
+            entry = {"game_pk": g.get("gamePk"), "StartTimeET": g.get("gameDate", "")}
+
+            for side in ("away", "home"):
+                team = teams.get(side, {}).get("team", {})
+                pitcher = teams.get(side, {}).get("probablePitcher", {})
+                entry[f"{side}_team"] = team.get("name", "TBD")
+                entry[f"{side}_abbr"] = team.get("abbreviation", "")
+                entry[f"{side}_pitcher"] = pitcher.get("fullName", "")
+                entry[f"{side}_pitcher_id"] = pitcher.get("id")
+
+                players = g.get("lineups", {}).get(f"{side}Players", [])
+                if players and entry[f"{side}_abbr"]:
+                    lineups[entry[f"{side}_abbr"]] = [p["id"] for p in players if "id" in p]
+
+            games.append(entry)
+
+    return games, lineups
+
+
+def projected_entries(games):
+    # Dict form read by the Upcoming Games page
+    return [
+        {
+            "away_team": g["away_team"],
+            "home_team": g["home_team"],
+            "away_pitcher": g["away_pitcher"] or "TBD",
+            "home_pitcher": g["home_pitcher"] or "TBD",
+            "game_time": _game_time_et(g["StartTimeET"]),
+        }
+        for g in games
+    ]
+
+
+def write_slate(games, lineups, games_file=GAMES_FILE, projected_file=PROJECTED_FILE, lineups_file=LINEUPS_FILE):
+    columns = ["away_team", "home_team", "away_pitcher", "home_pitcher", "StartTimeET"]
+    write_csv(pd.DataFrame(games, columns=columns), games_file)
+    write_json(projected_entries(games), projected_file, indent=2)
+    write_json(lineups, lineups_file)
+
+
+def load_slate(day=None, payload=None, record_to=None, write=True):
+    # Pass a recorded `payload` to replay a saved schedule response offline
+    if payload is None:
+        payload = fetch_schedule(day or today_eastern())
+        if record_to:
+            # Saved as-is for replaying later (see slate_loader_test.py)
+            os.makedirs(os.path.dirname(record_to) or ".", exist_ok=True)
+            with open(record_to, "w") as f:
+                json.dump(payload, f, indent=2)
+
+    games, lineups = parse_schedule(payload)
+    if write:
+        write_slate(games, lineups)
+    return games, lineups
+
+
+# ---------- READERS ----------
+def load_projected_pitcher_names(path=PROJECTED_FILE):
+    if not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        data = json.load(f)
+
+    # Older files hold a plain list of names
+    names = set()
+    for entry in data:
+        if isinstance(entry, dict):
+            names.update(entry.get(k, "") for k in ("away_pitcher", "home_pitcher"))
+        elif isinstance(entry, str):
+            names.add(entry)
+    names.discard("")
+    names.discard("TBD")
+    return names
+
+
+def load_lineups(path=LINEUPS_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    # python slate_loader.py [YYYY-MM-DD | recorded_response.json] [--record out.json]
+    args = sys.argv[1:]
+    record_to = None
+    if "--record" in args:
+        i = args.index("--record")
+        if i + 1 >= len(args):
+            sys.exit("--record needs a file to save the schedule response to")
+        record_to = args[i + 1]
+        del args[i:i + 2]
+
+    arg = args[0] if args else None
+    if arg and arg.endswith(".json"):
+        with open(arg) as f:
+            games, lineups = load_slate(payload=json.load(f))
+    else:
+        games, lineups = load_slate(day=arg, record_to=record_to)
+    if record_to:
+        print(f"💾 Recorded the schedule response to {record_to}")
+
+    for g in games:
+        print(f"{g['away_team']} @ {g['home_team']}: {g['away_pitcher'] or 'TBD'} vs. {g['home_pitcher'] or 'TBD'}")
+    print(f"✅ Saved {len(games)} games, {len(lineups)} posted lineups")
@@ -0,0 +1,58 @@
+import os
+import sys
+import json
+import tempfile
+from slate_loader import parse_schedule, write_slate, load_lineups, load_projected_pitcher_names, projected_entries
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+RECORDED_FILE = os.path.join(REPO_DIR, "data", "recorded", "schedule_2025-07-01.json")
+
+# Replays a recorded /api/v1/schedule response (hydrate=probablePitcher,lineups,team)
+# through the slate loader, offline. Re-record with
+#   python slate_loader.py 2025-07-01 --record data/recorded/schedule_2025-07-01.json
+# and update EXPECTED_GAMES if the slate changes.
+
+EXPECTED_GAMES = [
+    {"game_pk": 777001, "away_abbr": "NYY", "home_abbr": "TOR", "away_pitcher": "Gerrit Cole", "home_pitcher": "Kevin Gausman"},
+    {"game_pk": 777002, "away_abbr": "LAD", "home_abbr": "HOU", "away_pitcher": "Yoshinobu Yamamoto", "home_pitcher": ""},
+    {"game_pk": 777003, "away_abbr": "SEA", "home_abbr": "ATH", "away_pitcher": "Logan Gilbert", "home_pitcher": "Jeffrey Springs"},
+]
+EXPECTED_LINEUPS = {"NYY": 9, "TOR": 9, "LAD": 9}
+
+
+def check(name, ok, detail=""):
+    print(f"{'✅' if ok else '❌'} {name}{f': {detail}' if detail and not ok else ''}")
+    return ok
+
+
+def main(path=RECORDED_FILE):
+    with open(path) as f:
+        payload = json.load(f)
+    games, lineups = parse_schedule(payload)
+
+    results = [check("game count", len(games) == len(EXPECTED_GAMES), f"{len(games)} games")]
+    for game, expected in zip(games, EXPECTED_GAMES):
+        got = {k: game[k] for k in expected}
+        results.append(check(f"game {expected['game_pk']}", got == expected, got))
+
+    sizes = {abbr: len(ids) for abbr, ids in lineups.items()}
+    results.append(check("posted lineups", sizes == EXPECTED_LINEUPS, sizes))
+    results.append(check("missing probable shows as TBD", projected_entries(games)[1]["home_pitcher"] == "TBD"))
+    results.append(check("game time in ET", projected_entries(games)[0]["game_time"] == "7:05 PM ET",
+                         projected_entries(games)[0]["game_time"]))
+
+    # What the pages read back matches what was parsed
+    with tempfile.TemporaryDirectory() as tmp:
+        projected, lineups_file = os.path.join(tmp, "projected.json"), os.path.join(tmp, "lineups.json")
+        write_slate(games, lineups, os.path.join(tmp, "games.csv"), projected, lineups_file)
+        results.append(check("lineups round trip", load_lineups(lineups_file) == lineups))
+        names = {g[k] for g in EXPECTED_GAMES for k in ("away_pitcher", "home_pitcher")} - {""}
+        results.append(check("projected pitchers round trip", load_projected_pitcher_names(projected) == names))
+
+    print(f"{'✅' if all(results) else '⚠️'} {sum(results)}/{len(results)} checks passed against {os.path.basename(path)}")
+    return all(results)
+
+
+if __name__ == "__main__":
+    # python slate_loader_test.py [recorded_response.json]
+    raise SystemExit(0 if main(*sys.argv[1:2]) else 1)
@@ -0,0 +1,215 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+from unidecode import unidecode
+from stream_aggregates import HIT_EVENTS
+from slate_loader import load_lineups
+from leadoff_dataset import LEADOFF_HITTERS_FILE, LEADOFF_PITCHERS_FILE
+from dataset_store import write_csv
+
+FIRST_PITCH_FILE = "first_pitch_hitters_2025.csv"
+PITCHER_FILE = "first_pitch_data_2025_cleaned.csv"
+LOOKUP_FILE = "player_name_lookup.csv"
+GAMES_FILE = "games_today.csv"
+OUTPUT_FILE = "ai_targets.csv"
+LEADOFF_OUTPUT_FILE = "ai_targets_leadoff.csv"
+
+# Shrinkage strength, in first pitches, toward the league rate
+BATTER_PRIOR = 40
+PITCHER_PRIOR = 120
+HIT_PRIOR = 25
+
+# How far a pitcher's first-pitch strike % moves the in-play odds
+STRIKE_WEIGHT = 0.5
+
+# Batters whose last first pitch is older than this are treated as inactive
+ACTIVE_DAYS = 10
+
+TEAM_ABBR = {
+    "Arizona Diamondbacks": "AZ", "Athletics": "ATH", "Oakland Athletics": "ATH",
+    "Atlanta Braves": "ATL", "Baltimore Orioles": "BAL", "Boston Red Sox": "BOS",
+    "Chicago Cubs": "CHC", "Chicago White Sox": "CWS", "Cincinnati Reds": "CIN",
+    "Cleveland Guardians": "CLE", "Colorado Rockies": "COL", "Detroit Tigers": "DET",
+    "Houston Astros": "HOU", "Kansas City Royals": "KC", "Los Angeles Angels": "LAA",
+    "Los Angeles Dodgers": "LAD", "Miami Marlins": "MIA", "Milwaukee Brewers": "MIL",
+    "Minnesota Twins": "MIN", "New York Mets": "NYM", "New York Yankees": "NYY",
+    "Philadelphia Phillies": "PHI", "Pittsburgh Pirates": "PIT", "San Diego Padres": "SD",
+    "San Francisco Giants": "SF", "Seattle Mariners": "SEA", "St. Louis Cardinals": "STL",
+    "Tampa Bay Rays": "TB", "Texas Rangers": "TEX", "Toronto Blue Jays": "TOR",
+    "Washington Nationals": "WSH",
+}
+
+
+def normalize(name):
+    if not isinstance(name, str):
+        return ""
+    return unidecode(name).lower().strip().replace("\xa0", " ")
+
+
+def _logit(p):
+    p = np.clip(p, 1e-4, 1 - 1e-4)
+    return np.log(p / (1 - p))
+
+
+def _expit(x):
+    return 1 / (1 + np.exp(-x))
+
+
+# ---------- PROFILES ----------
+def batter_profiles(fp_df, id_to_name):
+    df = fp_df[fp_df["pitch_number"] == 1].copy()
+    df["game_date"] = pd.to_datetime(df["game_date"], errors="coerce")
+    df["in_play"] = df["description"] == "hit_into_play"
+    df["hit"] = df["events"].isin(HIT_EVENTS)
+    df["team"] = np.where(df["inning_topbot"] == "Top", df["away_team"], df["home_team"])
+
+    grouped = df.groupby("batter")
+    profiles = grouped.agg(
+        n=("description", "size"),
+        in_play=("in_play", "sum"),
+        hits=("hit", "sum"),
+        last_seen=("game_date", "max"),
+    )
+    profiles["team"] = df.sort_values("game_date").groupby("batter")["team"].last()
+
+    # Batters seen from both sides are switch hitters
+    stands = df.groupby("batter")["stand"].agg(lambda x: "S" if x.nunique() > 1 else x.iloc[0])
+    profiles["stand"] = stands
+    profiles["Player"] = profiles.index.map(id_to_name)
+    profiles["Player"] = profiles["Player"].fillna(pd.Series(profiles.index.astype(str), index=profiles.index))
+    return profiles
+
+
+def pitcher_hands(fp_df):
+    return fp_df.dropna(subset=["p_throws"]).groupby("pitcher")["p_throws"].agg(lambda x: x.mode().iloc[0])
+
+
+def pitcher_profiles(pitcher_df, hands):
+    df = pitcher_df.copy()
+    df["name_key"] = df["player_name"].map(normalize)
+    df["p_throws"] = df["player_id"].map(hands)
+    return df.drop_duplicates("name_key").set_index("name_key")
+
+
+def league_rates(fp_df):
+    df = fp_df[fp_df["pitch_number"] == 1]
+    in_play = df["description"] == "hit_into_play"
+    hits = df["events"].isin(HIT_EVENTS)
+    strikes = df["description"].isin(["called_strike", "swinging_strike", "foul"])
+
+    # Platoon effect as an in-play odds shift per batter side vs pitcher hand
+    overall = in_play.mean()
+    platoon = {}
+    for (stand, throws), rate in in_play.groupby([df["stand"], df["p_throws"]]).mean().items():
+        platoon[stand + throws] = float(_logit(rate) - _logit(overall))
+
+    return {
+        "in_play": float(overall),
+        "hit_given_in_play": float(hits.sum() / max(in_play.sum(), 1)),
+        "strike": float(strikes.mean()),
+        "platoon": platoon,
+    }
+
+
+# ---------- SCORING ----------
+def score_matchups(batters, pitchers, league):
+    # batters/pitchers are row-aligned: one row per (batter, opposing pitcher) pair
+    lg_ip = league["in_play"]
+    lg_hit = league["hit_given_in_play"]
+
+    b_n = batters["n"].to_numpy(float)
+    b_ip = (batters["in_play"].to_numpy(float) + BATTER_PRIOR * lg_ip) / (b_n + BATTER_PRIOR)
+    b_hit = (batters["hits"].to_numpy(float) + HIT_PRIOR * lg_hit) / (batters["in_play"].to_numpy(float) + HIT_PRIOR)
+
+    p_n = pitchers["First Pitch Total"].fillna(0).to_numpy(float)
+    p_ip = (pitchers["First Pitch In-Play #"].fillna(0).to_numpy(float) + PITCHER_PRIOR * lg_ip) / (p_n + PITCHER_PRIOR)
+    p_strike = (
+        pitchers["First Pitch Strike %"].fillna(league["strike"]).to_numpy(float) * p_n
+        + PITCHER_PRIOR * league["strike"]
+    ) / (p_n + PITCHER_PRIOR)
+    p_hit = (
+        pitchers["First Pitch Hit #"].fillna(0).to_numpy(float) + HIT_PRIOR * lg_hit
+    ) / (pitchers["First Pitch In-Play #"].fillna(0).to_numpy(float) + HIT_PRIOR)
+
+    # Switch hitters take the opposite side of the pitcher's hand
+    throws = pitchers["p_throws"].fillna("").to_numpy(str)
+    stand = batters["stand"].fillna("").to_numpy(str)
+    stand = np.where(stand == "S", np.where(throws == "L", "R", "L"), stand)
+    platoon = pd.Series(np.char.add(stand, throws)).map(league["platoon"]).fillna(0.0).to_numpy()
+
+    # Log5 on the logit scale, plus strike-rate and platoon shifts
+    ip_logit = (
+        _logit(b_ip) + _logit(p_ip) - _logit(lg_ip)
+        + STRIKE_WEIGHT * (_logit(p_strike) - _logit(league["strike"]))
+        + platoon
+    )
+    in_play_prob = _expit(ip_logit)
+    hit_given_ip = _expit(_logit(b_hit) + _logit(p_hit) - _logit(lg_hit))
+    return in_play_prob, in_play_prob * hit_given_ip
+
+
+def build_slate(games, profiles, pitchers, lineups=None, today=None):
+    today = pd.Timestamp(today or datetime.now().date())
+    active = profiles[profiles["last_seen"] >= today - timedelta(days=ACTIVE_DAYS)]
+
+    rows = []
+    for _, g in games.iterrows():
+        for side, opp in (("away", "home"), ("home", "away")):
+            team = TEAM_ABBR.get(g[f"{side}_team"], g[f"{side}_team"])
+            pitcher_name = g.get(f"{opp}_pitcher", "")
+            if lineups and lineups.get(team):
+                ids = [i for i in lineups[team] if i in profiles.index]
+            else:
+                ids = active.index[active["team"] == team].tolist()
+            for batter_id in ids:
+                rows.append((batter_id, normalize(pitcher_name), pitcher_name if isinstance(pitcher_name, str) else "", team))
+
+    slate = pd.DataFrame(rows, columns=["batter", "pitcher_key", "Opp Pitcher", "Team"])
+    batter_rows = profiles.reindex(slate["batter"])
+    pitcher_rows = pitchers.reindex(slate["pitcher_key"])
+    return slate, batter_rows.reset_index(drop=True), pitcher_rows.reset_index(drop=True)
+
+
+def score_slate(games_file=GAMES_FILE, output_file=None, lineups=None, top_n=None, leadoff=False):
+    # `leadoff` scores from inning-leadoff PAs only (the precomputed leadoff files)
+    if output_file is None:
+        output_file = LEADOFF_OUTPUT_FILE if leadoff else OUTPUT_FILE
+    fp_df = pd.read_csv(LEADOFF_HITTERS_FILE if leadoff else FIRST_PITCH_FILE)
+    lookup = pd.read_csv(LOOKUP_FILE)
+    id_to_name = dict(zip(lookup["key_mlbam"], lookup["full_name"].str.title()))
+
+    profiles = batter_profiles(fp_df, id_to_name)
+    pitchers = pitcher_profiles(pd.read_csv(LEADOFF_PITCHERS_FILE if leadoff else PITCHER_FILE), pitcher_hands(fp_df))
+    league = league_rates(fp_df)
+    games = pd.read_csv(games_file, dtype=str).fillna("")
+
+    # Posted lineups narrow each team to its actual starters
+    if lineups is None:
+        lineups = load_lineups()
+    slate, batter_rows, pitcher_rows = build_slate(games, profiles, pitchers, lineups)
+    in_play_prob, hit_prob = score_matchups(batter_rows, pitcher_rows, league)
+
+    result = pd.DataFrame({
+        "Player": batter_rows["Player"],
+        "Team": slate["Team"],
+        "Opp Pitcher": slate["Opp Pitcher"],
+        "BatterHand": batter_rows["stand"],
+        "PitcherHand": pitcher_rows["p_throws"].fillna(""),
+        "First_Pitch_PAs": batter_rows["n"].astype(int),
+        "InPlay_Prob": in_play_prob.round(3),
+        "Hit_Prob": hit_prob.round(3),
+    }).sort_values(["Hit_Prob", "InPlay_Prob"], ascending=False)
+
+    if top_n:
+        result = result.head(top_n)
+    write_csv(result, output_file)
+    return result
+
+
+if __name__ == "__main__":
+    ranked = score_slate()
+    print(f"✅ Scored {len(ranked)} batters for today's slate → {OUTPUT_FILE}")
+    print(ranked.head(15).to_string(index=False))
+
+    ranked = score_slate(leadoff=True)
+    print(f"✅ Scored {len(ranked)} batters on leadoff PAs only → {LEADOFF_OUTPUT_FILE}")
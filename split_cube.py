@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+from dataset_store import write_npz
+from stream_aggregates import outcome_counts
+
+CUBE_FILE = "data/first_pitch_split_cube.npz"
+INPUT_FILE = "data/pa_table_2025.csv"
+CUBE_COLUMNS = ["total_fp", "swings", "in_play", "hits", "balls", "called_strikes"]
+ROLES = ["batter", "pitcher"]
+
+# Labels for every split; a cell's code is the index into its dimension's labels
+DIMENSIONS = {
+    "stand": ["L", "R"],
+    "p_throws": ["L", "R"],
+    "venue": ["Away", "Home"],  # from the batter's side
+    "month": ["Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct"],
+    "inning": ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10+"],
+    "tto": ["1st", "2nd", "3rd", "4th+"],
+}
+
+
+def _codes(df):
+    month = pd.to_datetime(df["game_date"]).dt.month.to_numpy()
+    inning = pd.to_numeric(df["inning"], errors="coerce").fillna(1).to_numpy()
+    tto = pd.to_numeric(df["n_thruorder_pitcher"], errors="coerce").fillna(1).to_numpy()
+    return np.column_stack([
+        (df["stand"] == "R").to_numpy(),
+        (df["p_throws"] == "R").to_numpy(),
+        (df["inning_topbot"] == "Bot").to_numpy(),
+        np.clip(month - 3, 0, len(DIMENSIONS["month"]) - 1),
+        np.clip(inning - 1, 0, len(DIMENSIONS["inning"]) - 1),
+        np.clip(tto - 1, 0, len(DIMENSIONS["tto"]) - 1),
+    ]).astype(np.uint8)
+
+
+def build_split_cube(df):
+    # One row per (player, split cell) that saw a first pitch; empty cells aren't stored
+    df = df[(df["pitch_number"] == 1) & df["stand"].isin(["L", "R"]) & df["p_throws"].isin(["L", "R"])]
+    df = df.dropna(subset=["batter", "pitcher", "game_date"])
+
+    codes = _codes(df)
+    counts = outcome_counts(df)[CUBE_COLUMNS].to_numpy(dtype=np.int32)
+    dims = list(DIMENSIONS)
+
+    cube = {f"labels_{dim}": np.array(labels) for dim, labels in DIMENSIONS.items()}
+    cube["columns"] = np.array(CUBE_COLUMNS)
+    for role in ROLES:
+        keys = pd.DataFrame(codes, columns=dims)
+        keys.insert(0, role, df[role].astype(np.int64).to_numpy())
+        cells = pd.DataFrame(counts, columns=CUBE_COLUMNS).groupby([keys[c] for c in keys.columns]).sum()
+
+        ids, rows = np.unique(cells.index.get_level_values(role).to_numpy(), return_inverse=True)
+        cube[f"{role}_ids"] = ids
+        cube[f"{role}_rows"] = rows.astype(np.int32)
+        cube[f"{role}_codes"] = np.column_stack([cells.index.get_level_values(d) for d in dims]).astype(np.uint8)
+        cube[f"{role}_counts"] = cells.to_numpy(dtype=np.int32)
+    return cube
+
+
+def save_split_cube(cube, path=CUBE_FILE):
+    write_npz(path, cube)
+
+
+def load_split_cube(path=CUBE_FILE):
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
+
+
+# ---------- SLICING ----------
+def _mask(cube, role, filters):
+    # filters: {dimension: [labels to keep]}; a missing dimension keeps everything
+    codes = cube[f"{role}_codes"]
+    mask = np.ones(len(codes), dtype=bool)
+    for i, dim in enumerate(DIMENSIONS):
+        keep = filters.get(dim)
+        if keep is None:
+            continue
+        wanted = np.isin(cube[f"labels_{dim}"], keep)
+        mask &= wanted[codes[:, i]]
+    return mask
+
+
+def _with_rates(totals):
+    seen = totals["total_fp"].where(totals["total_fp"] > 0)
+    totals["in_play_pct"] = (totals["in_play"] / seen).round(3)
+    totals["swing_pct"] = (totals["swings"] / seen).round(3)
+    totals["ball_pct"] = (totals["balls"] / seen).round(3)
+    totals["strike_look_pct"] = (totals["called_strikes"] / seen).round(3)
+    return totals
+
+
+def slice_players(cube, role, filters=None):
+    # Per-player totals over the selected split cells
+    mask = _mask(cube, role, filters or {})
+    rows = cube[f"{role}_rows"][mask]
+    counts = cube[f"{role}_counts"][mask]
+    n = len(cube[f"{role}_ids"])
+
+    totals = np.column_stack([np.bincount(rows, weights=counts[:, j], minlength=n) for j in range(counts.shape[1])])
+    totals = pd.DataFrame(totals.astype(np.int64), columns=cube["columns"], index=pd.Index(cube[f"{role}_ids"], name="player_id"))
+    return _with_rates(totals[totals["total_fp"] > 0]).reset_index()
+
+
+def split_breakdown(cube, role, dimension, filters=None, player_ids=None):
+    # Totals by one dimension's labels, optionally for specific players only
+    mask = _mask(cube, role, filters or {})
+    if player_ids is not None:
+        mask &= np.isin(cube[f"{role}_ids"], player_ids)[cube[f"{role}_rows"]]
+
+    labels = cube[f"labels_{dimension}"]
+    codes = cube[f"{role}_codes"][mask, list(DIMENSIONS).index(dimension)]
+    counts = cube[f"{role}_counts"][mask]
+
+    totals = np.column_stack([np.bincount(codes, weights=counts[:, j], minlength=len(labels)) for j in range(counts.shape[1])])
+    totals = pd.DataFrame(totals.astype(np.int64), columns=cube["columns"], index=pd.Index(labels, name=dimension))
+    return _with_rates(totals).reset_index()
+
+
+if __name__ == "__main__":
+    df = pd.read_csv(INPUT_FILE)
+    cube = build_split_cube(df)
+    save_split_cube(cube)
+    print(f"✅ Saved split cube ({len(cube['batter_rows'])} batter cells, {len(cube['pitcher_rows'])} pitcher cells) to {CUBE_FILE}")
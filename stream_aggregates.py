@@ -0,0 +1,212 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from pitch_store import list_partitions
+
+HIT_EVENTS = ["single", "double", "triple", "home_run"]
+XBH_EVENTS = ["double", "triple", "home_run"]
+SWING_DESCRIPTIONS = ["foul", "swinging_strike", "swinging_strike_blocked", "hit_into_play"]
+
+# Only the columns the aggregates need are parsed from each chunk
+AGG_COLUMNS = [
+    "pitch_number", "batter", "pitcher", "pitch_type", "description",
+    "events", "estimated_ba_using_speedangle", "home_team", "game_date",
+]
+
+SUM_COLUMNS = [
+    "total_fp", "balls", "called_strikes", "swinging_strikes", "fouls",
+    "in_play", "swings", "singles", "xbh", "hits", "xba_sum", "xba_n",
+]
+
+DEFAULT_MEMORY_LIMIT_MB = 512
+
+
+# ---------- PARTIAL AGGREGATES ----------
+def outcome_counts(df):
+    # Every outcome becomes a 0/1 column so partials merge with a plain sum
+    desc = df["description"]
+    events = df["events"]
+    xba = pd.to_numeric(df["estimated_ba_using_speedangle"], errors="coerce")
+
+    return pd.DataFrame({
+        "total_fp": df["pitch_type"].notna(),
+        "balls": desc == "ball",
+        "called_strikes": desc == "called_strike",
+        "swinging_strikes": desc == "swinging_strike",
+        "fouls": desc == "foul",
+        "in_play": desc == "hit_into_play",
+        "swings": desc.isin(SWING_DESCRIPTIONS),
+        "singles": events == "single",
+        "xbh": events.isin(XBH_EVENTS),
+        "hits": events.isin(HIT_EVENTS),
+        "xba_sum": xba.fillna(0.0),
+        "xba_n": xba.notna(),
+    }, index=df.index).astype({c: "int64" for c in SUM_COLUMNS if c != "xba_sum"})
+
+
+def partial_aggregates(df):
+    df = df[df["pitch_number"] == 1]
+    counts = outcome_counts(df)
+
+    batters = counts.groupby(df["batter"]).sum()
+    pitchers = counts.groupby(df["pitcher"]).sum()
+
+    # Home team of each pitcher's latest game (ties by name), so the answer doesn't
+    # depend on row order and chunks, partitions and the in-memory path agree
+    teams = df.dropna(subset=["home_team"])
+    teams = teams.assign(team_date=pd.to_datetime(teams["game_date"], errors="coerce") if "game_date" in teams else pd.NaT)
+    latest = _latest_team(teams.rename(columns={"home_team": "Team"}).set_index("pitcher"))
+    pitchers["Team"] = latest["Team"].reindex(pitchers.index)
+    pitchers["team_date"] = latest["team_date"].reindex(pitchers.index)
+    return batters, pitchers
+
+
+def _latest_team(rows):
+    # One row per pitcher (index): the newest team_date, then the first Team alphabetically
+    rows = rows[["Team", "team_date"]].rename_axis("pitcher").reset_index()
+    rows = rows.sort_values(["team_date", "Team"], ascending=[False, True], na_position="last")
+    return rows.drop_duplicates("pitcher").set_index("pitcher")
+
+
+def merge_partials(partials):
+    partials = list(partials)
+    if not partials:
+        empty = pd.DataFrame(columns=SUM_COLUMNS)
+        return empty, empty.assign(Team=pd.Series(dtype=object), team_date=pd.Series(dtype="datetime64[ns]"))
+
+    batters = pd.concat([b for b, _ in partials])
+    pitchers = pd.concat([p for _, p in partials])
+
+    batter_sums = batters.groupby(level=0)[SUM_COLUMNS].sum()
+    pitcher_sums = pitchers.groupby(level=0)[SUM_COLUMNS].sum()
+    latest = _latest_team(pitchers)
+    pitcher_sums["Team"] = latest["Team"].reindex(pitcher_sums.index)
+    pitcher_sums["team_date"] = latest["team_date"].reindex(pitcher_sums.index)
+    return batter_sums, pitcher_sums
+
+
+def aggregate_first_pitches(df):
+    # In-memory path: the whole frame is a single partial
+    return merge_partials([partial_aggregates(df)])
+
+
+# ---------- STREAMING PATH ----------
+def _wanted_column(col):
+    return col in AGG_COLUMNS
+
+
+def rows_per_chunk(path, memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB, workers=1):
+    sample = pd.read_csv(path, usecols=_wanted_column, nrows=1000)
+    if sample.empty:
+        return 1000
+    row_bytes = sample.memory_usage(deep=True).sum() / len(sample)
+
+    # Each worker holds one parsed chunk plus its outcome frame and groupby buffers
+    budget = memory_limit_mb * 1024 ** 2 / (max(workers, 1) * 4)
+    return max(int(budget // row_bytes), 1000)
+
+
+def aggregate_partition(path, chunksize):
+    partials = []
+    for chunk in pd.read_csv(path, usecols=_wanted_column, chunksize=chunksize):
+        partials.append(partial_aggregates(chunk))
+    return merge_partials(partials)
+
+
+def stream_aggregate(paths=None, memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB, workers=1):
+    paths = list_partitions() if paths is None else list(paths)
+    if not paths:
+        return merge_partials([])
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths)))
+    chunksize = min(rows_per_chunk(p, memory_limit_mb, workers) for p in paths)
+
+    if workers == 1:
+        partials = [aggregate_partition(p, chunksize) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(aggregate_partition, paths, [chunksize] * len(paths)))
+
+    return merge_partials(partials)
+
+
+# ---------- FINAL TABLES ----------
+def batter_table(batter_sums, id_to_name):
+    # Same columns as the Trend Explorer batter view, grouped by lowercased name
+    names = pd.Series(batter_sums.index, index=batter_sums.index).map(id_to_name).str.lower()
+    grouped = batter_sums.groupby(names).sum()
+    grouped.index.name = "batter_name"
+
+    grouped = grouped.rename(columns={"called_strikes": "strikes_looking"})
+    grouped["in_play_pct"] = (grouped["in_play"] / grouped["total_fp"]).round(3)
+    grouped["swing_pct"] = (grouped["swings"] / grouped["total_fp"]).round(3)
+    grouped["strike_look_pct"] = (grouped["strikes_looking"] / grouped["total_fp"]).round(3)
+    return grouped.reset_index()
+
+
+def pitcher_table(pitcher_sums):
+    # Same columns as first_pitch_data_2025_cleaned.csv, keyed by player_id
+    s = pitcher_sums
+    total = s["total_fp"]
+    grouped = pd.DataFrame({
+        "First Pitch Total": total,
+        "First Pitch In-Play #": s["in_play"],
+        "First Pitch Ball #": s["balls"],
+        "First Pitch Called Strike #": s["called_strikes"],
+        "First Pitch Swinging Strike #": s["swinging_strikes"],
+        "First Pitch Foul #": s["fouls"],
+        "First Pitch Hit #": s["hits"],
+        "First Pitch xBA": (s["xba_sum"] / s["xba_n"].replace(0, np.nan)).round(3),
+    })
+
+    grouped["First Pitch In-Play %"] = (grouped["First Pitch In-Play #"] / total).round(3)
+    grouped["First Pitch Ball %"] = (grouped["First Pitch Ball #"] / total).round(3)
+    grouped["First Pitch Strike %"] = (
+        (
+            grouped["First Pitch Called Strike #"] +
+            grouped["First Pitch Swinging Strike #"] +
+            grouped["First Pitch Foul #"]
+        ) / total
+    ).round(3)
+    grouped["Team"] = s["Team"]
+
+    grouped.index.name = "player_id"
+    return grouped.reset_index()
+
+
+PITCHER_COUNT_COLUMNS = [
+    "First Pitch Total", "First Pitch In-Play #", "First Pitch Ball #", "First Pitch Called Strike #",
+    "First Pitch Swinging Strike #", "First Pitch Foul #", "First Pitch Hit #",
+]
+
+
+def add_pitcher_counts(table, extra):
+    # Adds another pitcher_table's counts (e.g. today's provisional rows) and
+    # recomputes the rates; xBA stays as the base table's since extra rows have none
+    table = table.set_index("player_id")
+    extra = extra.set_index("player_id")
+    counts = table[PITCHER_COUNT_COLUMNS].add(extra[PITCHER_COUNT_COLUMNS], fill_value=0).astype("int64")
+
+    combined = table.reindex(counts.index)
+    combined[PITCHER_COUNT_COLUMNS] = counts
+    combined["Team"] = combined["Team"].fillna(extra["Team"].reindex(counts.index))
+
+    total = combined["First Pitch Total"]
+    combined["First Pitch In-Play %"] = (combined["First Pitch In-Play #"] / total).round(3)
+    combined["First Pitch Ball %"] = (combined["First Pitch Ball #"] / total).round(3)
+    combined["First Pitch Strike %"] = (
+        (
+            combined["First Pitch Called Strike #"] +
+            combined["First Pitch Swinging Strike #"] +
+            combined["First Pitch Foul #"]
+        ) / total
+    ).round(3)
+    return combined.reset_index()
+
+
+if __name__ == "__main__":
+    paths = list_partitions()
+    print(f"📦 Streaming {len(paths)} pitch store partitions...")
+    batter_sums, pitcher_sums = stream_aggregate(paths, workers=os.cpu_count())
+    print(f"✅ Aggregated {len(batter_sums)} batters and {len(pitcher_sums)} pitchers")
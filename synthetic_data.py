@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+from datetime import date
+
+# Rough size of one regular season
+SEASON_GAMES = 2430
+SEASON_DAYS = 186
+PAS_PER_HALF_INNING = 4
+BATTERS = 650
+PITCHERS = 780
+LOG_ROWS_PER_SEASON = 22000
+
+TEAMS = [
+    "ATH", "ATL", "AZ", "BAL", "BOS", "CHC", "CIN", "CLE", "COL", "CWS",
+    "DET", "HOU", "KC", "LAA", "LAD", "MIA", "MIL", "MIN", "NYM", "NYY",
+    "PHI", "PIT", "SD", "SEA", "SF", "STL", "TB", "TEX", "TOR", "WSH",
+]
+
+PITCH_TYPES = ["FF", "SI", "SL", "CH", "CU", "FC", "ST", "FS"]
+DESCRIPTIONS = ["ball", "called_strike", "foul", "swinging_strike", "hit_into_play", "swinging_strike_blocked"]
+DESCRIPTION_P = [0.37, 0.30, 0.14, 0.06, 0.12, 0.01]
+IN_PLAY_EVENTS = ["field_out", "single", "double", "triple", "home_run", "force_out", "grounded_into_double_play", "sac_fly"]
+IN_PLAY_P = [0.60, 0.22, 0.07, 0.005, 0.045, 0.02, 0.025, 0.015]
+
+
+def _season_dates(rng, n, end_date):
+    end_date = pd.Timestamp(end_date or date.today())
+    offsets = rng.integers(0, SEASON_DAYS, n)
+    return end_date - pd.to_timedelta(offsets, "D")
+
+
+def generate_pitches(scale=1, seed=0, end_date=None, first_pitch_only=False):
+    # Statcast-shaped pitch rows; `events` is only set on the last pitch of each PA
+    rng = np.random.default_rng(seed)
+    games = int(SEASON_GAMES * scale)
+    n_pa = games * 18 * PAS_PER_HALF_INNING
+
+    game_idx = rng.integers(0, games, n_pa)
+    game_dates = _season_dates(rng, games, end_date)
+    home = rng.integers(0, len(TEAMS), games)
+    away = (home + rng.integers(1, len(TEAMS), games)) % len(TEAMS)
+
+    pa = pd.DataFrame({
+        "game_pk": 700000 + game_idx,
+        "game_date": game_dates[game_idx].strftime("%Y-%m-%d"),
+        "batter": rng.integers(600000, 600000 + BATTERS, n_pa),
+        "pitcher": rng.integers(500000, 500000 + PITCHERS, n_pa),
+        "inning": rng.integers(1, 10, n_pa),
+        "inning_topbot": np.where(rng.random(n_pa) < 0.5, "Top", "Bot"),
+        "home_team": np.array(TEAMS)[home[game_idx]],
+        "away_team": np.array(TEAMS)[away[game_idx]],
+        "stand": np.where(rng.random(n_pa) < 0.42, "L", "R"),
+        "p_throws": np.where(rng.random(n_pa) < 0.28, "L", "R"),
+        "outs_when_up": rng.integers(0, 3, n_pa),
+        "n_thruorder_pitcher": rng.integers(1, 4, n_pa),
+        "pitches": 1 if first_pitch_only else rng.integers(1, 8, n_pa),
+    })
+    pa = pa.sort_values(["game_pk", "inning", "inning_topbot"], kind="stable").reset_index(drop=True)
+    pa["at_bat_number"] = pa.groupby("game_pk").cumcount() + 1
+    pa["player_name"] = "Pitcher, " + (pa["pitcher"] % 1000).astype(str)
+
+    df = pa.loc[pa.index.repeat(pa["pitches"])].reset_index(drop=True)
+    df["pitch_number"] = df.groupby(["game_pk", "at_bat_number"]).cumcount() + 1
+    last = df["pitch_number"] == df["pitches"]
+    n = len(df)
+
+    df["description"] = rng.choice(DESCRIPTIONS, n, p=DESCRIPTION_P)
+    df.loc[last & (rng.random(n) < 0.55), "description"] = "hit_into_play"
+    df.loc[~last & (df["description"] == "hit_into_play"), "description"] = "foul"
+    df["events"] = np.where(last, np.where(df["description"] == "ball", "walk", "strikeout"), None)
+    in_play = last & (df["description"] == "hit_into_play")
+    df.loc[in_play, "events"] = rng.choice(IN_PLAY_EVENTS, int(in_play.sum()), p=IN_PLAY_P)
+    df["estimated_ba_using_speedangle"] = np.where(in_play, rng.random(n).round(3), np.nan)
+
+    df["pitch_type"] = rng.choice(PITCH_TYPES, n)
+    df["balls"] = np.minimum(df["pitch_number"] - 1, 3) * (rng.random(n) < 0.5)
+    df["strikes"] = np.minimum(df["pitch_number"] - 1 - df["balls"], 2).clip(lower=0)
+    df["plate_x"] = rng.normal(0, 0.8, n).round(2)
+    df["plate_z"] = rng.normal(2.4, 0.9, n).round(2)
+    df["zone"] = rng.choice([1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14], n)
+    return df.drop(columns="pitches")
+
+
+def generate_fp_logs(scale=1, seed=0, end_date=None):
+    # Same columns as mlb_fp_logs.csv
+    rng = np.random.default_rng(seed)
+    n = int(LOG_ROWS_PER_SEASON * scale)
+    players = np.array([f"Player, {i}" for i in range(PITCHERS)])
+
+    swing = rng.random(n) < 0.3
+    in_play = swing & (rng.random(n) < 0.4)
+    outcome = rng.random(n)
+    single = in_play & (outcome < 0.22)
+    double = in_play & (outcome >= 0.22) & (outcome < 0.29)
+    home_run = in_play & (outcome >= 0.29) & (outcome < 0.335)
+
+    return pd.DataFrame({
+        "Player": players[rng.integers(0, PITCHERS, n)],
+        "Date": _season_dates(rng, n, end_date).strftime("%Y-%m-%d"),
+        "First_Pitch_Swing": swing,
+        "First_Pitch_InPlay": in_play,
+        "Single": single,
+        "Double": double,
+        "HomeRun": home_run,
+        "XBH": double | home_run,
+        "xBA": rng.random(n).round(3),
+        "BatterHand": np.where(rng.random(n) < 0.42, "L", "R"),
+    })
+
+
+def generate_name_lookup():
+    ids = np.arange(600000, 600000 + BATTERS)
+    return pd.DataFrame({"key_mlbam": ids, "full_name": [f"batter {i}" for i in ids]})
+
+
+def generate_game_feed(game_pk=1, start="2025-07-01T23:05:00Z", seed=0):
+    # Live-feed-shaped allPlays for one game with pitch timestamps, for replaying pollers
+    rng = np.random.default_rng(seed)
+    t = pd.Timestamp(start)
+    plays = []
+    score = {"top": 0, "bottom": 0}
+
+    for inning in range(1, 10):
+        for half in ("top", "bottom"):
+            outs = 0
+            while outs < 3:
+                balls = strikes = 0
+                events = []
+                while True:
+                    t += pd.Timedelta(seconds=float(rng.uniform(14, 28)))
+                    events.append({
+                        "isPitch": True,
+                        "startTime": t.isoformat(),
+                        "count": {"balls": balls, "strikes": strikes, "outs": outs},
+                    })
+                    roll = rng.random()
+                    if roll < 0.36:
+                        balls += 1
+                        if balls == 4:
+                            out = False
+                            break
+                    elif roll < 0.80:
+                        # The top of this band is fouls, which can't be strike three
+                        strikes = min(strikes + 1, 2) if roll > 0.70 else strikes + 1
+                        if strikes == 3:
+                            out = True
+                            break
+                    else:
+                        out = rng.random() < 0.68
+                        break
+
+                outs += out
+                if not out and rng.random() < 0.35:
+                    score[half] += 1
+                t += pd.Timedelta(seconds=float(rng.uniform(5, 15)))
+                plays.append({
+                    "about": {"inning": inning, "halfInning": half, "startTime": events[0]["startTime"], "endTime": t.isoformat()},
+                    "count": {"balls": min(balls, 3), "strikes": min(strikes, 2), "outs": outs},
+                    "result": {"awayScore": score["top"], "homeScore": score["bottom"]},
+                    "playEvents": events,
+                })
+            # Commercial break between halves
+            t += pd.Timedelta(seconds=float(rng.uniform(130, 170)))
+
+    return {"gamePk": game_pk, "liveData": {"plays": {"allPlays": plays}}}
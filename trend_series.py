@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+from dataset_store import write_npz
+from stream_aggregates import outcome_counts
+
+SERIES_FILE = "data/trend_series_2025.npz"
+INPUT_FILE = "first_pitch_data_2025.csv"
+SERIES_COLUMNS = ["total_fp", "swings", "in_play", "hits", "balls"]
+ROLES = ["batter", "pitcher"]
+
+# Per player, cum[d] holds the counts for every day before dates[d], so any
+# date range is a single subtraction: cum[end + 1] - cum[start].
+
+
+def _cumulative(counts, keys, day, n_days):
+    ids, row = np.unique(keys, return_inverse=True)
+    daily = np.zeros((len(ids), n_days + 1, len(SERIES_COLUMNS)), dtype=np.int32)
+    np.add.at(daily, (row, day + 1), counts)
+    return ids, np.cumsum(daily, axis=1, dtype=np.int32)
+
+
+def build_series_index(df):
+    df = df[df["pitch_number"] == 1].dropna(subset=["game_date", "batter", "pitcher"])
+    dates = pd.to_datetime(df["game_date"]).to_numpy().astype("datetime64[D]")
+    first, last = dates.min(), dates.max()
+    day = (dates - first).astype(np.int64)
+    n_days = int((last - first).astype(np.int64)) + 1
+
+    counts = outcome_counts(df)[SERIES_COLUMNS].to_numpy(dtype=np.int32)
+
+    index = {
+        "dates": np.arange(first, last + 1),
+        "columns": np.array(SERIES_COLUMNS),
+    }
+    for role in ROLES:
+        keys = df[role].astype(np.int64).to_numpy()
+        index[f"{role}_ids"], index[f"{role}_cum"] = _cumulative(counts, keys, day, n_days)
+    return index
+
+
+def save_series_index(index, path=SERIES_FILE):
+    write_npz(path, index)
+
+
+def load_series_index(path=SERIES_FILE):
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
+
+
+# ---------- QUERIES ----------
+def _day(index, when):
+    # Position of a date in the series, clipped to the indexed range
+    when = np.datetime64(pd.Timestamp(when).date(), "D")
+    return int(np.clip((when - index["dates"][0]).astype(np.int64), 0, len(index["dates"]) - 1))
+
+
+def window_totals(index, role, start, end):
+    # Counts for every player between two dates (inclusive)
+    cum = index[f"{role}_cum"]
+    totals = cum[:, _day(index, end) + 1] - cum[:, _day(index, start)]
+    return pd.DataFrame(totals, index=pd.Index(index[f"{role}_ids"], name=role), columns=index["columns"])
+
+
+def player_cumulative(index, role, player_ids):
+    # Summed rows for the ids behind one name (a player can have more than one)
+    ids = index[f"{role}_ids"]
+    rows = np.searchsorted(ids, player_ids)
+    rows = rows[(rows < len(ids)) & (ids[np.minimum(rows, len(ids) - 1)] == player_ids)]
+    if len(rows) == 0:
+        return None
+    return index[f"{role}_cum"][rows].sum(axis=0)
+
+
+def rolling_rates(index, role, player_ids, window):
+    # Trailing `window`-day counts and rates for each day in the series
+    cum = player_cumulative(index, role, np.atleast_1d(player_ids))
+    if cum is None:
+        return pd.DataFrame()
+
+    end = np.arange(1, cum.shape[0])
+    totals = cum[end] - cum[np.maximum(end - window, 0)]
+    rolled = pd.DataFrame(totals, index=pd.DatetimeIndex(index["dates"], name="date"), columns=index["columns"])
+
+    seen = rolled["total_fp"].where(rolled["total_fp"] > 0)
+    rolled["In-Play %"] = (rolled["in_play"] / seen * 100).round(1)
+    rolled["Swing %"] = (rolled["swings"] / seen * 100).round(1)
+    rolled["Ball %"] = (rolled["balls"] / seen * 100).round(1)
+    return rolled
+
+
+if __name__ == "__main__":
+    df = pd.read_csv(INPUT_FILE)
+    index = build_series_index(df)
+    save_series_index(index)
+    print(f"✅ Saved daily trend series for {len(index['batter_ids'])} batters and "
+          f"{len(index['pitcher_ids'])} pitchers over {len(index['dates'])} days to {SERIES_FILE}")
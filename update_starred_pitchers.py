@@ -1,28 +1,7 @@
-import requests
-from bs4 import BeautifulSoup
-import json
-import os
+from slate_loader import load_slate, PROJECTED_FILE
 
-# URL of MLB probable pitchers page
-url = "https://www.mlb.com/probable-pitchers"
+# Probable pitchers come from one hydrated schedule request (no HTML scraping)
+games, lineups = load_slate()
 
-# Get the page
-response = requests.get(url)
-soup = BeautifulSoup(response.content, "html.parser")
-
-# New selector based on your screenshot
-pitcher_tags = soup.find_all("a", class_="probable-pitchers__pitcher-name-link")
-
-pitchers_today = set()
-
-for tag in pitcher_tags:
-    name = tag.get_text(strip=True)
-    if name:
-        pitchers_today.add(name.lower())  # Normalize
-
-# Save to JSON
-os.makedirs("data", exist_ok=True)
-with open("data/projected_pitchers_today.json", "w") as f:
-    json.dump(sorted(pitchers_today), f)
-
-print(f"Saved {len(pitchers_today)} projected pitchers for today.")
+pitchers_today = {g[f"{side}_pitcher"] for g in games for side in ("away", "home")} - {""}
+print(f"Saved {len(pitchers_today)} projected pitchers for today to {PROJECTED_FILE}.")
@@ -1,24 +1,70 @@
 
 import pandas as pd
 from pybaseball import statcast
+from pitch_store import list_partitions, iter_pitch_store
 from datetime import datetime
-
-def fetch_and_process_statcast(start, end):
+from pa_table import build_pa_table, save_pa_table, PA_TABLE_FILE
+from pitch_location_profiles import build_location_profiles, save_location_profiles, PROFILE_FILE
+from trend_series import build_series_index, save_series_index, SERIES_FILE
+from split_cube import build_split_cube, save_split_cube, CUBE_FILE
+from leadoff_dataset import leadoff_mask, LEADOFF_HITTERS_FILE, LEADOFF_PITCHERS_FILE
+from clean_pitcher_data import build_leadoff_pitchers
+from dataset_store import write_csv
+from count_transitions import build_count_transitions, merge_count_transitions, save_count_transitions, TRANSITIONS_FILE
+
+def pitch_level_tables(start, end):
+    # The two builders that need every pitch: the PA table and the count
+    # transitions. The pitch store is streamed one month at a time, so only
+    # the (much smaller) PA table is ever season-sized in memory.
+    if list_partitions():
+        print("📦 Streaming pitches from the pitch store...")
+        pa_parts, transition_parts, pitches = [], [], 0
+        for part in iter_pitch_store(start, end):
+            pitches += len(part)
+            pa_parts.append(build_pa_table(part))
+            transition_parts.append(build_count_transitions(part))
+        if pa_parts:
+            print(f"✅ Streamed {pitches} rows of data from {len(pa_parts)} partitions.")
+            return pd.concat(pa_parts, ignore_index=True), merge_count_transitions(transition_parts)
+
+    # No store yet: the Statcast pull is one frame anyway
     print("⏳ Fetching Statcast data (MLB only)...")
     df = statcast(start_dt=start, end_dt=end)
     print(f"✅ Pulled {len(df)} rows of data.")
+    return build_pa_table(df), build_count_transitions(df)
+
+
+def fetch_and_process_statcast(start, end):
+    # One row per PA: first pitch plus how the PA ended
+    pa, transitions = pitch_level_tables(start, end)
+    save_pa_table(pa)
+    print(f"✅ Saved {len(pa)} plate appearances to {PA_TABLE_FILE}")
+
+    # Per-pitcher first-pitch heatmaps and pitch mix for the drilldown; the PA
+    # table's rows are exactly the first pitches these are built from
+    profiles = build_location_profiles(pa)
+    save_location_profiles(profiles)
+    print(f"✅ Saved location profiles for {len(profiles['pitcher_ids'])} pitchers to {PROFILE_FILE}")
 
-    # Only include 1st pitch of each at-bat
-    df_fp = df[df["pitch_number"] == 1].copy()
+    # Count -> outcome matrices keep what every pitch after the first says
+    save_count_transitions(transitions)
+    print(f"✅ Saved count transitions for {len(transitions['batter_ids'])} batters to {TRANSITIONS_FILE}")
+
+    # Split cube over hand, venue, month, inning and times through the order
+    cube = build_split_cube(pa)
+    save_split_cube(cube)
+    print(f"✅ Saved first-pitch split cube to {CUBE_FILE}")
+
+    # Every PA has a first pitch, not just the ones that ended on it
+    df_fp = pa.copy()
 
     # Only include real hitters (exclude pitchers)
     df_fp = df_fp[df_fp["stand"].isin(["R", "L"])]
-    df_fp = df_fp[df_fp["events"].notna()]
 
     # Clean up missing values
     df_fp["events"] = df_fp["events"].fillna("")
 
-    # Add result columns
+    # Add result columns (events here is only set when the PA ended on the first pitch)
     df_fp["First_Pitch_Swing"] = df_fp["description"].isin(["swinging_strike", "foul", "hit_into_play"])
     df_fp["First_Pitch_InPlay"] = df_fp["description"] == "hit_into_play"
     df_fp["Single"] = df_fp["events"] == "single"
@@ -27,10 +73,7 @@ def fetch_and_process_statcast(start, end):
     df_fp["XBH"] = df_fp["Double"] | df_fp["HomeRun"]
 
     # Infer team using inning_topbot
-    df_fp["Team"] = df_fp.apply(
-        lambda row: row["away_team"] if row["inning_topbot"] == "Top" else row["home_team"],
-        axis=1
-    )
+    df_fp["Team"] = df_fp["away_team"].where(df_fp["inning_topbot"] == "Top", df_fp["home_team"])
 
     # Save most recent team for each player
     df_fp["game_date"] = pd.to_datetime(df_fp["game_date"])
@@ -70,16 +113,33 @@ def fetch_and_process_statcast(start, end):
     }, inplace=True)
 
     # Save raw first pitch data for Hot Hitters
-    df_fp.to_csv("first_pitch_data_2025.csv", index=False)
+    write_csv(df_fp, "first_pitch_data_2025.csv")
     print("✅ Saved full first-pitch PAs to first_pitch_data_2025.csv")
 
+    # Hitters-only copy read by the hot hitter lists and slate scoring
+    hitters = df_fp[~df_fp["player_name"].str.contains(" P$", na=False)]
+    write_csv(hitters, "first_pitch_hitters_2025.csv")
+    print("✅ Saved hitters-only first pitches to first_pitch_hitters_2025.csv")
+
+    # Leadoff-only view: the first PA of every half inning, found on the full
+    # PA table so a filtered-out PA can't promote the next hitter to leadoff
+    leadoff = leadoff_mask(pa)
+    write_csv(hitters[leadoff[pa.index.get_indexer(hitters.index)]], LEADOFF_HITTERS_FILE)
+    leadoff_pitchers = build_leadoff_pitchers(pa[leadoff])
+    print(f"✅ Saved {int(leadoff.sum())} leadoff PAs to {LEADOFF_HITTERS_FILE} and {len(leadoff_pitchers)} pitchers to {LEADOFF_PITCHERS_FILE}")
+
+    # Daily cumulative counts so any rolling window is a single subtraction
+    series = build_series_index(df_fp)
+    save_series_index(series)
+    print(f"✅ Saved daily trend series to {SERIES_FILE}")
+
     return summary
 
 def main():
     start = "2025-03-20"
     end = datetime.today().strftime("%Y-%m-%d")
     summary_df = fetch_and_process_statcast(start, end)
-    summary_df.to_csv("mlb_fp_stats.csv", index=False)
+    write_csv(summary_df, "mlb_fp_stats.csv")
     print("✅ Saved hitter-first-pitch stats to mlb_fp_stats.csv")
 
 if __name__ == "__main__":